@@ -0,0 +1,92 @@
+"""Tests for C++ cross-file call graph support.
+
+C++ is resolved through tree-sitter-cpp the same way C is: functions are
+indexed by name and call sites are matched against that index.
+"""
+
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("tree_sitter_cpp")
+
+
+def _write(root: Path, rel_path: str, content: str) -> None:
+    path = root / rel_path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+class TestCppFunctionIndex:
+    """Tests for indexing C++ definitions."""
+
+    def test_indexes_free_functions_and_methods(self, tmp_path):
+        """Should index free functions, out-of-line and inline methods."""
+        from tldr.cross_file_calls import build_function_index
+
+        _write(tmp_path, "shapes.cpp", """
+namespace geo {
+int area(int w, int h) { return w * h; }
+}
+
+class Square {
+public:
+    int side() const { return s; }
+    int perimeter() const;
+private:
+    int s;
+};
+
+int Square::perimeter() const { return 4 * side(); }
+
+const int& pick(const int& a) { return a; }
+""")
+
+        index = build_function_index(tmp_path, "cpp", None)
+
+        for name in ("area", "side", "perimeter", "pick"):
+            assert index[("shapes", name)] == "shapes.cpp"
+
+
+class TestCppCallGraph:
+    """Tests for building the C++ project call graph."""
+
+    def test_intra_and_cross_file_calls(self, tmp_path):
+        """Should resolve local, qualified and template calls across files."""
+        from tldr.cross_file_calls import build_project_call_graph
+
+        _write(tmp_path, "util.cpp", """
+namespace util {
+int clamp(int v) { return v < 0 ? 0 : v; }
+template <typename T> T twice(T v) { return v + v; }
+}
+""")
+        _write(tmp_path, "main.cpp", """
+#include "util.hpp"
+
+static int helper(int x) { return util::clamp(x); }
+
+int main() {
+    int y = helper(3);
+    return util::twice<int>(y);
+}
+""")
+
+        graph = build_project_call_graph(tmp_path, language="cpp", use_workspace_config=False)
+
+        assert ("main.cpp", "main", "main.cpp", "helper") in graph.edges
+        assert ("main.cpp", "helper", "util.cpp", "clamp") in graph.edges
+        assert ("main.cpp", "main", "util.cpp", "twice") in graph.edges
+
+    def test_member_calls_through_objects_are_not_resolved(self, tmp_path):
+        """obj.f() calls can't be resolved by name alone and are skipped."""
+        from tldr.cross_file_calls import build_project_call_graph
+
+        _write(tmp_path, "a.cpp", """
+struct Counter { void bump() {} };
+void run() { Counter c; c.bump(); }
+""")
+
+        graph = build_project_call_graph(tmp_path, language="cpp", use_workspace_config=False)
+
+        assert ("a.cpp", "run", "a.cpp", "bump") not in graph.edges
@@ -0,0 +1,104 @@
+"""Tests for the daemon's reverse import index.
+
+ImporterIndex must return what cached_importers' full scan does, and stay
+correct as files are modified, added and deleted.
+"""
+
+from pathlib import Path
+
+from tldr.daemon.cached_queries import cached_importers
+from tldr.daemon.importer_index import ImporterIndex
+from tldr.salsa import SalsaDB
+
+
+def _write(root: Path, rel_path: str, content: str) -> None:
+    path = root / rel_path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+def _project(root: Path) -> None:
+    _write(root, "a.py", "import os\nfrom pkg.util import helper\n")
+    _write(root, "b.py", "from pkg import util\n")
+    _write(root, "pkg/__init__.py", "")
+    _write(root, "pkg/util.py", "import sys\n\n\ndef helper():\n    pass\n")
+
+
+def _scan(root: Path, module: str) -> list[dict]:
+    return cached_importers(SalsaDB(), str(root), module, "python")["importers"]
+
+
+def _by_file(results: list[dict]) -> list[dict]:
+    return sorted(results, key=lambda r: (r["file"], r["import"].get("module", "")))
+
+
+class TestImporterIndex:
+    """Tests for ImporterIndex lookups and invalidation."""
+
+    def test_matches_full_scan(self, tmp_path):
+        """Lookups should return exactly what the full scan returns."""
+        _project(tmp_path)
+        index = ImporterIndex(str(tmp_path), "python")
+
+        for module in ("os", "sys", "pkg", "util", "helper", "pkg.util", "missing"):
+            assert index.importers(module) == _scan(tmp_path, module)
+
+    def test_modified_file(self, tmp_path):
+        """A changed file's imports should replace its old ones."""
+        _project(tmp_path)
+        index = ImporterIndex(str(tmp_path), "python")
+        assert [r["file"] for r in index.importers("os")] == ["a.py"]
+
+        _write(tmp_path, "a.py", "import json\nfrom pkg.util import helper\n")
+        index.mark_changed("a.py")
+
+        assert index.importers("os") == []
+        assert index.importers("json") == _scan(tmp_path, "json")
+        assert index.importers("helper") == _scan(tmp_path, "helper")
+
+    def test_added_file(self, tmp_path):
+        """A new file should be indexed once notified."""
+        _project(tmp_path)
+        index = ImporterIndex(str(tmp_path), "python")
+        index.importers("os")
+
+        _write(tmp_path, "pkg/c.py", "import os\n")
+        index.mark_changed(str(tmp_path / "pkg" / "c.py"))
+
+        assert _by_file(index.importers("os")) == _by_file(_scan(tmp_path, "os"))
+        assert index.importers("os")[-1]["file"] == str(Path("pkg", "c.py"))
+
+    def test_deleted_file(self, tmp_path):
+        """A deleted file should drop out of every lookup."""
+        _project(tmp_path)
+        index = ImporterIndex(str(tmp_path), "python")
+        index.importers("pkg")
+
+        (tmp_path / "a.py").unlink()
+        index.mark_changed("a.py")
+
+        for module in ("os", "pkg", "helper"):
+            assert index.importers(module) == _scan(tmp_path, module)
+
+    def test_relative_notify_path(self, tmp_path):
+        """Relative and absolute notify paths should name the same file."""
+        _project(tmp_path)
+        index = ImporterIndex(str(tmp_path), "python")
+        index.importers("sys")
+
+        _write(tmp_path, "pkg/util.py", "import re\n")
+        index.mark_changed("pkg/util.py")
+
+        assert index.importers("sys") == []
+        assert [r["file"] for r in index.importers("re")] == [str(Path("pkg", "util.py"))]
+
+    def test_results_are_copies(self, tmp_path):
+        """Changing a returned import should not change the index."""
+        _project(tmp_path)
+        index = ImporterIndex(str(tmp_path), "python")
+
+        result = index.importers("helper")
+        result[0]["import"]["names"].append("injected")
+        result[0]["import"]["module"] = "changed"
+
+        assert index.importers("helper") == _scan(tmp_path, "helper")
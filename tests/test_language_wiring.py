@@ -325,6 +325,7 @@ When adding a new language to tldr-code, ensure it's registered in:
 6. hybrid_extractor.py
    - Add to _detect_language() ext_map
    - Add <LANG>_EXTENSIONS constant
+   - Add to _TREE_SITTER_EXTRACTORS dispatch table
    - Create _extract_<lang>() method
    - Create _get_<lang>_parser() method
 
@@ -0,0 +1,141 @@
+"""Tests for the on-disk parse results cache used by build_project_call_graph.
+
+Projects with a .tldr directory keep per-file parse results in
+.tldr/cache/parse; a rebuild re-parses only files whose stat and content
+hash changed, and never reuses results that only reflect the environment.
+"""
+
+import os
+import pickle
+from pathlib import Path
+
+import pytest
+
+
+def _write(root: Path, rel_path: str, content: str) -> None:
+    path = root / rel_path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+def _python_project(root: Path) -> None:
+    (root / ".tldr").mkdir()
+    _write(root, "util.py", "def helper():\n    pass\n\n\ndef other():\n    pass\n")
+    _write(root, "main.py", "from util import helper\n\n\ndef main():\n    helper()\n")
+
+
+def _cache_path(root: Path, calls_fn) -> Path:
+    from tldr.cross_file_calls import _PARSE_RESULTS_DIR
+
+    return root / _PARSE_RESULTS_DIR / f"{calls_fn.__name__.strip('_')}.json"
+
+
+class TestParseResultsCache:
+    """Tests for reusing and invalidating cached parse results."""
+
+    def test_rebuild_after_change(self, tmp_path):
+        """A changed file should be re-parsed instead of served from the cache."""
+        from tldr.cross_file_calls import build_project_call_graph
+
+        _python_project(tmp_path)
+        graph = build_project_call_graph(tmp_path, language="python")
+        assert ("main.py", "main", "util.py", "helper") in graph.edges
+
+        _write(tmp_path, "main.py", "from util import other\n\n\ndef main():\n    other()\n")
+        graph = build_project_call_graph(tmp_path, language="python")
+
+        assert ("main.py", "main", "util.py", "other") in graph.edges
+        assert ("main.py", "main", "util.py", "helper") not in graph.edges
+
+    def test_touch_without_change_is_not_reparsed(self, tmp_path, monkeypatch):
+        """A file whose stat changed but whose content didn't should not be parsed."""
+        import tldr.cross_file_calls as cfc
+
+        _python_project(tmp_path)
+        first = cfc.build_project_call_graph(tmp_path, language="python").edges
+
+        st = os.stat(tmp_path / "main.py")
+        os.utime(tmp_path / "main.py", ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        parsed = []
+        parse_file_job = cfc._parse_file_job
+
+        def spy(imports_fn, calls_fn, root, file_path, source=None):
+            parsed.append(file_path)
+            return parse_file_job(imports_fn, calls_fn, root, file_path, source)
+
+        monkeypatch.setattr(cfc, "_parse_file_job", spy)
+        second = cfc.build_project_call_graph(tmp_path, language="python").edges
+
+        assert second == first
+        assert parsed == []
+
+    def test_results_without_grammar_are_not_cached(self, tmp_path, monkeypatch):
+        """Empty results from a missing grammar should be recomputed later."""
+        import tldr.cross_file_calls as cfc
+
+        (tmp_path / ".tldr").mkdir()
+        _write(tmp_path, "go.mod", "module example.com/app\n")
+        _write(tmp_path, "main.go", "package main\n\nfunc helper() {}\n\nfunc main() {\n\thelper()\n}\n")
+
+        monkeypatch.setitem(cfc._grammars, "go", None)
+        graph = cfc.build_project_call_graph(tmp_path, language="go")
+
+        assert graph.edges == set()
+        cached = cfc._load_parse_results(_cache_path(tmp_path, cfc._extract_go_file_calls))
+        assert not any(path.endswith(".go") for path in cached)
+
+        pytest.importorskip("tree_sitter_go")
+        monkeypatch.delitem(cfc._grammars, "go")
+        graph = cfc.build_project_call_graph(tmp_path, language="go")
+
+        assert ("main.go", "main", "main.go", "helper") in graph.edges
+
+    def test_cache_from_other_grammar_versions_is_ignored(self, tmp_path, monkeypatch):
+        """A cache written with different grammar packages should not be loaded."""
+        import tldr.cross_file_calls as cfc
+
+        _python_project(tmp_path)
+        cfc.build_project_call_graph(tmp_path, language="python")
+        cache_path = _cache_path(tmp_path, cfc._extract_python_file_calls)
+        assert cfc._load_parse_results(cache_path)
+
+        version = cfc._parse_results_version()
+        packages = dict(version[2])
+        packages["tree_sitter_go"] = "0.0.0-other"
+        monkeypatch.setattr(cfc, "_parse_results_version", lambda: version[:2] + (tuple(packages.items()),))
+
+        assert cfc._load_parse_results(cache_path) == {}
+
+    def test_planted_cache_file_is_not_executed(self, tmp_path):
+        """A cache file committed to the project should never be unpickled."""
+        import tldr.cross_file_calls as cfc
+
+        marker = tmp_path / "pwned"
+
+        class Payload:
+            def __reduce__(self):
+                return (os.mkdir, (str(marker),))
+
+        _python_project(tmp_path)
+        cache_path = _cache_path(tmp_path, cfc._extract_python_file_calls)
+        cache_path.parent.mkdir(parents=True)
+        cache_path.write_bytes(pickle.dumps(Payload()))
+        cache_path.with_suffix(".pkl").write_bytes(pickle.dumps(Payload()))
+
+        graph = cfc.build_project_call_graph(tmp_path, language="python")
+
+        assert not marker.exists()
+        assert ("main.py", "main", "util.py", "helper") in graph.edges
+
+    def test_failed_write_leaves_no_temp_file(self, tmp_path, monkeypatch):
+        """A cache write that fails should remove its temporary file."""
+        import tldr.cross_file_calls as cfc
+
+        def fail(src, dst):
+            raise OSError("disk full")
+
+        _python_project(tmp_path)
+        monkeypatch.setattr(cfc.os, "replace", fail)
+        cfc.build_project_call_graph(tmp_path, language="python")
+
+        assert list((tmp_path / cfc._PARSE_RESULTS_DIR).iterdir()) == []
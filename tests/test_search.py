@@ -0,0 +1,159 @@
+"""Tests for api.search.
+
+search() scans whole files, and with re2 whole batches of files, to find the
+lines worth checking; results must still be exactly those of matching the
+pattern against each line on its own.
+"""
+
+import re
+from pathlib import Path
+
+import pytest
+
+from tldr import api
+
+
+def _write(root: Path, rel_path: str, content: str) -> None:
+    path = root / rel_path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content.encode("utf-8"))
+
+
+@pytest.fixture(params=["re", "re-per-line", "re2"])
+def engine(request, monkeypatch):
+    """Run a test with re scanning whole files, re scanning lines, and re2."""
+    if request.param == "re2":
+        pytest.importorskip("re2")
+        monkeypatch.setattr(api, "RE2_AVAILABLE", True)
+        # Small batches so a handful of files spans several of them
+        monkeypatch.setattr(api, "_SEARCH_BATCH_CHARS", 64)
+    else:
+        monkeypatch.setattr(api, "RE2_AVAILABLE", False)
+        if request.param == "re-per-line":
+            monkeypatch.setattr(api, "_RE_WHOLE_FILE_CHARS", 0)
+    return request.param
+
+
+class TestSearch:
+    """Tests for search results."""
+
+    def test_line_numbers(self, tmp_path, engine):
+        """Matches should report 1-based line numbers and stripped content."""
+        _write(tmp_path, "a.py", "import os\n\ndef hello():\n    return os.getcwd()\n")
+
+        results = api.search(r"os\.", tmp_path)
+
+        assert results == [{"file": "a.py", "line": 4, "content": "return os.getcwd()"}]
+
+    @pytest.mark.parametrize("separator", ["\r\n", "\r", "\x0c", "\x1c", " "])
+    def test_line_separators(self, tmp_path, engine, separator):
+        """Lines should be numbered the way str.splitlines() splits them."""
+        _write(tmp_path, "a.txt", separator.join(["one", "two", "target", "four"]))
+
+        results = api.search("target", tmp_path)
+
+        assert [(r["line"], r["content"]) for r in results] == [(3, "target")]
+
+    def test_context_lines(self, tmp_path, engine):
+        """Context should hold the surrounding lines, clipped to the file."""
+        _write(tmp_path, "a.txt", "l1\nl2\nhit\nl4\r\nl5")
+
+        results = api.search("hit", tmp_path, context_lines=2)
+        assert results[0]["context"] == ["l1", "l2", "hit", "l4", "l5"]
+
+        results = api.search("l5", tmp_path, context_lines=1)
+        assert results[0]["context"] == ["l4", "l5"]
+
+    def test_max_results(self, tmp_path, engine):
+        """Searching should stop once max_results matches are found."""
+        _write(tmp_path, "a.txt", "x\n" * 10)
+
+        assert len(api.search("x", tmp_path, max_results=3)) == 3
+        assert len(api.search("x", tmp_path, max_results=0)) == 10
+
+    @pytest.mark.parametrize(
+        "pattern, expected",
+        [
+            ("^def", [1, 3]),
+            ("value$", [2]),
+            (r"\Adef", [1, 3]),
+            ("(?<=re)turn", [2, 4]),
+            ("return(?= value)", [2]),
+            ("return(?! value)", [4]),
+        ],
+    )
+    def test_line_sensitive_patterns(self, tmp_path, engine, pattern, expected):
+        """Anchors and lookarounds should apply to each line, not the file."""
+        _write(tmp_path, "a.py", "def f():\n    return value\ndef g():\n    return\n")
+
+        results = api.search(pattern, tmp_path)
+
+        assert [r["line"] for r in results] == expected
+
+    def test_match_spanning_lines_is_not_reported(self, tmp_path, engine):
+        """A match that only exists across a line break isn't a line match."""
+        _write(tmp_path, "a.txt", "foo\nbar\n")
+
+        assert api.search(r"foo\nbar", tmp_path) == []
+        assert api.search("o\\s+b", tmp_path) == []
+
+
+def _reference_search(pattern: str, root: Path, context_lines: int = 0) -> list[dict]:
+    """Match pattern against every line of every file, one line at a time."""
+    compiled = re.compile(pattern)
+    results = []
+    for file_path in root.rglob("*"):
+        if not file_path.is_file():
+            continue
+        lines = file_path.read_text(encoding="utf-8", errors="ignore").splitlines()
+        for index, line in enumerate(lines):
+            if compiled.search(line):
+                match = {
+                    "file": str(file_path.relative_to(root)),
+                    "line": index + 1,
+                    "content": line.strip(),
+                }
+                if context_lines > 0:
+                    start = max(0, index - context_lines)
+                    match["context"] = lines[start:index + context_lines + 1]
+                results.append(match)
+    return results
+
+
+class TestSearchMatchesPerLineScan:
+    """Tests that search() agrees with a plain per-line scan."""
+
+    FILES = {
+        "empty.py": "",
+        "newline_only.py": "\n",
+        "no_trailing_newline.py": "import os\ndef helper():\n    return os.sep",
+        "trailing_newline.py": "def main():\n    helper()\n    return None\n",
+        "blank_lines.txt": "\n\nfoo\n\n\nbar\n\n",
+        "mixed_endings.txt": "foo\r\nbar\rbaz\x0cqux\x1cfoo bar\n",
+        "pkg/nested.py": "from os import path\n\n\ndef helper(x):\n    return path.join(x, 'foo')",
+    }
+
+    @pytest.mark.parametrize(
+        "pattern",
+        [
+            "foo",
+            r"os\.",
+            "def ",
+            r"^\s*return",
+            r"\)$",
+            "x*",
+            r"o\s+b",
+            "foo|bar",
+            r"\bhelper\b",
+            "zzz_no_match",
+        ],
+    )
+    @pytest.mark.parametrize("context_lines", [0, 1])
+    def test_same_results(self, tmp_path, engine, pattern, context_lines):
+        """Every pattern should give exactly the per-line scan's results."""
+        for rel_path, content in self.FILES.items():
+            _write(tmp_path, rel_path, content)
+
+        results = api.search(pattern, tmp_path, context_lines=context_lines, max_results=0)
+
+        assert results == _reference_search(pattern, tmp_path, context_lines)
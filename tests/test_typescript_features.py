@@ -327,6 +327,25 @@ class TestCalls:
         assert "main" in output.lower() or "helper" in output.lower(), \
             f"should find call relationship, got: {result}"
 
+    def test_calls_inside_tsx_markup(self, temp_ts_project):
+        """Calls inside JSX in .tsx files should be found."""
+        from tldr.cross_file_calls import build_project_call_graph
+
+        tmpdir = temp_ts_project({
+            "App.tsx": """
+function format(name: string): string {
+    return name.trim();
+}
+
+export function App(props: { name: string }) {
+    return <div className="app">{format(props.name)}</div>;
+}
+""",
+        })
+        graph = build_project_call_graph(tmpdir, language="typescript", use_workspace_config=False)
+
+        assert ("App.tsx", "App", "App.tsx", "format") in graph.edges
+
 
 class TestImpact:
     """Test the 'impact' (reverse call graph) command for TypeScript."""
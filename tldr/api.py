@@ -14,10 +14,20 @@ Usage:
     # Returns LLM-ready string with call graph, signatures, complexity
 """
 
+import re
+from bisect import bisect_right
 from collections import defaultdict
+from itertools import accumulate, chain
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional
+
+# Optional linear-time regex engine for the file-wide scans in search()
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
 
 from .ast_extractor import (
     CallGraphInfo,  # Re-exported for API consumers
@@ -656,6 +666,13 @@ def get_relevant_context(
     queue = [(entry_point, 0)]
     result_functions = []
 
+    # Qualified keys by their last component, so an unqualified name resolves
+    # with one lookup instead of a scan over every signature
+    qualified_by_name: dict[str, list[str]] = defaultdict(list)
+    for key in signatures:
+        if "." in key:
+            qualified_by_name[key.rsplit(".", 1)[1]].append(key)
+
     # Helper to resolve function name to signature (handles qualified/unqualified)
     def resolve_func_name(name: str) -> list[tuple[str, tuple[str, FunctionInfo]]]:
         """Resolve function name, returning all matches for ambiguous names."""
@@ -666,8 +683,7 @@ def get_relevant_context(
             return []
 
         # Unqualified name - find all qualified matches
-        matches = [(k, v) for k, v in signatures.items()
-                   if k.endswith(f".{name}")]
+        matches = [(k, signatures[k]) for k in qualified_by_name.get(name, ())]
 
         if matches:
             # Return all matches (could be 1 or more)
@@ -1351,6 +1367,98 @@ def get_file_tree(
     return scan_dir(root)
 
 
+# The line boundaries str.splitlines() recognizes
+_LINE_BREAK_RE = re.compile(r"\r\n|[\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
+
+# A pattern containing none of these matches a line only if it also matches
+# the whole file somewhere on that line. Anchors and lookarounds can see past
+# the end of a line in the whole file, so they could make the two disagree
+_LINE_SENSITIVE_TOKENS = ("^", "$", "\\A", "\\Z", "\\z", "(?<", "(?=", "(?!")
+
+
+def _line_offsets(content: str) -> tuple[list[int], list[int]]:
+    """
+    Return the start and end offsets of each line of content, numbered the
+    way content.splitlines() would split it.
+    """
+    starts = [0]
+    ends = []
+    for match in _LINE_BREAK_RE.finditer(content):
+        ends.append(match.start())
+        starts.append(match.end())
+    ends.append(len(content))
+    if starts[-1] == len(content):
+        # A trailing line break (or empty content) does not start a line
+        del starts[-1], ends[-1]
+    return starts, ends
+
+
+# re2's \w, \d, \s and \b classes are ASCII-only, and it reads inline flags,
+# POSIX classes and {,n} repeats differently, so patterns using any of them
+# are scanned with re alone
+_RE2_UNSAFE_TOKENS = ("\\w", "\\W", "\\d", "\\D", "\\s", "\\S", "\\b", "\\B", "(?", "[:", "{,")
+
+
+def _compile_scan_pattern(pattern: str, compiled):
+    """
+    Return the regex search() scans whole files and batches with.
+
+    That scan only picks candidate lines, which are then checked with
+    compiled, so an engine whose matches can differ from re's is only used
+    where they can't. re2 runs in linear time, so a backtracking-prone
+    pattern cannot blow up on a large batch.
+    """
+    if RE2_AVAILABLE and pattern.isascii() and not any(token in pattern for token in _RE2_UNSAFE_TOKENS):
+        try:
+            return re2.compile(pattern)
+        except re2.error:
+            pass
+    return compiled
+
+
+def _touched_segments(matches: Iterable, starts: list[int]) -> list[int]:
+    """
+    Return the indexes of the segments of a string (lines, or files in a
+    joined batch) starting at starts that matches from finditer() on it
+    touch, in order. Every segment the pattern matches on its own is among
+    them, provided the pattern has no _LINE_SENSITIVE_TOKENS.
+    """
+    candidates = []
+    last_segment = len(starts) - 1
+    for match in matches:
+        first = bisect_right(starts, match.start()) - 1
+        last = bisect_right(starts, max(match.start(), match.end() - 1)) - 1
+        if candidates:
+            first = max(first, candidates[-1] + 1)
+        candidates.extend(range(first, min(last, last_segment) + 1))
+    return candidates
+
+
+# For patterns that can be scanned file-wide with re2, search() reads files
+# in batches of up to this many characters and scans each batch joined into
+# one string first. On trees of many small files this replaces a regex call
+# per file with one per batch. re can backtrack across line breaks, so its
+# cost would grow with the batch; with re, files are scanned one at a time,
+# and only those up to _RE_WHOLE_FILE_CHARS as a whole.
+_SEARCH_BATCH_CHARS = 1 << 20
+_RE_WHOLE_FILE_CHARS = 64 * 1024
+
+
+def _content_batches(files: Iterator[tuple[Path, str]], max_chars: int) -> Iterator[list[tuple[Path, str]]]:
+    """Group (path, content) pairs into batches of at most max_chars characters."""
+    batch = []
+    size = 0
+    for item in files:
+        if batch and size + len(item[1]) > max_chars:
+            yield batch
+            batch = []
+            size = 0
+        batch.append(item)
+        size += len(item[1])
+    if batch:
+        yield batch
+
+
 def search(
     pattern: str,
     root: str | Path,
@@ -1385,8 +1493,6 @@ def search(
     # Security: Validate path containment
     _validate_path_containment(str(root))
 
-    import re
-
     # Fallback directories to skip if no ignore_spec provided
     SKIP_DIRS = {
         "node_modules", "__pycache__", ".git", ".svn", ".hg",
@@ -1397,47 +1503,89 @@ def search(
     results = []
     root = Path(root)
     compiled = re.compile(pattern)
-    files_scanned = 0
+    whole_file = not any(token in pattern for token in _LINE_SENSITIVE_TOKENS)
+    scanner = _compile_scan_pattern(pattern, compiled) if whole_file else compiled
 
-    for file_path in root.rglob("*"):
-        # Check file limit
-        if max_files > 0 and files_scanned >= max_files:
-            break
+    def read_files() -> Iterator[tuple[Path, str]]:
+        files_scanned = 0
 
-        if not file_path.is_file():
-            continue
+        for file_path in root.rglob("*"):
+            # Check file limit
+            if max_files > 0 and files_scanned >= max_files:
+                return
 
-        # Get relative path for filtering
-        try:
-            rel_path = file_path.relative_to(root)
-            rel_path_str = str(rel_path)
-            parts = rel_path.parts
-        except ValueError:
-            continue
-
-        # Use ignore_spec if provided, otherwise fall back to hardcoded SKIP_DIRS
-        if ignore_spec:
-            if ignore_spec.match_file(rel_path_str):
+            # Get relative path for filtering
+            try:
+                rel_path = file_path.relative_to(root)
+                rel_path_str = str(rel_path)
+                parts = rel_path.parts
+            except ValueError:
                 continue
-        else:
-            # Fallback: skip hidden files and junk directories
-            if any(part.startswith(".") for part in parts):
+
+            # Use ignore_spec if provided, otherwise fall back to hardcoded SKIP_DIRS
+            if ignore_spec:
+                if ignore_spec.match_file(rel_path_str):
+                    continue
+            else:
+                # Fallback: skip hidden files and junk directories
+                if any(part.startswith(".") for part in parts):
+                    continue
+                if any(part in SKIP_DIRS for part in parts):
+                    continue
+
+            # Filter by extension
+            if extensions and file_path.suffix not in extensions:
                 continue
-            if any(part in SKIP_DIRS for part in parts):
+
+            # Checked last: the path filters above need no system call
+            if not file_path.is_file():
                 continue
 
-        # Filter by extension
-        if extensions and file_path.suffix not in extensions:
-            continue
+            files_scanned += 1
 
-        files_scanned += 1
+            try:
+                content = file_path.read_text(encoding="utf-8", errors="ignore")
+            except (OSError, UnicodeDecodeError):
+                continue
+            yield file_path, content
+
+    linear = whole_file and scanner is not compiled
+    batch_chars = _SEARCH_BATCH_CHARS if linear else 0
+    for batch in _content_batches(read_files(), batch_chars):
+        if batch_chars and len(batch) > 1:
+            # Only files the batch's matches touch can match on their own
+            joined = "\x00".join(content for _, content in batch)
+            file_starts = list(accumulate((len(content) + 1 for _, content in batch[:-1]), initial=0))
+            batch = [batch[i] for i in _touched_segments(scanner.finditer(joined), file_starts)]
+
+        for file_path, content in batch:
+            if whole_file and (linear or len(content) <= _RE_WHOLE_FILE_CHARS):
+                # Search the file once, then only the lines its matches touch.
+                # Lines are sliced out of content as needed instead of splitting
+                # it into a string per line.
+                if not content:
+                    continue
+                matches = scanner.finditer(content)
+                first = next(matches, None)
+                if first is None:
+                    continue
+                starts, ends = _line_offsets(content)
+                line_indexes = _touched_segments(chain((first,), matches), starts)
 
-        try:
-            content = file_path.read_text(encoding="utf-8", errors="ignore")
-            lines = content.splitlines()
+                def line_at(index: int) -> str:
+                    return content[starts[index]:ends[index]]
+
+                line_count = len(starts)
+            else:
+                lines = content.splitlines()
+                line_indexes = range(len(lines))
+                line_at = lines.__getitem__
+                line_count = len(lines)
 
-            for i, line in enumerate(lines, 1):
+            for index in line_indexes:
+                line = line_at(index)
                 if compiled.search(line):
+                    i = index + 1
                     match = {
                         "file": str(file_path.relative_to(root)),
                         "line": i,
@@ -1447,16 +1595,14 @@ def search(
                     # Add context if requested
                     if context_lines > 0:
                         start = max(0, i - 1 - context_lines)
-                        end = min(len(lines), i + context_lines)
-                        match["context"] = lines[start:end]
+                        end = min(line_count, i + context_lines)
+                        match["context"] = [line_at(j) for j in range(start, end)]
 
                     results.append(match)
 
                     # Check result limit
                     if max_results > 0 and len(results) >= max_results:
                         return results
-        except (OSError, UnicodeDecodeError):
-            pass
 
     return results
 
@@ -1573,9 +1719,7 @@ def get_code_structure(
         if count >= max_results:
             break
 
-        if not file_path.is_file():
-            continue
-
+        # The suffix is checked before is_file, which costs a stat
         if file_path.suffix not in extensions:
             continue
 
@@ -1590,6 +1734,9 @@ def get_code_structure(
         if ignore_spec and ignore_spec.match_file(rel_path):
             continue
 
+        if not file_path.is_file():
+            continue
+
         try:
             info = _extract_file_impl(str(file_path))
             info_dict = info.to_dict()
@@ -22,6 +22,9 @@ from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Constant types whose repr() is exactly what ast.unparse prints for them
+_REPR_CONSTANT_TYPES = (str, int, bool, type(None))
+
 
 @dataclass
 class FunctionInfo:
@@ -446,6 +449,27 @@ class PythonASTExtractor:
         if node is None:
             return ""
 
+        # Names, dotted names and plain literals make up most annotations,
+        # decorators and defaults. Format those directly; ast.unparse sets up
+        # a whole NodeVisitor per call.
+        if isinstance(node, ast.Name):
+            return node.id
+        if isinstance(node, ast.Attribute):
+            parts = [node.attr]
+            value = node.value
+            while isinstance(value, ast.Attribute):
+                parts.append(value.attr)
+                value = value.value
+            if isinstance(value, ast.Name):
+                parts.append(value.id)
+                return ".".join(reversed(parts))
+        elif (
+            isinstance(node, ast.Constant)
+            and node.kind is None
+            and type(node.value) in _REPR_CONSTANT_TYPES
+        ):
+            return repr(node.value)
+
         # Python 3.9+ has ast.unparse
         try:
             return ast.unparse(node)
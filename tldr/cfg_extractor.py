@@ -123,7 +123,7 @@ except ImportError:
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class CFGBlock:
     """
     Basic block - sequential statements with no internal branches.
@@ -166,7 +166,7 @@ class CFGBlock:
         return '\n'.join(lines[start_idx:end_idx])
 
 
-@dataclass
+@dataclass(slots=True)
 class CFGEdge:
     """
     Edge between blocks with optional branch condition.
@@ -1372,12 +1372,12 @@ def _find_function_node(tree, function_name: str, language: str):
     return find_in_node(tree.root_node)
 
 
-def extract_typescript_cfg(source: str, function_name: str) -> CFGInfo:
+def extract_typescript_cfg(source: str | bytes, function_name: str) -> CFGInfo:
     """Extract CFG for a TypeScript/JavaScript function."""
     if not TREE_SITTER_AVAILABLE:
         raise ImportError("tree-sitter not available for TypeScript parsing")
 
-    source_bytes = source.encode('utf-8')
+    source_bytes = source if isinstance(source, bytes) else source.encode('utf-8')
     parser = _get_ts_parser("typescript")
     tree = parser.parse(source_bytes)
 
@@ -1406,12 +1406,12 @@ def extract_go_cfg(source: str, function_name: str) -> CFGInfo:
     return builder.build(func_node, function_name)
 
 
-def extract_rust_cfg(source: str, function_name: str) -> CFGInfo:
+def extract_rust_cfg(source: str | bytes, function_name: str) -> CFGInfo:
     """Extract CFG for a Rust function."""
     if not TREE_SITTER_RUST_AVAILABLE:
         raise ImportError("tree-sitter-rust not available")
 
-    source_bytes = source.encode('utf-8')
+    source_bytes = source if isinstance(source, bytes) else source.encode('utf-8')
     parser = _get_ts_parser("rust")
     tree = parser.parse(source_bytes)
 
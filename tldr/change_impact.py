@@ -297,7 +297,7 @@ def get_git_changed_files(project_path: str, base: str = "HEAD~1") -> list[str]:
             timeout=10,
         )
         if result.returncode == 0:
-            files = [f.strip() for f in result.stdout.strip().split("\n") if f.strip()]
+            files = [name for line in result.stdout.splitlines() if (name := line.strip())]
             return files
     except Exception:
         pass
@@ -489,8 +489,10 @@ Semantic Search:
                 
                 # Reconstruct graph from cache
                 graph = ProjectCallGraph()
-                for e in cache_data.get("edges", []):
-                    graph.add_edge(e["from_file"], e["from_func"], e["to_file"], e["to_func"])
+                graph.add_edges(
+                    (e["from_file"], e["from_func"], e["to_file"], e["to_func"])
+                    for e in cache_data.get("edges", [])
+                )
 
                 # Check for dirty files
                 if is_dirty(project):
@@ -687,7 +689,7 @@ Semantic Search:
                     }
                     for e in graph.edges
                 ],
-                "count": len(graph.edges),
+                "count": len(graph),
             }
             print(json.dumps(result, indent=2))
 
@@ -854,20 +856,31 @@ Semantic Search:
                 all_files = set()
                 combined_edges = []
                 processed_languages = []
-                
-                for lang in target_languages:
+
+                def build_language(lang):
                     try:
-                        # Scan files
                         files = scan_project(project_path, language=lang, respect_ignore=respect_ignore)
+                        return files, build_project_call_graph(project_path, language=lang), None
+                    except Exception as e:
+                        return None, None, e
+
+                # Languages are built side by side: tree-sitter releases the
+                # GIL while it parses, so their builds overlap with each other
+                # and with the Python one. Results are reported in order.
+                from concurrent.futures import ThreadPoolExecutor
+                with ThreadPoolExecutor(max_workers=max(1, len(target_languages))) as executor:
+                    built = list(executor.map(build_language, target_languages))
+
+                for lang, (files, graph, error) in zip(target_languages, built):
+                    try:
+                        if error is not None:
+                            raise error
                         all_files.update(files)
-                        
-                        # Build graph
-                        graph = build_project_call_graph(project_path, language=lang)
                         combined_edges.extend([
                             {"from_file": e[0], "from_func": e[1], "to_file": e[2], "to_func": e[3]}
                             for e in graph.edges
                         ])
-                        print(f"Processed {lang}: {len(files)} files, {len(graph.edges)} edges")
+                        print(f"Processed {lang}: {len(files)} files, {len(graph)} edges")
                         processed_languages.append(lang)
                     except ValueError as e:
                         # Expected for unsupported languages
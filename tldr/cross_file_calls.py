@@ -8,6 +8,7 @@ Supports: Python (.py), TypeScript (.ts, .tsx), Go (.go), and Rust (.rs)
 
 Key functions:
 - scan_project(root, language) - find all source files in a project
+- iter_project_files(root, language) - the same files, yielded as they are found
 - parse_imports(file) - extract import statements from a file
 - build_function_index(root, language) - map {module.func: file_path} for all functions
 - resolve_calls(file, index) - match call sites to definitions
@@ -15,263 +16,595 @@ Key functions:
 """
 
 import ast
+import functools
+import hashlib
+import importlib
+import importlib.metadata
+import json
 import os
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterator, Optional
+from typing import Iterable, Iterator, Optional
 
-from tldr.workspace import WorkspaceConfig, load_workspace_config, filter_paths
+from tldr import __version__
+from tldr.workspace import WorkspaceConfig, load_workspace_config, should_include_path
 
-# Tree-sitter support for TypeScript
 try:
-    import tree_sitter
-    import tree_sitter_typescript
-    TREE_SITTER_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    TREE_SITTER_AVAILABLE = False
+    ORJSON_AVAILABLE = False
 
-# Tree-sitter support for Go
-TREE_SITTER_GO_AVAILABLE = False
+# Content hashes for the parse results cache only need to tell versions of a
+# file apart, so use a fast non-cryptographic hash when one is installed
 try:
-    import tree_sitter_go
-    TREE_SITTER_GO_AVAILABLE = True
+    from blake3 import blake3 as _content_hash
+    _CONTENT_HASH_ID = "b3:"
 except ImportError:
-    pass
+    try:
+        from xxhash import xxh3_128 as _content_hash
+        _CONTENT_HASH_ID = "x3:"
+    except ImportError:
+        _content_hash = hashlib.sha256
+        _CONTENT_HASH_ID = "s2:"
+
+# Sources larger than this are skipped without being read (same limit and
+# TLDR_MAX_FILE_SIZE override as hybrid_extractor)
+MAX_FILE_SIZE = int(os.environ.get("TLDR_MAX_FILE_SIZE", 5_000_000))
+
+# Tree-sitter grammar modules by language. They are imported on first use
+# (see _grammar) rather than here, so importing this module does not load
+# every grammar's shared library when only one language will be scanned.
+_GRAMMAR_MODULES = {
+    "typescript": "tree_sitter_typescript",
+    "tsx": "tree_sitter_typescript",
+    "go": "tree_sitter_go",
+    "rust": "tree_sitter_rust",
+    "java": "tree_sitter_java",
+    "c": "tree_sitter_c",
+    "ruby": "tree_sitter_ruby",
+    "php": "tree_sitter_php",
+    "cpp": "tree_sitter_cpp",
+    "kotlin": "tree_sitter_kotlin",
+    "swift": "tree_sitter_swift",
+    "csharp": "tree_sitter_c_sharp",
+    "scala": "tree_sitter_scala",
+    "lua": "tree_sitter_lua",
+    "luau": "tree_sitter_luau",
+    "elixir": "tree_sitter_elixir",
+}
+
+_grammars: dict[str, object] = {}
+
+# Legacy availability flags, resolved lazily by __getattr__ below
+_AVAILABILITY_FLAGS = {
+    "TREE_SITTER_AVAILABLE": "typescript",
+    "TREE_SITTER_GO_AVAILABLE": "go",
+    "TREE_SITTER_RUST_AVAILABLE": "rust",
+    "TREE_SITTER_JAVA_AVAILABLE": "java",
+    "TREE_SITTER_C_AVAILABLE": "c",
+    "TREE_SITTER_RUBY_AVAILABLE": "ruby",
+    "TREE_SITTER_PHP_AVAILABLE": "php",
+    "TREE_SITTER_CPP_AVAILABLE": "cpp",
+    "TREE_SITTER_KOTLIN_AVAILABLE": "kotlin",
+    "TREE_SITTER_SWIFT_AVAILABLE": "swift",
+    "TREE_SITTER_CSHARP_AVAILABLE": "csharp",
+    "TREE_SITTER_SCALA_AVAILABLE": "scala",
+    "TREE_SITTER_LUA_AVAILABLE": "lua",
+    "TREE_SITTER_LUAU_AVAILABLE": "luau",
+    "TREE_SITTER_ELIXIR_AVAILABLE": "elixir",
+}
+
+
+def _grammar(language: str):
+    """Import and cache the tree-sitter grammar module for language (None if unavailable)."""
+    if language not in _grammars:
+        try:
+            import tree_sitter  # noqa: F401
+            _grammars[language] = importlib.import_module(_GRAMMAR_MODULES[language])
+        except ImportError:
+            _grammars[language] = None
+    return _grammars[language]
+
+
+# Grammar modules whose language function isn't simply language()
+_LANGUAGE_FUNCTIONS = {
+    "typescript": "language_typescript",
+    "tsx": "language_tsx",
+    "php": "language_php",
+}
+
+
+@functools.cache
+def _language(language: str):
+    """Return the tree-sitter Language for a grammar, built once per process."""
+    import tree_sitter
 
-# Tree-sitter support for Rust
-TREE_SITTER_RUST_AVAILABLE = False
-try:
-    import tree_sitter_rust
-    TREE_SITTER_RUST_AVAILABLE = True
-except ImportError:
-    pass
+    grammar = _grammar(language)
+    return tree_sitter.Language(getattr(grammar, _LANGUAGE_FUNCTIONS.get(language, "language"))())
 
-# Tree-sitter support for Java
-TREE_SITTER_JAVA_AVAILABLE = False
-try:
-    import tree_sitter_java
-    TREE_SITTER_JAVA_AVAILABLE = True
-except ImportError:
-    pass
 
-# Tree-sitter support for C
-TREE_SITTER_C_AVAILABLE = False
-try:
-    import tree_sitter_c
-    TREE_SITTER_C_AVAILABLE = True
-except ImportError:
-    pass
+# A Parser carries mutable parse state, so it can't be shared between
+# threads, but one parser can be reused for every file a thread parses
+_thread_parsers = threading.local()
 
-# Tree-sitter support for Ruby
-TREE_SITTER_RUBY_AVAILABLE = False
-try:
-    import tree_sitter_ruby
-    TREE_SITTER_RUBY_AVAILABLE = True
-except ImportError:
-    pass
 
-# Tree-sitter support for PHP
-TREE_SITTER_PHP_AVAILABLE = False
-try:
-    import tree_sitter_php
-    TREE_SITTER_PHP_AVAILABLE = True
-except ImportError:
-    pass
+def _thread_parser(language: str):
+    """Return the calling thread's parser for a grammar, creating it on first use."""
+    parsers = getattr(_thread_parsers, "parsers", None)
+    if parsers is None:
+        parsers = _thread_parsers.parsers = {}
+    parser = parsers.get(language)
+    if parser is None:
+        import tree_sitter
 
-# Tree-sitter support for C++
-TREE_SITTER_CPP_AVAILABLE = False
-try:
-    import tree_sitter_cpp
-    TREE_SITTER_CPP_AVAILABLE = True
-except ImportError:
-    pass
+        parser = parsers[language] = tree_sitter.Parser(_language(language))
+    return parser
 
-# Tree-sitter support for Kotlin
-TREE_SITTER_KOTLIN_AVAILABLE = False
-try:
-    import tree_sitter_kotlin
-    TREE_SITTER_KOTLIN_AVAILABLE = True
-except ImportError:
-    pass
 
-# Tree-sitter support for Swift
-TREE_SITTER_SWIFT_AVAILABLE = False
-try:
-    import tree_sitter_swift
-    TREE_SITTER_SWIFT_AVAILABLE = True
-except ImportError:
-    pass
+def _warm_parse_worker(languages: tuple[str, ...]) -> None:
+    """
+    Process-pool initializer: create the worker's parsers before its first job.
 
-# Tree-sitter support for C#
-TREE_SITTER_CSHARP_AVAILABLE = False
-try:
-    import tree_sitter_c_sharp
-    TREE_SITTER_CSHARP_AVAILABLE = True
-except ImportError:
-    pass
+    languages are the grammars the parent process has loaded. A forked
+    worker inherits those, but a spawned one (macOS, Windows) starts empty
+    and would otherwise load grammars and build parsers on its first tasks.
+    """
+    for language in languages:
+        if _grammar(language) is not None:
+            _thread_parser(language)
 
-TREE_SITTER_SCALA_AVAILABLE = False
-try:
-    import tree_sitter_scala
-    TREE_SITTER_SCALA_AVAILABLE = True
-except ImportError:
-    pass
 
-# Tree-sitter support for Lua
-TREE_SITTER_LUA_AVAILABLE = False
-try:
-    import tree_sitter_lua
-    TREE_SITTER_LUA_AVAILABLE = True
-except ImportError:
-    pass
+def _has_grammar(language: str) -> bool:
+    """Return True if tree-sitter and the grammar for language are installed."""
+    if _grammar(language) is not None:
+        return True
+    _job_bailed()
+    return False
+
+
+def __getattr__(name: str):
+    language = _AVAILABILITY_FLAGS.get(name)
+    if language is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return _has_grammar(language)
 
-# Tree-sitter support for Elixir
-TREE_SITTER_ELIXIR_AVAILABLE = False
-try:
-    import tree_sitter_elixir
-    TREE_SITTER_ELIXIR_AVAILABLE = True
-except ImportError:
-    pass
 
+# Bits per interned string ID in a packed ProjectCallGraph edge key
+_EDGE_ID_BITS = 32
+_EDGE_ID_MASK = (1 << _EDGE_ID_BITS) - 1
 
-@dataclass
+
+@dataclass(eq=False)
 class ProjectCallGraph:
-    """Cross-file call graph with edges as (src_file, src_func, dst_file, dst_func)."""
+    """
+    Cross-file call graph with edges as (src_file, src_func, dst_file, dst_func).
+
+    File paths and function names repeat across many edges, so each string is
+    interned to an integer ID once and an edge is stored as a single int that
+    packs its four IDs. That is one small int per edge instead of a 4-tuple,
+    and set membership hashes one int instead of four strings.
+
+    len() and iteration work on the packed keys directly; edges decodes them
+    into a set of tuples once and keeps it until the graph next changes.
+    """
 
-    _edges: set[tuple[str, str, str, str]] = field(default_factory=set)
+    _ids: dict[str, int] = field(default_factory=dict)
+    _strings: list[str] = field(default_factory=list)
+    _packed: set[int] = field(default_factory=set)
+    _decoded: Optional[frozenset] = field(default=None, repr=False)
+
+    def _intern(self, value: str) -> int:
+        """Return the ID for value, assigning a new one if needed."""
+        string_id = self._ids.get(value)
+        if string_id is None:
+            string_id = self._ids[value] = len(self._strings)
+            self._strings.append(value)
+        return string_id
+
+    def _key(self, edge: tuple[str, str, str, str]) -> int | None:
+        """Packed key for an edge, or None if any part was never interned."""
+        key = 0
+        for part in edge:
+            string_id = self._ids.get(part)
+            if string_id is None:
+                return None
+            key = (key << _EDGE_ID_BITS) | string_id
+        return key
 
     def add_edge(self, src_file: str, src_func: str, dst_file: str, dst_func: str):
         """Add a call edge from src_file:src_func to dst_file:dst_func."""
-        self._edges.add((src_file, src_func, dst_file, dst_func))
+        intern = self._intern
+        key = intern(src_file)
+        key = (key << _EDGE_ID_BITS) | intern(src_func)
+        key = (key << _EDGE_ID_BITS) | intern(dst_file)
+        key = (key << _EDGE_ID_BITS) | intern(dst_func)
+        self._packed.add(key)
+        self._decoded = None
+
+    def add_edges(self, edges) -> None:
+        """
+        Add many (src_file, src_func, dst_file, dst_func) edges at once.
+
+        Cheaper than an add_edge call per edge when loading a whole graph,
+        as the keys are packed in one pass and added with a single update.
+        """
+        intern = self._intern
+        bits = _EDGE_ID_BITS
+        self._packed.update(
+            (((intern(src_file) << bits | intern(src_func)) << bits | intern(dst_file)) << bits)
+            | intern(dst_func)
+            for src_file, src_func, dst_file, dst_func in edges
+        )
+        self._decoded = None
+
+    def remove_edges(self, edges) -> None:
+        """Remove the given (src_file, src_func, dst_file, dst_func) edges if present."""
+        for edge in edges:
+            key = self._key(edge)
+            if key is not None:
+                self._packed.discard(key)
+        self._decoded = None
 
     @property
-    def edges(self) -> set[tuple[str, str, str, str]]:
-        """Return all edges as a set of tuples."""
-        return self._edges
+    def edges(self) -> frozenset[tuple[str, str, str, str]]:
+        """
+        Return all edges as a set of tuples.
+
+        The set is read-only; change the graph with add_edge, add_edges and
+        remove_edges.
+        """
+        if self._decoded is None:
+            self._decoded = frozenset(self)
+        return self._decoded
+
+    def __iter__(self) -> Iterator[tuple[str, str, str, str]]:
+        """Iterate over the edges as tuples, in no particular order."""
+        strings = self._strings
+        bits, mask = _EDGE_ID_BITS, _EDGE_ID_MASK
+        for key in self._packed:
+            yield (
+                strings[key >> (3 * bits)],
+                strings[(key >> (2 * bits)) & mask],
+                strings[(key >> bits) & mask],
+                strings[key & mask],
+            )
+
+    def __len__(self) -> int:
+        """Return the number of edges."""
+        return len(self._packed)
 
     def __contains__(self, edge: tuple[str, str, str, str]) -> bool:
         """Check if an edge exists in the graph."""
-        return edge in self._edges
+        key = self._key(edge)
+        return key is not None and key in self._packed
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ProjectCallGraph):
+            return NotImplemented
+        return self.edges == other.edges
+
+
+def _walk_tree(node) -> Iterator:
+    """
+    Yield node and all of its descendants in pre-order.
+
+    Uses a tree-sitter cursor instead of Python recursion, so there is no
+    interpreter frame per node and no recursion limit on deeply nested code.
+    """
+    cursor = node.walk()
+    while True:
+        yield cursor.node
+        if cursor.goto_first_child():
+            continue
+        while not cursor.goto_next_sibling():
+            if not cursor.goto_parent():
+                return
+
+
+@functools.cache
+def _query(language: str, pattern: str):
+    """Compile a tree-sitter query, once per process."""
+    import tree_sitter
+
+    return tree_sitter.Query(_language(language), pattern)
+
+
+def _query_nodes(language: str, pattern: str, node) -> list:
+    """
+    Return the nodes under node captured by a single-capture query pattern,
+    in document order.
+
+    The matching runs inside tree-sitter, so only the captured nodes are
+    materialized as Python objects instead of every node in the subtree.
+    """
+    import tree_sitter
+
+    query = _query(language, pattern)
+    if hasattr(tree_sitter, "QueryCursor"):  # tree-sitter >= 0.25
+        captures = tree_sitter.QueryCursor(query).captures(node)
+    else:
+        captures = query.captures(node)
+    return next(iter(captures.values()), [])
+
+
+# The source the current parse job has read, as (path, buffer), so the
+# import and call extractors it runs don't each read the file again
+_job_source = threading.local()
+
+
+def _job_bailed() -> None:
+    """
+    Mark the current parse job's results as not worth caching.
+
+    Called when an extractor gives up for lack of a grammar or on a parse
+    error; its empty result says nothing about the file and must be
+    recomputed once the grammar is installed or fixed.
+    """
+    _job_source.bailed = True
 
 
-def _get_ts_parser():
-    """Get or create a tree-sitter TypeScript parser."""
-    if not TREE_SITTER_AVAILABLE:
+def _job_buffer(file_path):
+    """Return the current parse job's buffer if it is for file_path, else None."""
+    entry = getattr(_job_source, "entry", None)
+    if entry is not None and entry[0] == os.fspath(file_path):
+        return entry[1]
+    return None
+
+
+def _read_source(file_path: Path):
+    """
+    Return a file's contents as bytes for tree-sitter.
+
+    The file is read straight into bytes with os.read, skipping the buffered
+    file object. It is not memory-mapped: the daemon and `watch` rebuild
+    while editors and formatters rewrite files, and touching a mapped page
+    past the end of a file truncated underneath it raises SIGBUS, which
+    kills the process.
+
+    Raises:
+        ValueError: If the file is larger than MAX_FILE_SIZE. The size is
+                    checked with fstat before any content is read, and again
+                    while reading if fstat didn't give the whole size.
+    """
+    buffer = _job_buffer(file_path)
+    if buffer is not None:
+        return buffer
+    fd = os.open(file_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        size = os.fstat(fd).st_size
+        if size > MAX_FILE_SIZE:
+            raise ValueError(f"{file_path} is {size:,} bytes, exceeds limit of {MAX_FILE_SIZE:,} bytes")
+        data = os.read(fd, size) if size else b""
+        if size and len(data) == size:
+            return data
+        # A short read, or a size of 0 from procfs-like files: read on to EOF
+        chunks = [data]
+        total = len(data)
+        while chunk := os.read(fd, 64 * 1024):
+            chunks.append(chunk)
+            total += len(chunk)
+            if total > MAX_FILE_SIZE:
+                raise ValueError(f"{file_path} exceeds limit of {MAX_FILE_SIZE:,} bytes")
+        return b"".join(chunks)
+    finally:
+        os.close(fd)
+
+
+def _has_literal(source, *literals: bytes) -> bool:
+    """
+    Return True if a source from _read_source contains any of literals.
+
+    A syntax node of interest always contains its keyword, so a source
+    without one can be skipped before it is parsed.
+    """
+    return any(source.find(literal) != -1 for literal in literals)
+
+
+# Import parsing, indexing and call extraction each parse the same file while
+# a call graph is built. Recently parsed trees are kept per (language, path),
+# oldest first, together with the source they were parsed from.
+_PARSE_CACHE_SIZE = 512
+_parse_cache: dict[tuple[str, str], tuple[bytes, object]] = {}
+_parse_cache_lock = threading.Lock()
+
+
+def _parse_cached(language: str, file_path: Path, source: bytes, get_parser):
+    """
+    Parse source, reusing the cached tree if the file's content is unchanged
+    and reparsing incrementally from it if the content has changed.
+
+    The cached source is compared in full rather than by digest: differing
+    lengths fail immediately, and an equal-length compare is a memcmp that
+    is cheaper than hashing the new content.
+    """
+    key = (language, str(file_path))
+    with _parse_cache_lock:
+        cached = _parse_cache.pop(key, None)
+    if cached is None:
+        tree = get_parser().parse(source)
+    elif cached[0] == source:
+        tree = cached[1]
+    else:
+        tree = _reparse(cached[0], cached[1], source, get_parser)
+    with _parse_cache_lock:
+        _parse_cache[key] = (source, tree)
+        if len(_parse_cache) > _PARSE_CACHE_SIZE:
+            del _parse_cache[next(iter(_parse_cache))]
+    return tree
+
+
+def _reparse(old_source: bytes, old_tree, source: bytes, get_parser):
+    """
+    Parse changed source incrementally against the tree of its old version.
+
+    The changed span is found from the common prefix and suffix of the two
+    versions; tree-sitter then re-lexes only around it and reuses the rest
+    of the old tree. Falls back to a full parse if the edit is rejected.
+    """
+    from .incremental_parse import calculate_edit_range
+
+    edit = calculate_edit_range(old_source, source)
+    try:
+        old_tree.edit(
+            start_byte=edit.start_byte,
+            old_end_byte=edit.old_end_byte,
+            new_end_byte=edit.new_end_byte,
+            start_point=edit.start_point,
+            old_end_point=edit.old_end_point,
+            new_end_point=edit.new_end_point,
+        )
+        return get_parser().parse(source, old_tree)
+    except Exception:
+        return get_parser().parse(source)
+
+
+def _get_ts_parser(language: str = "typescript"):
+    """Get or create a tree-sitter TypeScript (or TSX) parser."""
+    if not _has_grammar(language):
         raise RuntimeError("tree-sitter-typescript not available")
 
-    ts_lang = tree_sitter.Language(tree_sitter_typescript.language_typescript())
-    parser = tree_sitter.Parser(ts_lang)
-    return parser
+    return _thread_parser(language)
+
+
+def _ts_grammar(file_path: Path) -> str:
+    """
+    Return the grammar a TypeScript file is parsed with.
+
+    .tsx files need the tsx grammar: the plain TypeScript grammar turns JSX
+    into error nodes, losing the declarations and calls around it.
+    """
+    return "tsx" if file_path.suffix == ".tsx" else "typescript"
 
 
 def _get_rust_parser():
     """Get or create a tree-sitter Rust parser."""
-    if not TREE_SITTER_RUST_AVAILABLE:
+    if not _has_grammar("rust"):
         raise RuntimeError("tree-sitter-rust not available")
 
-    rust_lang = tree_sitter.Language(tree_sitter_rust.language())
-    parser = tree_sitter.Parser(rust_lang)
-    return parser
+    return _thread_parser("rust")
 
 
 def _get_go_parser():
     """Get or create a tree-sitter Go parser."""
-    if not TREE_SITTER_GO_AVAILABLE:
+    if not _has_grammar("go"):
         raise RuntimeError("tree-sitter-go not available")
 
-    go_lang = tree_sitter.Language(tree_sitter_go.language())
-    parser = tree_sitter.Parser(go_lang)
-    return parser
+    return _thread_parser("go")
 
 
 def _get_java_parser():
     """Get or create a tree-sitter Java parser."""
-    if not TREE_SITTER_JAVA_AVAILABLE:
+    if not _has_grammar("java"):
         raise RuntimeError("tree-sitter-java not available")
 
-    java_lang = tree_sitter.Language(tree_sitter_java.language())
-    parser = tree_sitter.Parser(java_lang)
-    return parser
+    return _thread_parser("java")
 
 
 def _get_c_parser():
     """Get or create a tree-sitter C parser."""
-    if not TREE_SITTER_C_AVAILABLE:
+    if not _has_grammar("c"):
         raise RuntimeError("tree-sitter-c not available")
 
-    c_lang = tree_sitter.Language(tree_sitter_c.language())
-    parser = tree_sitter.Parser(c_lang)
-    return parser
+    import tree_sitter
+
+    return tree_sitter.Parser(_language("c"))
 
 
 def _get_ruby_parser():
     """Get or create a tree-sitter Ruby parser."""
-    if not TREE_SITTER_RUBY_AVAILABLE:
+    if not _has_grammar("ruby"):
         raise RuntimeError("tree-sitter-ruby not available")
 
-    ruby_lang = tree_sitter.Language(tree_sitter_ruby.language())
-    parser = tree_sitter.Parser(ruby_lang)
-    return parser
+    import tree_sitter
+
+    return tree_sitter.Parser(_language("ruby"))
 
 
 def _get_php_parser():
     """Get or create a tree-sitter PHP parser."""
-    if not TREE_SITTER_PHP_AVAILABLE:
+    if not _has_grammar("php"):
         raise RuntimeError("tree-sitter-php not available")
 
-    php_lang = tree_sitter.Language(tree_sitter_php.language_php())
-    parser = tree_sitter.Parser(php_lang)
-    return parser
+    import tree_sitter
+
+    return tree_sitter.Parser(_language("php"))
 
 
 def _get_cpp_parser():
     """Get or create a tree-sitter C++ parser."""
-    if not TREE_SITTER_CPP_AVAILABLE:
+    if not _has_grammar("cpp"):
         raise RuntimeError("tree-sitter-cpp not available")
 
-    cpp_lang = tree_sitter.Language(tree_sitter_cpp.language())
-    parser = tree_sitter.Parser(cpp_lang)
-    return parser
+    import tree_sitter
+
+    return tree_sitter.Parser(_language("cpp"))
 
 
 def _get_kotlin_parser():
     """Get or create a tree-sitter Kotlin parser."""
-    if not TREE_SITTER_KOTLIN_AVAILABLE:
+    if not _has_grammar("kotlin"):
         raise RuntimeError("tree-sitter-kotlin not available")
 
-    kotlin_lang = tree_sitter.Language(tree_sitter_kotlin.language())
-    parser = tree_sitter.Parser(kotlin_lang)
-    return parser
+    import tree_sitter
+
+    return tree_sitter.Parser(_language("kotlin"))
 
 
 def _get_swift_parser():
     """Get or create a tree-sitter Swift parser."""
-    if not TREE_SITTER_SWIFT_AVAILABLE:
+    if not _has_grammar("swift"):
         raise RuntimeError("tree-sitter-swift not available")
 
-    swift_lang = tree_sitter.Language(tree_sitter_swift.language())
-    parser = tree_sitter.Parser(swift_lang)
-    return parser
+    import tree_sitter
+
+    return tree_sitter.Parser(_language("swift"))
 
 
 def _get_csharp_parser():
     """Get or create a tree-sitter C# parser."""
-    if not TREE_SITTER_CSHARP_AVAILABLE:
+    if not _has_grammar("csharp"):
         raise RuntimeError("tree-sitter-c-sharp not available")
 
-    csharp_lang = tree_sitter.Language(tree_sitter_c_sharp.language())
-    parser = tree_sitter.Parser(csharp_lang)
-    return parser
+    import tree_sitter
+
+    return tree_sitter.Parser(_language("csharp"))
 
 
 def _get_scala_parser():
     """Get or create a tree-sitter Scala parser."""
-    if not TREE_SITTER_SCALA_AVAILABLE:
+    if not _has_grammar("scala"):
         raise RuntimeError("tree-sitter-scala not available")
 
-    scala_lang = tree_sitter.Language(tree_sitter_scala.language())
-    parser = tree_sitter.Parser(scala_lang)
-    return parser
+    import tree_sitter
+
+    return tree_sitter.Parser(_language("scala"))
+
+
+# Source file extensions per language. Tuples, so str.endswith can test a
+# filename against all of a language's extensions in one call.
+_SCAN_EXTENSIONS = {
+    "python": ('.py',),
+    "typescript": ('.ts', '.tsx'),
+    "javascript": ('.js', '.jsx', '.mjs', '.cjs'),
+    "go": ('.go',),
+    "rust": ('.rs',),
+    "java": ('.java',),
+    "c": ('.c', '.h'),
+    "cpp": ('.cpp', '.cc', '.cxx', '.hpp', '.hh', '.hxx'),
+    "ruby": ('.rb',),
+    "php": ('.php',),
+    "kotlin": ('.kt', '.kts'),
+    "swift": ('.swift',),
+    "csharp": ('.cs',),
+    "scala": ('.scala', '.sc'),
+    "lua": ('.lua',),
+    "luau": ('.luau',),
+    "elixir": ('.ex', '.exs'),
+}
 
 
 def scan_project(
@@ -279,6 +612,7 @@ def scan_project(
     language: str = "python",
     workspace_config: Optional[WorkspaceConfig] = None,
     respect_ignore: bool = True,
+    walk_workers: int = 1,
 ) -> list[str]:
     """
     Find all source files in the project for the given language.
@@ -289,87 +623,202 @@ def scan_project(
         workspace_config: Optional WorkspaceConfig for monorepo scoping.
                          If provided, filters files by activePackages and excludePatterns.
         respect_ignore: If True, respect .tldrignore patterns (default True)
+        walk_workers: Threads to walk the top-level directories with. More
+                      than 1 helps on network filesystems, where listing a
+                      directory is slow; the file order is the same.
 
     Returns:
         List of absolute paths to source files
     """
-    from .tldrignore import load_ignore_patterns, should_ignore
+    return list(iter_project_files(root, language, workspace_config, respect_ignore, walk_workers))
+
+
+def iter_project_files(
+    root: str | Path,
+    language: str = "python",
+    workspace_config: Optional[WorkspaceConfig] = None,
+    respect_ignore: bool = True,
+    walk_workers: int = 1,
+) -> Iterator[str]:
+    """
+    Yield the files scan_project would return, as the walk finds them.
+
+    Lets a caller start on the first files before the rest of the tree has
+    been listed. Arguments are as for scan_project; an unsupported language
+    raises ValueError once iteration starts.
+    """
+    from .tldrignore import load_ignore_patterns
 
     root = Path(root)
-    files = []
 
     # Load ignore patterns if respecting .tldrignore
     ignore_spec = load_ignore_patterns(root) if respect_ignore else None
 
-    if language == "python":
-        extensions = {'.py'}
-    elif language == "typescript":
-        extensions = {'.ts', '.tsx'}
-    elif language == "javascript":
-        extensions = {'.js', '.jsx', '.mjs', '.cjs'}
-    elif language == "go":
-        extensions = {'.go'}
-    elif language == "rust":
-        extensions = {'.rs'}
-    elif language == "java":
-        extensions = {'.java'}
-    elif language == "c":
-        extensions = {'.c', '.h'}
-    elif language == "cpp":
-        extensions = {'.cpp', '.cc', '.cxx', '.hpp', '.hh', '.hxx'}
-    elif language == "ruby":
-        extensions = {'.rb'}
-    elif language == "php":
-        extensions = {'.php'}
-    elif language == "kotlin":
-        extensions = {'.kt', '.kts'}
-    elif language == "swift":
-        extensions = {'.swift'}
-    elif language == "csharp":
-        extensions = {'.cs'}
-    elif language == "scala":
-        extensions = {'.scala', '.sc'}
-    elif language == "lua":
-        extensions = {'.lua'}
-    elif language == "luau":
-        extensions = {'.luau'}
-    elif language == "elixir":
-        extensions = {'.ex', '.exs'}
-    else:
+    extensions = _SCAN_EXTENSIONS.get(language)
+    if extensions is None:
         raise ValueError(f"Unsupported language: {language}")
 
-    for dirpath, dirnames, filenames in os.walk(root):
-        # Skip ignored directories (modifying dirnames in-place prunes os.walk)
-        if respect_ignore and ignore_spec:
-            rel_dir = os.path.relpath(dirpath, root)
-            # Check if current directory should be ignored
-            if rel_dir != '.' and should_ignore(rel_dir + '/', root, ignore_spec):
-                dirnames.clear()  # Don't descend into ignored directories
-                continue
-            # Filter subdirectories
-            dirnames[:] = [
-                d for d in dirnames
-                if not should_ignore(os.path.join(rel_dir, d) + '/', root, ignore_spec)
-            ]
-
-        for filename in filenames:
-            if any(filename.endswith(ext) for ext in extensions):
-                file_path = os.path.join(dirpath, filename)
-                # Check individual file against ignore patterns
-                if respect_ignore and ignore_spec:
-                    rel_path = os.path.relpath(file_path, root)
-                    if should_ignore(rel_path, root, ignore_spec):
-                        continue
-                files.append(file_path)
+    files = _iter_source_files(root, extensions, ignore_spec, walk_workers)
+    if workspace_config is None:
+        yield from files
+        return
+
+    # Apply workspace config filtering: paths are matched relative to root
+    for file_path in files:
+        rel_path = os.path.relpath(file_path, root)
+        if should_include_path(rel_path, workspace_config):
+            yield os.path.join(root, rel_path)
+
+
+def _iter_source_files(
+    root: Path,
+    extensions: tuple[str, ...],
+    ignore_spec=None,
+    workers: int = 1,
+) -> Iterator[str]:
+    """
+    Yield the paths of the files under root that end in one of extensions.
+
+    Files come in os.walk order: a directory's files, then each of its
+    subdirectories in turn. Symlinked directories are not followed. The walk
+    keeps its own stack of os.scandir listings, so each path relative to
+    root is built by appending one name rather than by os.path.relpath.
+
+    Paths matching ignore_spec are skipped. A directory is matched with a
+    trailing slash, so dir-only patterns such as node_modules/ prune the
+    whole subtree instead of it being walked only to have every file
+    dropped.
+
+    With workers > 1 the top-level subdirectories are walked in a thread
+    pool. Listing a directory is a system call that releases the GIL, which
+    pays off when listings are slow, as on network filesystems. The
+    subtrees are still yielded in order.
+    """
+    match = ignore_spec.match_file if ignore_spec else None
+    if workers <= 1:
+        yield from _walk_source_dir(os.fspath(root), "", extensions, match)
+        return
+
+    files, subdirs = _list_source_dir(os.fspath(root), "", extensions, match)
+    yield from files
+    if len(subdirs) < 2:
+        for dir_path, rel_dir in subdirs:
+            yield from _walk_source_dir(dir_path, rel_dir, extensions, match)
+        return
+
+    def walk_subtree(subdir: tuple[str, str]) -> list[str]:
+        return list(_walk_source_dir(*subdir, extensions, match))
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(subdirs))) as executor:
+        for subtree in executor.map(walk_subtree, subdirs):
+            yield from subtree
+
+
+def _walk_source_dir(dir_path: str, rel_dir: str, extensions: tuple[str, ...], match) -> Iterator[str]:
+    """Yield the matching files under one directory, for _iter_source_files."""
+    stack = [(dir_path, rel_dir)]
+    while stack:
+        files, subdirs = _list_source_dir(*stack.pop(), extensions, match)
+        yield from files
+        # Popped in reverse, so subdirectories are walked in listing order
+        stack.extend(reversed(subdirs))
+
+
+def _list_source_dir(
+    dir_path: str, rel_dir: str, extensions: tuple[str, ...], match
+) -> tuple[list[str], list[tuple[str, str]]]:
+    """
+    List one directory for _iter_source_files.
+
+    Returns the matching files in it and the (path, relative path) of each
+    subdirectory to enter.
+    """
+    files = []
+    subdirs = []
+    try:
+        with os.scandir(dir_path) as it:
+            entries = list(it)
+    except OSError:
+        return files, subdirs
+
+    for entry in entries:
+        name = entry.name
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        if is_dir:
+            try:
+                if entry.is_symlink():
+                    continue
+            except OSError:
+                pass
+            rel_path = rel_dir + name + "/"
+            if match is None or not match(rel_path):
+                subdirs.append((entry.path, rel_path))
+        elif name.endswith(extensions):
+            if match is None or not match(rel_dir + name):
+                files.append(entry.path)
+    return files, subdirs
+
+
+# The last Python tree parsed by each thread, as (path, source, tree)
+_last_python_parse = threading.local()
+
+
+def _parse_python(file_path: Path, *markers: bytes) -> ast.Module | None:
+    """
+    Read and parse a Python file.
+
+    If markers are given and the source contains none of them, None is
+    returned without parsing: a file without b"import" has no imports, and
+    one without b"(" has no calls. This skips ast.parse for the empty
+    __init__.py and data-only modules common in Python packages.
+
+    The file is read as bytes and handed to ast.parse undecoded: the parser
+    applies the PEP 263 coding declaration and skips a UTF-8 BOM itself,
+    which saves a text-layer decode and newline translation per file.
+
+    A call-graph job reads a file's imports and then its calls, so the tree
+    from the thread's previous parse is reused when it is for the same path
+    and the source is unchanged. Only one tree per thread is kept; ast trees
+    are too large to hold for a whole project.
+    """
+    source = _job_buffer(file_path)
+    if not isinstance(source, bytes):
+        source = file_path.read_bytes()
+    if markers and not any(marker in source for marker in markers):
+        return None
+    last = getattr(_last_python_parse, "entry", None)
+    if last is not None and last[0] == str(file_path) and last[1] == source:
+        return last[2]
+    tree = ast.parse(source)
+    _last_python_parse.entry = (str(file_path), source, tree)
+    return tree
+
+
+# Nodes that can hold statements: every def, class and import lives in a
+# statement list under one of these
+_STATEMENT_NODES = (ast.stmt, ast.excepthandler, ast.match_case)
+
 
-    # Apply workspace config filtering if provided
-    if workspace_config is not None:
-        # Convert absolute paths to relative for filtering, then back to absolute
-        rel_files = [os.path.relpath(f, root) for f in files]
-        filtered_rel = filter_paths(rel_files, workspace_config)
-        files = [os.path.join(root, f) for f in filtered_rel]
+def _walk_statements(tree: ast.AST) -> Iterator[ast.AST]:
+    """
+    Yield tree and every statement nested in it, in ast.walk order.
 
-    return files
+    Only statement lists are followed (bodies, else branches, except
+    handlers, match cases), so the expressions that make up most of a
+    module's nodes are never visited. Statement lists are homogeneous, so
+    checking the first element of each list field is enough.
+    """
+    todo = deque([tree])
+    while todo:
+        node = todo.popleft()
+        for field_name in node._fields:
+            value = getattr(node, field_name, None)
+            if isinstance(value, list) and value and isinstance(value[0], _STATEMENT_NODES):
+                todo.extend(value)
+        yield node
 
 
 def parse_imports(file_path: str | Path) -> list[dict]:
@@ -384,14 +833,15 @@ def parse_imports(file_path: str | Path) -> list[dict]:
     """
     file_path = Path(file_path)
     try:
-        source = file_path.read_text()
-        tree = ast.parse(source)
+        tree = _parse_python(file_path, b"import")
     except (SyntaxError, FileNotFoundError):
         return []
+    if tree is None:
+        return []
 
     imports = []
 
-    for node in ast.walk(tree):
+    for node in _walk_statements(tree):
         if isinstance(node, ast.Import):
             for alias in node.names:
                 imports.append({
@@ -428,28 +878,28 @@ def parse_ts_imports(file_path: str | Path) -> list[dict]:
     Returns:
         List of import info dicts with keys: module, names, is_default, aliases
     """
-    if not TREE_SITTER_AVAILABLE:
+    if not _has_grammar("typescript"):
         return []
 
     file_path = Path(file_path)
     try:
-        source = file_path.read_bytes()
-        parser = _get_ts_parser()
-        tree = parser.parse(source)
+        source = _read_source(file_path)
+        # A file without the keyword has no import statements to parse
+        if not _has_literal(source, b"import"):
+            return []
+        grammar = _ts_grammar(file_path)
+        tree = _parse_cached(grammar, file_path, source, lambda: _get_ts_parser(grammar))
     except (FileNotFoundError, Exception):
+        _job_bailed()
         return []
 
     imports = []
 
-    def walk_tree(node):
+    for node in _walk_tree(tree.root_node):
         if node.type == "import_statement":
             import_info = _parse_ts_import_node(node, source)
             if import_info:
                 imports.append(import_info)
-        for child in node.children:
-            walk_tree(child)
-
-    walk_tree(tree.root_node)
     return imports
 
 
@@ -512,26 +962,21 @@ def parse_go_imports(file_path: str | Path) -> list[dict]:
     Returns:
         List of import info dicts with keys: module, alias
     """
-    if not TREE_SITTER_GO_AVAILABLE:
+    if not _has_grammar("go"):
         return []
 
     file_path = Path(file_path)
     try:
-        source = file_path.read_bytes()
-        parser = _get_go_parser()
-        tree = parser.parse(source)
+        source = _read_source(file_path)
+        tree = _parse_cached("go", file_path, source, _get_go_parser)
     except (FileNotFoundError, Exception):
+        _job_bailed()
         return []
 
     imports = []
-
-    def walk_tree(node):
+    for node in _walk_tree(tree.root_node):
         if node.type == "import_declaration":
             _parse_go_import_node(node, source, imports)
-        for child in node.children:
-            walk_tree(child)
-
-    walk_tree(tree.root_node)
     return imports
 
 
@@ -576,20 +1021,23 @@ def parse_rust_imports(file_path: str | Path) -> list[dict]:
     Returns:
         List of import info dicts with keys: module, names, is_mod
     """
-    if not TREE_SITTER_RUST_AVAILABLE:
+    if not _has_grammar("rust"):
         return []
 
     file_path = Path(file_path)
     try:
-        source = file_path.read_bytes()
-        parser = _get_rust_parser()
-        tree = parser.parse(source)
+        source = _read_source(file_path)
+        # Use declarations and mod items are both spelled with their keyword
+        if not _has_literal(source, b"use", b"mod"):
+            return []
+        tree = _parse_cached("rust", file_path, source, _get_rust_parser)
     except (FileNotFoundError, Exception):
+        _job_bailed()
         return []
 
     imports = []
 
-    def walk_tree(node):
+    for node in _walk_tree(tree.root_node):
         # Use declarations: use crate::utils::helper;
         if node.type == "use_declaration":
             import_info = _parse_rust_use_node(node, source)
@@ -614,10 +1062,6 @@ def parse_rust_imports(file_path: str | Path) -> list[dict]:
                     'is_mod': True,
                 })
 
-        for child in node.children:
-            walk_tree(child)
-
-    walk_tree(tree.root_node)
     return imports
 
 
@@ -648,16 +1092,14 @@ def _parse_rust_use_node(node, source: bytes) -> dict | None:
         module = text[:-3]
         names = ["*"]
     # Handle grouped imports: use foo::{bar, baz}
-    elif "{" in text:
-        brace_start = text.index("{")
+    elif (brace_start := text.find("{")) != -1:
         module = text[:brace_start].rstrip("::")
         brace_content = text[brace_start+1:text.rindex("}")]
         names = [n.strip() for n in brace_content.split(",")]
     # Handle simple imports: use foo::bar
-    elif "::" in text:
-        parts = text.rsplit("::", 1)
-        module = parts[0]
-        names = [parts[1]]
+    elif (separator := text.rfind("::")) != -1:
+        module = text[:separator]
+        names = [text[separator + 2:]]
 
     return {
         'module': module,
@@ -676,59 +1118,52 @@ def parse_java_imports(file_path: str | Path) -> list[dict]:
     Returns:
         List of import info dicts with keys: module, is_static, is_wildcard
     """
-    if not TREE_SITTER_JAVA_AVAILABLE:
+    if not _has_grammar("java"):
         return []
 
     file_path = Path(file_path)
     try:
-        source = file_path.read_bytes()
-        parser = _get_java_parser()
-        tree = parser.parse(source)
+        source = _read_source(file_path)
+        tree = _parse_cached("java", file_path, source, _get_java_parser)
     except (FileNotFoundError, Exception):
+        _job_bailed()
         return []
 
     imports = []
-
-    def walk_tree(node):
+    for node in _walk_tree(tree.root_node):
         if node.type == "import_declaration":
             import_info = _parse_java_import_node(node, source)
             if import_info:
                 imports.append(import_info)
-        for child in node.children:
-            walk_tree(child)
-
-    walk_tree(tree.root_node)
     return imports
 
 
 def _parse_java_import_node(node, source: bytes) -> dict | None:
     """Parse a single Java import statement."""
-    # Get the full import text
-    text = source[node.start_byte:node.end_byte].decode("utf-8")
-
-    # Check for static import
-    is_static = "static " in text
-
-    # Check for wildcard import
-    is_wildcard = text.rstrip(";").endswith("*")
-
-    # Extract the module path
     # Examples:
     #   import java.util.List;          -> module="java.util.List"
-    #   import java.util.*;             -> module="java.util.*"
+    #   import java.util.*;             -> module="java.util", is_wildcard=True
     #   import static java.lang.Math.PI; -> module="java.lang.Math.PI", is_static=True
 
-    # Find the scoped_identifier or identifier node for the import path
+    # The static keyword, the import path and the wildcard are all children
+    # of the declaration, so one pass over them classifies the import
+    # without decoding the statement and searching its text for each.
     module = None
+    scoped = False
+    is_static = False
+    is_wildcard = False
     for child in node.children:
-        if child.type == "scoped_identifier":
+        if child.type == "static":
+            is_static = True
+        elif child.type == "scoped_identifier":
             module = source[child.start_byte:child.end_byte].decode("utf-8")
-            break
-        elif child.type == "identifier":
+            scoped = True
+        elif child.type == "identifier" and not scoped:
             module = source[child.start_byte:child.end_byte].decode("utf-8")
         elif child.type == "asterisk":
-            # Handle wildcard - module should have been set by scoped_identifier
-            if module:
+            # Only a bare identifier gets the suffix; a scoped path is kept
+            # as the package itself
+            if module and not scoped:
                 module = module + ".*"
             is_wildcard = True
 
@@ -752,15 +1187,16 @@ def parse_kotlin_imports(file_path: str | Path) -> list[dict]:
     Returns:
         List of import info dicts with keys: module, is_wildcard, alias
     """
-    if not TREE_SITTER_KOTLIN_AVAILABLE:
+    if not _has_grammar("kotlin"):
         return []
 
     file_path = Path(file_path)
     try:
-        source = file_path.read_bytes()
+        source = _read_source(file_path)
         parser = _get_kotlin_parser()
         tree = parser.parse(source)
     except (FileNotFoundError, Exception):
+        _job_bailed()
         return []
 
     imports = []
@@ -793,11 +1229,9 @@ def _parse_kotlin_import_node(node, source: bytes) -> dict | None:
     for child in node.children:
         if child.type == "as":
             # The next sibling should be the alias identifier
-            idx = list(node.children).index(child)
-            if idx + 1 < len(node.children):
-                alias_node = node.children[idx + 1]
-                if alias_node.type == "identifier":
-                    alias = source[alias_node.start_byte:alias_node.end_byte].decode("utf-8")
+            alias_node = child.next_sibling
+            if alias_node is not None and alias_node.type == "identifier":
+                alias = source[alias_node.start_byte:alias_node.end_byte].decode("utf-8")
             break
 
     # Extract the module path from qualified_identifier
@@ -853,7 +1287,7 @@ def parse_scala_imports(file_path: str | Path) -> list[dict]:
     Returns:
         List of import info dicts with keys: module, is_wildcard, alias
     """
-    if not TREE_SITTER_SCALA_AVAILABLE:
+    if not _has_grammar("scala"):
         return []
 
     file_path = Path(file_path)
@@ -861,10 +1295,14 @@ def parse_scala_imports(file_path: str | Path) -> list[dict]:
         return []
 
     try:
-        source = file_path.read_bytes()
+        source = _read_source(file_path)
+        # A file without the keyword has no import statements to parse
+        if not _has_literal(source, b"import"):
+            return []
         parser = _get_scala_parser()
         tree = parser.parse(source)
     except (FileNotFoundError, Exception):
+        _job_bailed()
         return []
 
     imports = []
@@ -898,8 +1336,9 @@ def _parse_scala_import_node(node, source: bytes) -> list[dict]:
     # Check for selective imports: import scala.util.{Try, Success, Failure}
     if "{" in text:
         # Split into base path and selectors
-        base_path = text.split("{")[0].rstrip(".")
-        selectors_part = text.split("{")[1].rstrip("}")
+        segments = text.split("{")
+        base_path = segments[0].rstrip(".")
+        selectors_part = segments[1].rstrip("}")
 
         # Parse each selector
         for selector in selectors_part.split(","):
@@ -962,62 +1401,71 @@ def parse_c_imports(file_path: str | Path) -> list[dict]:
     Returns:
         List of import info dicts with keys: module, is_system
     """
-    if not TREE_SITTER_C_AVAILABLE:
+    if not _has_grammar("c"):
         return []
+    return _parse_include_file(Path(file_path), _get_c_parser)
 
-    file_path = Path(file_path)
+
+def parse_cpp_imports(file_path: str | Path) -> list[dict]:
+    """
+    Extract #include statements from a C++ file.
+
+    Args:
+        file_path: Path to C++ file
+
+    Returns:
+        List of import info dicts with keys: module, is_system
+    """
+    if not _has_grammar("cpp"):
+        return []
+    return _parse_include_file(Path(file_path), _get_cpp_parser)
+
+
+def _parse_include_file(file_path: Path, get_parser) -> list[dict]:
+    """Collect #include directives from a C or C++ file; both grammars use preproc_include."""
     try:
-        source = file_path.read_bytes()
-        parser = _get_c_parser()
+        source = _read_source(file_path)
+        parser = get_parser()
         tree = parser.parse(source)
     except (FileNotFoundError, Exception):
+        _job_bailed()
         return []
 
     imports = []
-
-    def walk_tree(node):
+    for node in _walk_tree(tree.root_node):
         if node.type == "preproc_include":
-            import_info = _parse_c_include_node(node, source)
+            import_info = _parse_include_node(node, source)
             if import_info:
                 imports.append(import_info)
-        for child in node.children:
-            walk_tree(child)
 
-    walk_tree(tree.root_node)
     return imports
 
 
-def _parse_c_include_node(node, source: bytes) -> dict | None:
-    """Parse a single C #include statement."""
-    # Get the full include text
-    text = source[node.start_byte:node.end_byte].decode("utf-8")
-
-    # Check for system include <...> vs local include "..."
-    is_system = "<" in text
-
+def _parse_include_node(node, source: bytes) -> dict | None:
+    """Parse a single C/C++ #include statement."""
     # Extract the module path
     # Examples:
     #   #include <stdio.h>        -> module="stdio.h", is_system=True
     #   #include "utils.h"        -> module="utils.h", is_system=False
     #   #include <sys/types.h>    -> module="sys/types.h", is_system=True
 
-    # Find the string_literal or system_lib_string node for the include path
-    module = None
-    for child in node.children:
-        if child.type == "string_literal":
-            # Local include "file.h"
-            module_text = source[child.start_byte:child.end_byte].decode("utf-8")
-            # Strip quotes
-            module = module_text.strip('"')
-            is_system = False
-            break
-        elif child.type == "system_lib_string":
-            # System include <file.h>
-            module_text = source[child.start_byte:child.end_byte].decode("utf-8")
-            # Strip angle brackets
-            module = module_text.strip('<>')
-            is_system = True
-            break
+    # The include path is either a string_literal or a system_lib_string node
+    path_node = node.child_by_field_name("path")
+    if path_node is None:
+        return None
+
+    module_text = source[path_node.start_byte:path_node.end_byte].decode("utf-8")
+    if path_node.type == "string_literal":
+        # Local include "file.h"
+        module = module_text.strip('"')
+        is_system = False
+    elif path_node.type == "system_lib_string":
+        # System include <file.h>
+        module = module_text.strip('<>')
+        is_system = True
+    else:
+        # Macro include like #include HEADER
+        return None
 
     if not module:
         return None
@@ -1028,79 +1476,9 @@ def _parse_c_include_node(node, source: bytes) -> dict | None:
     }
 
 
-def parse_cpp_imports(file_path: str | Path) -> list[dict]:
+def parse_ruby_imports(file_path: str | Path) -> list[dict]:
     """
-    Extract #include statements from a C++ file.
-
-    Args:
-        file_path: Path to C++ file
-
-    Returns:
-        List of import info dicts with keys: module, is_system
-    """
-    if not TREE_SITTER_CPP_AVAILABLE:
-        return []
-
-    file_path = Path(file_path)
-    try:
-        source = file_path.read_bytes()
-        parser = _get_cpp_parser()
-        tree = parser.parse(source)
-    except (FileNotFoundError, Exception):
-        return []
-
-    imports = []
-
-    def walk_tree(node):
-        if node.type == "preproc_include":
-            import_info = _parse_cpp_include_node(node, source)
-            if import_info:
-                imports.append(import_info)
-        for child in node.children:
-            walk_tree(child)
-
-    walk_tree(tree.root_node)
-    return imports
-
-
-def _parse_cpp_include_node(node, source: bytes) -> dict | None:
-    """Parse a single C++ #include statement."""
-    # Get the full include text
-    text = source[node.start_byte:node.end_byte].decode("utf-8")
-
-    # Check for system include <...> vs local include "..."
-    is_system = "<" in text
-
-    # Extract the module path
-    module = None
-    for child in node.children:
-        if child.type == "string_literal":
-            # Local include "file.hpp"
-            module_text = source[child.start_byte:child.end_byte].decode("utf-8")
-            # Strip quotes
-            module = module_text.strip('"')
-            is_system = False
-            break
-        elif child.type == "system_lib_string":
-            # System include <file.h>
-            module_text = source[child.start_byte:child.end_byte].decode("utf-8")
-            # Strip angle brackets
-            module = module_text.strip('<>')
-            is_system = True
-            break
-
-    if not module:
-        return None
-
-    return {
-        'module': module,
-        'is_system': is_system,
-    }
-
-
-def parse_ruby_imports(file_path: str | Path) -> list[dict]:
-    """
-    Extract require statements from a Ruby file.
+    Extract require statements from a Ruby file.
 
     Args:
         file_path: Path to Ruby file
@@ -1110,15 +1488,16 @@ def parse_ruby_imports(file_path: str | Path) -> list[dict]:
         - require 'json' -> module='json', is_relative=False
         - require_relative 'helper' -> module='helper', is_relative=True
     """
-    if not TREE_SITTER_RUBY_AVAILABLE:
+    if not _has_grammar("ruby"):
         return []
 
     file_path = Path(file_path)
     try:
-        source = file_path.read_bytes()
+        source = _read_source(file_path)
         parser = _get_ruby_parser()
         tree = parser.parse(source)
     except (FileNotFoundError, Exception):
+        _job_bailed()
         return []
 
     imports = []
@@ -1179,12 +1558,12 @@ def _parse_ruby_require_node(node, source: bytes) -> dict | None:
 
 def _get_lua_parser():
     """Get or create a tree-sitter Lua parser."""
-    if not TREE_SITTER_LUA_AVAILABLE:
+    if not _has_grammar("lua"):
         raise RuntimeError("tree-sitter-lua not available")
 
-    lua_lang = tree_sitter.Language(tree_sitter_lua.language())
-    parser = tree_sitter.Parser(lua_lang)
-    return parser
+    import tree_sitter
+
+    return tree_sitter.Parser(_language("lua"))
 
 
 def parse_lua_imports(file_path: str | Path) -> list[dict]:
@@ -1198,15 +1577,16 @@ def parse_lua_imports(file_path: str | Path) -> list[dict]:
         List of import info dicts with keys: module, type
         Types: "require", "dofile", "loadfile"
     """
-    if not TREE_SITTER_LUA_AVAILABLE:
+    if not _has_grammar("lua"):
         return []
 
     file_path = Path(file_path)
     try:
-        source = file_path.read_bytes()
+        source = _read_source(file_path)
         parser = _get_lua_parser()
         tree = parser.parse(source)
     except (FileNotFoundError, Exception):
+        _job_bailed()
         return []
 
     imports = []
@@ -1293,22 +1673,14 @@ def _extract_lua_string(node, source: bytes) -> str | None:
 
 
 # Tree-sitter support for Luau
-TREE_SITTER_LUAU_AVAILABLE = False
-try:
-    import tree_sitter_luau
-    TREE_SITTER_LUAU_AVAILABLE = True
-except ImportError:
-    pass
-
-
 def _get_luau_parser():
     """Get or create a tree-sitter Luau parser."""
-    if not TREE_SITTER_LUAU_AVAILABLE:
+    if not _has_grammar("luau"):
         raise RuntimeError("tree-sitter-luau not available")
 
-    luau_lang = tree_sitter.Language(tree_sitter_luau.language())
-    parser = tree_sitter.Parser(luau_lang)
-    return parser
+    import tree_sitter
+
+    return tree_sitter.Parser(_language("luau"))
 
 
 def parse_luau_imports(file_path: str | Path) -> list[dict]:
@@ -1322,15 +1694,16 @@ def parse_luau_imports(file_path: str | Path) -> list[dict]:
         List of import info dicts with keys: module, type
         Types: "require" (for require calls), "service" (for GetService)
     """
-    if not TREE_SITTER_LUAU_AVAILABLE:
+    if not _has_grammar("luau"):
         return []
 
     file_path = Path(file_path)
     try:
-        source = file_path.read_bytes()
+        source = _read_source(file_path)
         parser = _get_luau_parser()
         tree = parser.parse(source)
     except (FileNotFoundError, Exception):
+        _job_bailed()
         return []
 
     imports = []
@@ -1455,15 +1828,16 @@ def parse_elixir_imports(file_path: str | Path) -> list[dict]:
         List of import info dicts with keys: module, type, as (optional)
         Types: "alias", "import", "use", "require"
     """
-    if not TREE_SITTER_ELIXIR_AVAILABLE:
+    if not _has_grammar("elixir"):
         return []
 
     file_path = Path(file_path)
     try:
-        source = file_path.read_bytes()
+        source = _read_source(file_path)
         parser = _get_elixir_parser()
         tree = parser.parse(source)
     except (FileNotFoundError, Exception):
+        _job_bailed()
         return []
 
     imports = []
@@ -1484,10 +1858,9 @@ def parse_elixir_imports(file_path: str | Path) -> list[dict]:
 
 def _get_elixir_parser():
     """Get or create an Elixir tree-sitter parser."""
-    from tree_sitter import Language, Parser
-    parser = Parser()
-    parser.language = Language(tree_sitter_elixir.language())
-    return parser
+    import tree_sitter
+
+    return tree_sitter.Parser(_language("elixir"))
 
 
 def _parse_elixir_import_node(node, source: bytes) -> dict | None:
@@ -1568,15 +1941,16 @@ def parse_php_imports(file_path: str | Path) -> list[dict]:
         List of import info dicts with keys: module, type
         Types: "use", "require", "require_once", "include", "include_once"
     """
-    if not TREE_SITTER_PHP_AVAILABLE:
+    if not _has_grammar("php"):
         return []
 
     file_path = Path(file_path)
     try:
-        source = file_path.read_bytes()
+        source = _read_source(file_path)
         parser = _get_php_parser()
         tree = parser.parse(source)
     except (FileNotFoundError, Exception):
+        _job_bailed()
         return []
 
     imports = []
@@ -1718,15 +2092,16 @@ def parse_swift_imports(file_path: str | Path) -> list[dict]:
         - import Foundation -> module='Foundation', kind=None
         - import struct Foundation.Date -> module='Foundation.Date', kind='struct'
     """
-    if not TREE_SITTER_SWIFT_AVAILABLE:
+    if not _has_grammar("swift"):
         return []
 
     file_path = Path(file_path)
     try:
-        source = file_path.read_bytes()
+        source = _read_source(file_path)
         parser = _get_swift_parser()
         tree = parser.parse(source)
     except (FileNotFoundError, Exception):
+        _job_bailed()
         return []
 
     imports = []
@@ -1806,15 +2181,16 @@ def parse_csharp_imports(file_path: str | Path) -> list[dict]:
         - using Alias = System.Collections; -> module='System.Collections', alias='Alias'
         - global using System; -> module='System', is_global=True
     """
-    if not TREE_SITTER_CSHARP_AVAILABLE:
+    if not _has_grammar("csharp"):
         return []
 
     file_path = Path(file_path)
     try:
-        source = file_path.read_bytes()
+        source = _read_source(file_path)
         parser = _get_csharp_parser()
         tree = parser.parse(source)
     except (FileNotFoundError, Exception):
+        _job_bailed()
         return []
 
     imports = []
@@ -1866,11 +2242,7 @@ def _parse_csharp_using_node(node, source: bytes) -> dict | None:
         elif child.type == "identifier":
             # Check if this is an alias (using Alias = ...)
             # or just a simple namespace
-            next_sibling = None
-            for i, c in enumerate(node.children):
-                if c == child and i + 1 < len(node.children):
-                    next_sibling = node.children[i + 1]
-                    break
+            next_sibling = child.next_sibling
             if next_sibling and next_sibling.type == "=":
                 result['alias'] = source[child.start_byte:child.end_byte].decode("utf-8")
             elif not result['module']:
@@ -1891,7 +2263,9 @@ def _parse_csharp_using_node(node, source: bytes) -> dict | None:
 def build_function_index(
     root: str | Path,
     language: str = "python",
-    workspace_config: Optional[WorkspaceConfig] = None
+    workspace_config: Optional[WorkspaceConfig] = None,
+    parallel: bool = False,
+    max_workers: Optional[int] = None,
 ) -> dict[tuple[str, str], str]:
     """
     Build an index mapping (module_name, function_name) to file paths.
@@ -1900,6 +2274,12 @@ def build_function_index(
         root: Project root directory
         language: "python" or "typescript"
         workspace_config: Optional WorkspaceConfig for monorepo scoping
+        parallel: If True, index the files of tree-sitter languages in a
+                  thread pool. Each file is indexed into its own dict and
+                  merged in scan order, so the result is the same as a
+                  serial build.
+        max_workers: Worker count for parallel indexing
+                     (defaults to os.cpu_count()).
 
     Returns:
         Dict mapping (module, func_name) tuples to relative file paths
@@ -1907,86 +2287,119 @@ def build_function_index(
     root = Path(root)
     index = {}
 
-    for src_file in scan_project(root, language, workspace_config):
-        src_path = Path(src_file)
-        rel_path = src_path.relative_to(root)
-
-        # Derive module name from file path
-        # e.g., pkg/core.py -> pkg.core, utils.ts -> utils
-        module_parts = list(rel_path.parts[:-1]) + [rel_path.stem]
-        module_name = '/'.join(module_parts) if language == "typescript" else '.'.join(module_parts)
-
-        # Also track the simple module name (last component)
-        simple_module = rel_path.stem
-
-        if language == "python":
-            _index_python_file(src_path, rel_path, module_name, simple_module, index)
-        elif language == "typescript":
-            _index_typescript_file(src_path, rel_path, module_name, simple_module, index)
-        elif language == "go":
-            _index_go_file(src_path, rel_path, module_name, simple_module, index)
-        elif language == "rust":
-            _index_rust_file(src_path, rel_path, module_name, simple_module, index)
-        elif language == "java":
-            _index_java_file(src_path, rel_path, module_name, simple_module, index)
-        elif language == "c":
-            _index_c_file(src_path, rel_path, module_name, simple_module, index)
-        elif language == "php":
-            _index_php_file(src_path, rel_path, module_name, simple_module, index)
+    files = scan_project(root, language, workspace_config)
+    index_file = {
+        "python": _index_python_file,
+        "typescript": _index_typescript_file,
+        "go": _index_go_file,
+        "rust": _index_rust_file,
+        "java": _index_java_file,
+        "c": _index_c_file,
+        "cpp": _index_cpp_file,
+        "php": _index_php_file,
+    }.get(language)
+    if index_file is None:
+        return index
+
+    def jobs() -> Iterator[tuple[Path, Path, str, str]]:
+        for src_file in files:
+            src_path = Path(src_file)
+            rel_path = src_path.relative_to(root)
+
+            # Derive module name from file path
+            # e.g., pkg/core.py -> pkg.core, utils.ts -> utils
+            module_parts = list(rel_path.parts[:-1]) + [rel_path.stem]
+            module_name = '/'.join(module_parts) if language == "typescript" else '.'.join(module_parts)
+
+            # Also track the simple module name (last component)
+            simple_module = rel_path.stem
+
+            yield src_path, rel_path, module_name, simple_module
+
+    # ast-based Python indexing holds the GIL, so threads would not help it
+    if not parallel or language == "python" or len(files) < 2:
+        for job in jobs():
+            index_file(*job, index)
+        return index
+
+    def index_one(job) -> dict:
+        file_index = {}
+        index_file(*job, file_index)
+        return file_index
+
+    with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        for file_index in executor.map(index_one, jobs()):
+            index.update(file_index)
 
     return index
 
 
+def _add_to_index(index: dict, rel: str, module_name: str, simple_module: str, separator: str, name: str):
+    """
+    Map a name defined in file rel under both the full and the simple module
+    name: as (module, name) tuples, and as strings joined by the language's
+    separator for convenience.
+    """
+    index[(module_name, name)] = rel
+    index[(simple_module, name)] = rel
+    index[f"{module_name}{separator}{name}"] = rel
+    index[f"{simple_module}{separator}{name}"] = rel
+
+
 def _index_python_file(src_path: Path, rel_path: Path, module_name: str, simple_module: str, index: dict):
     """Index functions and classes from a Python file."""
+    _index_python_definitions(_python_definitions(src_path), str(rel_path), module_name, simple_module, index)
+
+
+def _python_definitions(file_path: Path) -> list[str]:
+    """Return the names of the functions and classes a Python file defines."""
     try:
-        source = src_path.read_text()
-        tree = ast.parse(source)
+        tree = _parse_python(file_path, b"def", b"class")
     except (SyntaxError, FileNotFoundError):
-        return
+        return []
+    if tree is None:
+        return []
+
+    # Definitions are statements, so expression subtrees need not be visited
+    return [
+        node.name
+        for node in _walk_statements(tree)
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef))
+    ]
+
+
+def _index_python_definitions(names: list[str], rel: str, module_name: str, simple_module: str, index: dict):
+    """Add a Python file's function and class names to a function index."""
+    # Classes are tracked too (for instantiation calls)
+    for name in names:
+        _add_to_index(index, rel, module_name, simple_module, ".", name)
 
-    for node in ast.walk(tree):
-        if isinstance(node, ast.FunctionDef) or isinstance(node, ast.AsyncFunctionDef):
-            # Map both full and simple module names
-            index[(module_name, node.name)] = str(rel_path)
-            index[(simple_module, node.name)] = str(rel_path)
-            # Also index with string key for convenience
-            index[f"{module_name}.{node.name}"] = str(rel_path)
-            index[f"{simple_module}.{node.name}"] = str(rel_path)
-        elif isinstance(node, ast.ClassDef):
-            # Track class definitions too (for instantiation calls)
-            index[(module_name, node.name)] = str(rel_path)
-            index[(simple_module, node.name)] = str(rel_path)
-            index[f"{module_name}.{node.name}"] = str(rel_path)
-            index[f"{simple_module}.{node.name}"] = str(rel_path)
+
+# TypeScript declarations that define indexed or called names, matched by a
+# tree-sitter query. Those inside export statements are matched as well.
+_TS_DEFINITION_QUERY = (
+    "[(function_declaration) (method_definition) (class_declaration) (lexical_declaration)] @definition"
+)
 
 
 def _index_typescript_file(src_path: Path, rel_path: Path, module_name: str, simple_module: str, index: dict):
     """Index functions and classes from a TypeScript file."""
-    if not TREE_SITTER_AVAILABLE:
+    if not _has_grammar("typescript"):
         return
 
     try:
-        source = src_path.read_bytes()
-        parser = _get_ts_parser()
-        tree = parser.parse(source)
+        source = _read_source(src_path)
+        grammar = _ts_grammar(src_path)
+        tree = _parse_cached(grammar, src_path, source, lambda: _get_ts_parser(grammar))
     except (FileNotFoundError, Exception):
+        _job_bailed()
         return
 
-    def add_to_index(name: str):
-        """Helper to add a name to the index."""
-        index[(module_name, name)] = str(rel_path)
-        index[(simple_module, name)] = str(rel_path)
-        index[f"{module_name}/{name}"] = str(rel_path)
-        index[f"{simple_module}/{name}"] = str(rel_path)
+    rel = str(rel_path)
 
-    def walk_tree(node):
-        # Handle export statements - look inside them
-        if node.type == "export_statement":
-            for child in node.children:
-                walk_tree(child)
-            return
+    add_to_index = functools.partial(_add_to_index, index, rel, module_name, simple_module, "/")
 
+    for node in _query_nodes(grammar, _TS_DEFINITION_QUERY, tree.root_node):
         # Function declarations
         if node.type in ("function_declaration", "method_definition"):
             name = _get_ts_node_name(node, source)
@@ -2013,11 +2426,6 @@ def _index_typescript_file(src_path: Path, rel_path: Path, module_name: str, sim
             if name:
                 add_to_index(name)
 
-        for child in node.children:
-            walk_tree(child)
-
-    walk_tree(tree.root_node)
-
 
 def _get_ts_node_name(node, source: bytes) -> str | None:
     """Get the name identifier from a TypeScript AST node."""
@@ -2029,24 +2437,21 @@ def _get_ts_node_name(node, source: bytes) -> str | None:
 
 def _index_go_file(src_path: Path, rel_path: Path, module_name: str, simple_module: str, index: dict):
     """Index functions, types, and methods from a Go file."""
-    if not TREE_SITTER_GO_AVAILABLE:
+    if not _has_grammar("go"):
         return
 
     try:
-        source = src_path.read_bytes()
-        parser = _get_go_parser()
-        tree = parser.parse(source)
+        source = _read_source(src_path)
+        tree = _parse_cached("go", src_path, source, _get_go_parser)
     except (FileNotFoundError, Exception):
+        _job_bailed()
         return
 
-    def add_to_index(name: str):
-        """Helper to add a name to the index."""
-        index[(module_name, name)] = str(rel_path)
-        index[(simple_module, name)] = str(rel_path)
-        index[f"{module_name}/{name}"] = str(rel_path)
-        index[f"{simple_module}/{name}"] = str(rel_path)
+    rel = str(rel_path)
 
-    def walk_tree(node):
+    add_to_index = functools.partial(_add_to_index, index, rel, module_name, simple_module, "/")
+
+    for node in _walk_tree(tree.root_node):
         # Function declarations
         if node.type == "function_declaration":
             name = _get_go_node_name(node, source)
@@ -2071,11 +2476,6 @@ def _index_go_file(src_path: Path, rel_path: Path, module_name: str, simple_modu
                     if name:
                         add_to_index(name)
 
-        for child in node.children:
-            walk_tree(child)
-
-    walk_tree(tree.root_node)
-
 
 def _get_go_node_name(node, source: bytes) -> str | None:
     """Get the name identifier from a Go AST node."""
@@ -2103,26 +2503,30 @@ def _get_go_receiver_type(node, source: bytes) -> str | None:
     return None
 
 
+# Rust items that define indexed or called names, matched by a tree-sitter
+# query. Methods are matched both on their own and through their impl block.
+_RUST_DEFINITION_QUERY = (
+    "[(function_item) (struct_item) (enum_item) (trait_item) (impl_item)] @definition"
+)
+
+
 def _index_rust_file(src_path: Path, rel_path: Path, module_name: str, simple_module: str, index: dict):
     """Index functions, structs, and impl blocks from a Rust file."""
-    if not TREE_SITTER_RUST_AVAILABLE:
+    if not _has_grammar("rust"):
         return
 
     try:
-        source = src_path.read_bytes()
-        parser = _get_rust_parser()
-        tree = parser.parse(source)
+        source = _read_source(src_path)
+        tree = _parse_cached("rust", src_path, source, _get_rust_parser)
     except (FileNotFoundError, Exception):
+        _job_bailed()
         return
 
-    def add_to_index(name: str):
-        """Helper to add a name to the index."""
-        index[(module_name, name)] = str(rel_path)
-        index[(simple_module, name)] = str(rel_path)
-        index[f"{module_name}.{name}"] = str(rel_path)
-        index[f"{simple_module}.{name}"] = str(rel_path)
+    rel = str(rel_path)
 
-    def walk_tree(node):
+    add_to_index = functools.partial(_add_to_index, index, rel, module_name, simple_module, ".")
+
+    for node in _query_nodes("rust", _RUST_DEFINITION_QUERY, tree.root_node):
         # Function definitions
         if node.type == "function_item":
             name = _get_rust_node_name(node, source)
@@ -2166,11 +2570,6 @@ def _index_rust_file(src_path: Path, rel_path: Path, module_name: str, simple_mo
                                 if type_name:
                                     add_to_index(f"{type_name}::{method_name}")
 
-        for child in node.children:
-            walk_tree(child)
-
-    walk_tree(tree.root_node)
-
 
 def _get_rust_node_name(node, source: bytes) -> str | None:
     """Get the name identifier from a Rust AST node."""
@@ -2184,40 +2583,26 @@ def _get_rust_node_name(node, source: bytes) -> str | None:
 
 def _index_java_file(src_path: Path, rel_path: Path, module_name: str, simple_module: str, index: dict):
     """Index methods and classes from a Java file."""
-    if not TREE_SITTER_JAVA_AVAILABLE:
+    if not _has_grammar("java"):
         return
 
     try:
-        source = src_path.read_bytes()
-        parser = _get_java_parser()
-        tree = parser.parse(source)
+        source = _read_source(src_path)
+        tree = _parse_cached("java", src_path, source, _get_java_parser)
     except (FileNotFoundError, Exception):
+        _job_bailed()
         return
 
-    def add_to_index(name: str):
-        """Helper to add a name to the index."""
-        index[(module_name, name)] = str(rel_path)
-        index[(simple_module, name)] = str(rel_path)
-        index[f"{module_name}.{name}"] = str(rel_path)
-        index[f"{simple_module}.{name}"] = str(rel_path)
+    rel = str(rel_path)
 
-    current_class = None
-
-    def walk_tree(node):
-        nonlocal current_class
+    add_to_index = functools.partial(_add_to_index, index, rel, module_name, simple_module, ".")
 
+    for node, current_class in _walk_java_tree(tree.root_node, source):
         # Class declarations
         if node.type == "class_declaration":
             class_name = _get_java_node_name(node, source)
             if class_name:
                 add_to_index(class_name)
-                old_class = current_class
-                current_class = class_name
-                # Process class body
-                for child in node.children:
-                    walk_tree(child)
-                current_class = old_class
-                return  # Already processed children
 
         # Interface declarations
         elif node.type == "interface_declaration":
@@ -2240,11 +2625,6 @@ def _index_java_file(src_path: Path, rel_path: Path, module_name: str, simple_mo
             if name:
                 add_to_index(name)
 
-        for child in node.children:
-            walk_tree(child)
-
-    walk_tree(tree.root_node)
-
 
 def _get_java_node_name(node, source: bytes) -> str | None:
     """Get the name identifier from a Java AST node."""
@@ -2254,73 +2634,137 @@ def _get_java_node_name(node, source: bytes) -> str | None:
     return None
 
 
+def _walk_java_tree(node, source: bytes) -> Iterator[tuple]:
+    """
+    Yield (node, enclosing class name) for node and its descendants in pre-order.
+
+    Methods are keyed as Class.method using the innermost named class, so
+    the class context travels with each node on an explicit stack rather
+    than through recursive calls.
+    """
+    stack = [(node, None)]
+    while stack:
+        node, current_class = stack.pop()
+        yield node, current_class
+        if node.type == "class_declaration":
+            current_class = _get_java_node_name(node, source) or current_class
+        stack.extend((child, current_class) for child in reversed(node.children))
+
+
 def _index_c_file(src_path: Path, rel_path: Path, module_name: str, simple_module: str, index: dict):
     """Index functions from a C file."""
-    if not TREE_SITTER_C_AVAILABLE:
+    if not _has_grammar("c"):
         return
 
     try:
-        source = src_path.read_bytes()
+        source = _read_source(src_path)
+        # Definitions and calls both need a '(': skip declaration-only files
+        if not _has_literal(source, b"("):
+            return
         parser = _get_c_parser()
         tree = parser.parse(source)
     except (FileNotFoundError, Exception):
+        _job_bailed()
         return
 
-    def add_to_index(name: str):
-        """Helper to add a name to the index."""
-        index[(module_name, name)] = str(rel_path)
-        index[(simple_module, name)] = str(rel_path)
-        index[f"{module_name}.{name}"] = str(rel_path)
-        index[f"{simple_module}.{name}"] = str(rel_path)
+    rel = str(rel_path)
 
-    def walk_tree(node):
+    add_to_index = functools.partial(_add_to_index, index, rel, module_name, simple_module, ".")
+
+    for node in _walk_tree(tree.root_node):
         # Function definitions
         if node.type == "function_definition":
             name = _get_c_node_name(node, source)
             if name:
                 add_to_index(name)
 
-        for child in node.children:
-            walk_tree(child)
-
-    walk_tree(tree.root_node)
-
 
 def _get_c_node_name(node, source: bytes) -> str | None:
     """Get the function name from a C function_definition node."""
-    for child in node.children:
-        if child.type == "function_declarator":
-            for dc in child.children:
-                if dc.type == "identifier":
-                    return source[dc.start_byte:dc.end_byte].decode("utf-8")
-        elif child.type == "pointer_declarator":
-            # Pointer return type like int* func()
-            for pc in child.children:
-                if pc.type == "function_declarator":
-                    for dc in pc.children:
-                        if dc.type == "identifier":
-                            return source[dc.start_byte:dc.end_byte].decode("utf-8")
-    return None
+    declarator = node.child_by_field_name("declarator")
+    if declarator is not None and declarator.type == "pointer_declarator":
+        # Pointer return type like int* func()
+        declarator = declarator.child_by_field_name("declarator")
+    if declarator is None or declarator.type != "function_declarator":
+        return None
+    name_node = declarator.child_by_field_name("declarator")
+    if name_node is None or name_node.type != "identifier":
+        return None
+    return source[name_node.start_byte:name_node.end_byte].decode("utf-8")
+
+
+def _index_cpp_file(src_path: Path, rel_path: Path, module_name: str, simple_module: str, index: dict):
+    """Index functions and methods from a C++ file."""
+    if not _has_grammar("cpp"):
+        return
+
+    try:
+        source = _read_source(src_path)
+        # Definitions and calls both need a '(': skip declaration-only files
+        if not _has_literal(source, b"("):
+            return
+        parser = _get_cpp_parser()
+        tree = parser.parse(source)
+    except (FileNotFoundError, Exception):
+        _job_bailed()
+        return
+
+    rel = str(rel_path)
+
+    add_to_index = functools.partial(_add_to_index, index, rel, module_name, simple_module, ".")
+
+    for node in _walk_tree(tree.root_node):
+        # Free functions, out-of-line methods (Foo::bar) and inline methods
+        if node.type == "function_definition":
+            name = _get_cpp_node_name(node, source)
+            if name:
+                add_to_index(name)
+
+
+def _get_cpp_node_name(node, source: bytes) -> str | None:
+    """
+    Get the function name from a C++ function_definition node.
+
+    Qualified definitions (ns::Foo::bar) and in-class methods are reduced to
+    their final name, matching how call sites are reported.
+    """
+    declarator = node.child_by_field_name("declarator")
+    # Pointer/reference return types wrap the function declarator
+    while declarator is not None and declarator.type in ("pointer_declarator", "reference_declarator"):
+        if declarator.type == "pointer_declarator":
+            declarator = declarator.child_by_field_name("declarator")
+        else:
+            declarator = declarator.named_children[-1] if declarator.named_children else None
+    if declarator is None or declarator.type != "function_declarator":
+        return None
+    return _get_cpp_callable_name(declarator.child_by_field_name("declarator"), source)
+
+
+def _get_cpp_callable_name(node, source: bytes) -> str | None:
+    """Final name of an identifier, field/qualified identifier or template function."""
+    while node is not None and node.type in ("qualified_identifier", "template_function"):
+        node = node.child_by_field_name("name")
+    if node is None or node.type not in ("identifier", "field_identifier"):
+        return None
+    return source[node.start_byte:node.end_byte].decode("utf-8")
 
 
 def _index_php_file(src_path: Path, rel_path: Path, module_name: str, simple_module: str, index: dict):
     """Index functions, classes, and methods from a PHP file."""
-    if not TREE_SITTER_PHP_AVAILABLE:
+    if not _has_grammar("php"):
         return
 
     try:
-        source = src_path.read_bytes()
+        source = _read_source(src_path)
         parser = _get_php_parser()
         tree = parser.parse(source)
     except (FileNotFoundError, Exception):
+        _job_bailed()
         return
 
-    def add_to_index(name: str):
-        """Helper to add a name to the index."""
-        index[(module_name, name)] = str(rel_path)
-        index[(simple_module, name)] = str(rel_path)
-        index[f"{module_name}\\{name}"] = str(rel_path)
-        index[f"{simple_module}\\{name}"] = str(rel_path)
+    rel = str(rel_path)
+
+    add_to_index = functools.partial(_add_to_index, index, rel, module_name, simple_module, "\\")
 
     current_class = None
     namespace = None
@@ -2347,8 +2791,8 @@ def _index_php_file(src_path: Path, rel_path: Path, module_name: str, simple_mod
                 if namespace:
                     # Also index with full namespace
                     full_name = f"{namespace}\\{class_name}"
-                    index[(namespace, class_name)] = str(rel_path)
-                    index[full_name] = str(rel_path)
+                    index[(namespace, class_name)] = rel
+                    index[full_name] = rel
                 old_class = current_class
                 current_class = class_name
                 # Process class body
@@ -2377,7 +2821,7 @@ def _index_php_file(src_path: Path, rel_path: Path, module_name: str, simple_mod
                 # Also index as Class.method if we have a class context
                 if current_class:
                     add_to_index(f"{current_class}::{name}")
-                    index[(current_class, name)] = str(rel_path)
+                    index[(current_class, name)] = rel
 
         # Function definitions (top-level)
         elif node.type == "function_definition":
@@ -2479,43 +2923,46 @@ def _extract_file_calls(file_path: Path, root: Path) -> dict[str, list[tuple[str
         call_type is 'direct', 'attr', or 'intra'
     """
     try:
-        source = file_path.read_text()
-        tree = ast.parse(source)
+        tree = _parse_python(file_path, b"(")
     except (SyntaxError, FileNotFoundError):
         return {}
+    if tree is None:
+        return {}
 
     calls_by_func = {}
 
-    # Collect all function names defined in this file (for intra-file calls)
+    # Collect all function names defined in this file (for intra-file calls),
+    # keeping the function nodes so their bodies needn't be found again
     defined_funcs = set()
     defined_classes = set()
-    for node in ast.walk(tree):
+    func_nodes = []
+    for node in _walk_statements(tree):
         if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
             defined_funcs.add(node.name)
+            func_nodes.append(node)
         elif isinstance(node, ast.ClassDef):
             defined_classes.add(node.name)
 
-    for node in ast.walk(tree):
-        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-            visitor = CallVisitor(defined_funcs=defined_funcs)
-            visitor.visit(node)
+    for node in func_nodes:
+        visitor = CallVisitor(defined_funcs=defined_funcs)
+        visitor.visit(node)
 
-            calls = []
-            for call in visitor.calls:
-                if call in defined_funcs or call in defined_classes:
-                    calls.append(('intra', call))
-                else:
-                    calls.append(('direct', call))
+        calls = []
+        for call in visitor.calls:
+            if call in defined_funcs or call in defined_classes:
+                calls.append(('intra', call))
+            else:
+                calls.append(('direct', call))
 
-            for obj, method in visitor.attr_calls:
-                calls.append(('attr', f"{obj}.{method}"))
+        for obj, method in visitor.attr_calls:
+            calls.append(('attr', f"{obj}.{method}"))
 
-            # Add function references (higher-order usage)
-            for ref in visitor.refs:
-                if ref in defined_funcs:
-                    calls.append(('ref', ref))
+        # Add function references (higher-order usage)
+        for ref in visitor.refs:
+            if ref in defined_funcs:
+                calls.append(('ref', ref))
 
-            calls_by_func[node.name] = calls
+        calls_by_func[node.name] = calls
 
     # Also scan module-level code for function calls and references
     # This catches: COMMANDS = {"key": func}, if __name__ == "__main__", etc.
@@ -2547,6 +2994,19 @@ def _extract_file_calls(file_path: Path, root: Path) -> dict[str, list[tuple[str
     return calls_by_func
 
 
+def _extract_python_file_calls(file_path: Path, root: Path) -> tuple[dict[str, list[tuple[str, str]]], list[str]]:
+    """
+    Extract a Python file's calls along with the names it defines.
+
+    Both come from one parse: _python_definitions reuses the tree that
+    _extract_file_calls left in the thread's parse cache.
+    """
+    return _extract_file_calls(file_path, root), _python_definitions(file_path)
+
+
+_TS_CALL_QUERY = "(call_expression) @call"
+
+
 def _extract_ts_file_calls(file_path: Path, root: Path) -> dict[str, list[tuple[str, str]]]:
     """
     Extract all function calls from a TypeScript file, grouped by caller function.
@@ -2555,89 +3015,43 @@ def _extract_ts_file_calls(file_path: Path, root: Path) -> dict[str, list[tuple[
         Dict mapping caller function name to list of (call_type, call_target) tuples
         call_type is 'direct', 'attr', or 'intra'
     """
-    if not TREE_SITTER_AVAILABLE:
+    if not _has_grammar("typescript"):
         return {}
 
     try:
-        source = file_path.read_bytes()
-        parser = _get_ts_parser()
-        tree = parser.parse(source)
+        source = _read_source(file_path)
+        grammar = _ts_grammar(file_path)
+        tree = _parse_cached(grammar, file_path, source, lambda: _get_ts_parser(grammar))
     except (FileNotFoundError, Exception):
+        _job_bailed()
         return {}
 
     calls_by_func = {}
     defined_names = set()
 
-    # First pass: collect all defined function/class names
-    def collect_definitions(node):
-        if node.type in ("function_declaration", "class_declaration"):
+    # Collect the defined function/class names and the functions whose calls
+    # are extracted in one pass. Call classification needs every defined
+    # name, so the calls are extracted once all declarations are seen.
+    functions = []
+    for node in _query_nodes(grammar, _TS_DEFINITION_QUERY, tree.root_node):
+        if node.type == "function_declaration":
             name = _get_ts_node_name(node, source)
             if name:
                 defined_names.add(name)
-        elif node.type == "lexical_declaration":
-            for child in node.children:
-                if child.type == "variable_declarator":
-                    for vc in child.children:
-                        if vc.type == "identifier":
-                            defined_names.add(source[vc.start_byte:vc.end_byte].decode("utf-8"))
-                            break
-        for child in node.children:
-            collect_definitions(child)
-
-    collect_definitions(tree.root_node)
-
-    # Second pass: extract calls from each function
-    def extract_calls_from_func(func_node, func_name: str):
-        calls = []
+                functions.append((name, node))
 
-        def visit_calls(node):
-            if node.type == "call_expression":
-                # Get the callee
+        elif node.type == "class_declaration":
+            class_name = _get_ts_node_name(node, source)
+            if class_name:
+                defined_names.add(class_name)
+                # Process methods
                 for child in node.children:
-                    if child.type == "identifier":
-                        callee = source[child.start_byte:child.end_byte].decode("utf-8")
-                        if callee in defined_names:
-                            calls.append(('intra', callee))
-                        else:
-                            calls.append(('direct', callee))
-                        break
-                    elif child.type == "member_expression":
-                        # obj.method() call
-                        obj_name = None
-                        obj_is_this = False
-                        method_name = None
-                        for mc in child.children:
-                            if mc.type == "this":
-                                obj_is_this = True
-                            elif mc.type == "identifier" and obj_name is None:
-                                obj_name = source[mc.start_byte:mc.end_byte].decode("utf-8")
-                            elif mc.type == "property_identifier":
-                                method_name = source[mc.start_byte:mc.end_byte].decode("utf-8")
-
-                        if obj_is_this and method_name:
-                            # this.method() - treat as intra-file call to the method
-                            calls.append(('intra', method_name))
-                        elif obj_name and method_name:
-                            calls.append(('attr', f"{obj_name}.{method_name}"))
-                        break
-
-            for child in node.children:
-                visit_calls(child)
-
-        visit_calls(func_node)
-        return calls
-
-    def process_functions(node):
-        # Handle export statements - look inside them
-        if node.type == "export_statement":
-            for child in node.children:
-                process_functions(child)
-            return
-
-        if node.type == "function_declaration":
-            name = _get_ts_node_name(node, source)
-            if name:
-                calls_by_func[name] = extract_calls_from_func(node, name)
+                    if child.type == "class_body":
+                        for body_child in child.children:
+                            if body_child.type == "method_definition":
+                                method_name = _get_ts_node_name(body_child, source)
+                                if method_name:
+                                    functions.append((f"{class_name}.{method_name}", body_child))
 
         elif node.type == "lexical_declaration":
             # Handle arrow functions: const foo = () => {}
@@ -2647,32 +3061,68 @@ def _extract_ts_file_calls(file_path: Path, root: Path) -> dict[str, list[tuple[
                     arrow_node = None
                     for vc in child.children:
                         if vc.type == "identifier":
-                            name = source[vc.start_byte:vc.end_byte].decode("utf-8")
+                            vc_name = source[vc.start_byte:vc.end_byte].decode("utf-8")
+                            if name is None:
+                                defined_names.add(vc_name)
+                            name = vc_name
                         elif vc.type == "arrow_function":
                             arrow_node = vc
                     if name and arrow_node:
-                        calls_by_func[name] = extract_calls_from_func(arrow_node, name)
+                        functions.append((name, arrow_node))
 
-        elif node.type == "class_declaration":
-            class_name = _get_ts_node_name(node, source)
-            if class_name:
-                # Process methods
-                for child in node.children:
-                    if child.type == "class_body":
-                        for body_child in child.children:
-                            if body_child.type == "method_definition":
-                                method_name = _get_ts_node_name(body_child, source)
-                                if method_name:
-                                    full_name = f"{class_name}.{method_name}"
-                                    calls_by_func[full_name] = extract_calls_from_func(body_child, full_name)
+    # Extract the calls made in a function body
+    def extract_calls_from_func(func_node, func_name: str):
+        calls = []
 
-        for child in node.children:
-            process_functions(child)
+        for node in _query_nodes(grammar, _TS_CALL_QUERY, func_node):
+            # Get the callee
+            for child in node.children:
+                if child.type == "identifier":
+                    callee = source[child.start_byte:child.end_byte].decode("utf-8")
+                    if callee in defined_names:
+                        calls.append(('intra', callee))
+                    else:
+                        calls.append(('direct', callee))
+                    break
+                elif child.type == "member_expression":
+                    # obj.method() call
+                    obj_node = None
+                    obj_is_this = False
+                    method_node = None
+                    for mc in child.children:
+                        if mc.type == "this":
+                            obj_is_this = True
+                        elif mc.type == "identifier" and obj_node is None:
+                            obj_node = mc
+                        elif mc.type == "property_identifier":
+                            method_node = mc
+
+                    # Decode only the nodes that are used, once each
+                    obj_name = method_name = None
+                    if method_node is not None:
+                        method_name = source[method_node.start_byte:method_node.end_byte].decode("utf-8")
+                    if obj_node is not None and not obj_is_this:
+                        obj_name = source[obj_node.start_byte:obj_node.end_byte].decode("utf-8")
+
+                    if obj_is_this and method_name:
+                        # this.method() - treat as intra-file call to the method
+                        calls.append(('intra', method_name))
+                    elif obj_name and method_name:
+                        calls.append(('attr', f"{obj_name}.{method_name}"))
+                    break
 
-    process_functions(tree.root_node)
+        return calls
+
+    for name, node in functions:
+        calls_by_func[name] = extract_calls_from_func(node, name)
     return calls_by_func
 
 
+# Nodes the Go call extraction looks at, matched by tree-sitter queries
+_GO_DECLARATION_QUERY = "[(function_declaration) (method_declaration) (type_declaration)] @declaration"
+_GO_CALL_QUERY = "(call_expression) @call"
+
+
 def _extract_go_file_calls(file_path: Path, root: Path) -> dict[str, list[tuple[str, str]]]:
     """
     Extract all function calls from a Go file, grouped by caller function.
@@ -2681,21 +3131,23 @@ def _extract_go_file_calls(file_path: Path, root: Path) -> dict[str, list[tuple[
         Dict mapping caller function name to list of (call_type, call_target) tuples
         call_type is 'direct', 'attr', or 'intra'
     """
-    if not TREE_SITTER_GO_AVAILABLE:
+    if not _has_grammar("go"):
         return {}
 
     try:
-        source = file_path.read_bytes()
-        parser = _get_go_parser()
-        tree = parser.parse(source)
+        source = _read_source(file_path)
+        tree = _parse_cached("go", file_path, source, _get_go_parser)
     except (FileNotFoundError, Exception):
+        _job_bailed()
         return {}
 
     calls_by_func = {}
     defined_names = set()
 
+    declarations = _query_nodes("go", _GO_DECLARATION_QUERY, tree.root_node)
+
     # First pass: collect all defined function/type names
-    def collect_definitions(node):
+    for node in declarations:
         if node.type == "function_declaration":
             name = _get_go_node_name(node, source)
             if name:
@@ -2710,49 +3162,40 @@ def _extract_go_file_calls(file_path: Path, root: Path) -> dict[str, list[tuple[
                     name = _get_go_node_name(child, source)
                     if name:
                         defined_names.add(name)
-        for child in node.children:
-            collect_definitions(child)
-
-    collect_definitions(tree.root_node)
 
     # Second pass: extract calls from each function
     def extract_calls_from_func(func_node, func_name: str):
         calls = []
 
-        def visit_calls(node):
-            if node.type == "call_expression":
-                # Get the callee - first child is the function being called
-                func_child = node.children[0] if node.children else None
-                if func_child:
-                    if func_child.type == "identifier":
-                        callee = source[func_child.start_byte:func_child.end_byte].decode("utf-8")
-                        if callee in defined_names:
-                            calls.append(('intra', callee))
+        for node in _query_nodes("go", _GO_CALL_QUERY, func_node):
+            # Get the callee - first child is the function being called
+            func_child = node.children[0] if node.children else None
+            if func_child:
+                if func_child.type == "identifier":
+                    callee = source[func_child.start_byte:func_child.end_byte].decode("utf-8")
+                    if callee in defined_names:
+                        calls.append(('intra', callee))
+                    else:
+                        calls.append(('direct', callee))
+                elif func_child.type == "selector_expression":
+                    # pkg.Func() or obj.Method() call
+                    parts = []
+                    for sc in func_child.children:
+                        if sc.type == "identifier":
+                            parts.append(source[sc.start_byte:sc.end_byte].decode("utf-8"))
+                        elif sc.type == "field_identifier":
+                            parts.append(source[sc.start_byte:sc.end_byte].decode("utf-8"))
+                    if len(parts) >= 2:
+                        obj, method = parts[0], parts[-1]
+                        # Check if method is defined locally
+                        if method in defined_names:
+                            calls.append(('intra', method))
                         else:
-                            calls.append(('direct', callee))
-                    elif func_child.type == "selector_expression":
-                        # pkg.Func() or obj.Method() call
-                        parts = []
-                        for sc in func_child.children:
-                            if sc.type == "identifier":
-                                parts.append(source[sc.start_byte:sc.end_byte].decode("utf-8"))
-                            elif sc.type == "field_identifier":
-                                parts.append(source[sc.start_byte:sc.end_byte].decode("utf-8"))
-                        if len(parts) >= 2:
-                            obj, method = parts[0], parts[-1]
-                            # Check if method is defined locally
-                            if method in defined_names:
-                                calls.append(('intra', method))
-                            else:
-                                calls.append(('attr', f"{obj}.{method}"))
-
-            for child in node.children:
-                visit_calls(child)
+                            calls.append(('attr', f"{obj}.{method}"))
 
-        visit_calls(func_node)
         return calls
 
-    def process_functions(node):
+    for node in declarations:
         if node.type == "function_declaration":
             name = _get_go_node_name(node, source)
             if name:
@@ -2765,13 +3208,12 @@ def _extract_go_file_calls(file_path: Path, root: Path) -> dict[str, list[tuple[
                 full_name = f"{receiver_type}.{name}" if receiver_type else name
                 calls_by_func[full_name] = extract_calls_from_func(node, full_name)
 
-        for child in node.children:
-            process_functions(child)
-
-    process_functions(tree.root_node)
     return calls_by_func
 
 
+_RUST_CALL_QUERY = "(call_expression) @call"
+
+
 def _extract_rust_file_calls(file_path: Path, root: Path) -> dict[str, list[tuple[str, str]]]:
     """
     Extract all function calls from a Rust file, grouped by caller function.
@@ -2780,94 +3222,33 @@ def _extract_rust_file_calls(file_path: Path, root: Path) -> dict[str, list[tupl
         Dict mapping caller function name to list of (call_type, call_target) tuples
         call_type is 'direct', 'attr', or 'intra'
     """
-    if not TREE_SITTER_RUST_AVAILABLE:
+    if not _has_grammar("rust"):
         return {}
 
     try:
-        source = file_path.read_bytes()
-        parser = _get_rust_parser()
-        tree = parser.parse(source)
+        source = _read_source(file_path)
+        tree = _parse_cached("rust", file_path, source, _get_rust_parser)
     except (FileNotFoundError, Exception):
+        _job_bailed()
         return {}
 
     calls_by_func = {}
-    defined_names = set()
-
-    # First pass: collect all defined function/struct names
-    def collect_definitions(node):
-        if node.type == "function_item":
-            name = _get_rust_node_name(node, source)
-            if name:
-                defined_names.add(name)
-        elif node.type in ("struct_item", "enum_item", "trait_item"):
-            name = _get_rust_node_name(node, source)
-            if name:
-                defined_names.add(name)
-        elif node.type == "impl_item":
-            # Collect method names from impl blocks
-            for child in node.children:
-                if child.type == "declaration_list":
-                    for item in child.children:
-                        if item.type == "function_item":
-                            name = _get_rust_node_name(item, source)
-                            if name:
-                                defined_names.add(name)
-        for child in node.children:
-            collect_definitions(child)
-
-    collect_definitions(tree.root_node)
-
-    # Second pass: extract calls from each function
-    def extract_calls_from_func(func_node, func_name: str):
-        calls = []
-
-        def visit_calls(node):
-            if node.type == "call_expression":
-                # Get the callee
-                for child in node.children:
-                    if child.type == "identifier":
-                        callee = source[child.start_byte:child.end_byte].decode("utf-8")
-                        if callee in defined_names:
-                            calls.append(('intra', callee))
-                        else:
-                            calls.append(('direct', callee))
-                        break
-                    elif child.type == "scoped_identifier":
-                        # Path call: module::func() or Type::method()
-                        text = source[child.start_byte:child.end_byte].decode("utf-8")
-                        # Get the last segment as the function name
-                        if "::" in text:
-                            parts = text.rsplit("::", 1)
-                            func = parts[1]
-                            if func in defined_names:
-                                calls.append(('intra', func))
-                            else:
-                                calls.append(('attr', text))
-                        break
-                    elif child.type == "field_expression":
-                        # Method call: obj.method()
-                        method_name = None
-                        for fc in child.children:
-                            if fc.type == "field_identifier":
-                                method_name = source[fc.start_byte:fc.end_byte].decode("utf-8")
-                        if method_name:
-                            if method_name in defined_names:
-                                calls.append(('intra', method_name))
-                            else:
-                                calls.append(('attr', f"self.{method_name}"))
-                        break
-
-            for child in node.children:
-                visit_calls(child)
-
-        visit_calls(func_node)
-        return calls
+    defined_names = set()
 
-    def process_functions(node):
+    # Collect the defined function/struct names and the functions whose calls
+    # are extracted in one pass; calls are extracted once every name is known
+    functions = []
+    for node in _query_nodes("rust", _RUST_DEFINITION_QUERY, tree.root_node):
         if node.type == "function_item":
             name = _get_rust_node_name(node, source)
             if name:
-                calls_by_func[name] = extract_calls_from_func(node, name)
+                defined_names.add(name)
+                functions.append((name, node))
+
+        elif node.type in ("struct_item", "enum_item", "trait_item"):
+            name = _get_rust_node_name(node, source)
+            if name:
+                defined_names.add(name)
 
         elif node.type == "impl_item":
             type_name = None
@@ -2876,22 +3257,69 @@ def _extract_rust_file_calls(file_path: Path, root: Path) -> dict[str, list[tupl
                     type_name = source[child.start_byte:child.end_byte].decode("utf-8")
                     break
 
+            # Collect method names from impl blocks
             for child in node.children:
                 if child.type == "declaration_list":
                     for item in child.children:
                         if item.type == "function_item":
                             method_name = _get_rust_node_name(item, source)
                             if method_name:
+                                defined_names.add(method_name)
                                 full_name = f"{type_name}.{method_name}" if type_name else method_name
-                                calls_by_func[full_name] = extract_calls_from_func(item, full_name)
+                                functions.append((full_name, item))
 
-        for child in node.children:
-            process_functions(child)
+    # Extract the calls made in a function body
+    def extract_calls_from_func(func_node, func_name: str):
+        calls = []
 
-    process_functions(tree.root_node)
+        for node in _query_nodes("rust", _RUST_CALL_QUERY, func_node):
+            # Get the callee
+            for child in node.children:
+                if child.type == "identifier":
+                    callee = source[child.start_byte:child.end_byte].decode("utf-8")
+                    if callee in defined_names:
+                        calls.append(('intra', callee))
+                    else:
+                        calls.append(('direct', callee))
+                    break
+                elif child.type == "scoped_identifier":
+                    # Path call: module::func() or Type::method()
+                    text = source[child.start_byte:child.end_byte].decode("utf-8")
+                    # Get the last segment as the function name
+                    separator = text.rfind("::")
+                    if separator != -1:
+                        func = text[separator + 2:]
+                        if func in defined_names:
+                            calls.append(('intra', func))
+                        else:
+                            calls.append(('attr', text))
+                    break
+                elif child.type == "field_expression":
+                    # Method call: obj.method()
+                    method_node = None
+                    for fc in child.children:
+                        if fc.type == "field_identifier":
+                            method_node = fc
+                    method_name = None
+                    if method_node is not None:
+                        method_name = source[method_node.start_byte:method_node.end_byte].decode("utf-8")
+                    if method_name:
+                        if method_name in defined_names:
+                            calls.append(('intra', method_name))
+                        else:
+                            calls.append(('attr', f"self.{method_name}"))
+                    break
+
+        return calls
+
+    for name, node in functions:
+        calls_by_func[name] = extract_calls_from_func(node, name)
     return calls_by_func
 
 
+_JAVA_CALL_QUERY = "[(method_invocation) (object_creation_expression)] @call"
+
+
 def _extract_java_file_calls(file_path: Path, root: Path) -> dict[str, list[tuple[str, str]]]:
     """
     Extract all method calls from a Java file, grouped by caller method.
@@ -2900,34 +3328,25 @@ def _extract_java_file_calls(file_path: Path, root: Path) -> dict[str, list[tupl
         Dict mapping caller method name to list of (call_type, call_target) tuples
         call_type is 'direct', 'attr', or 'intra'
     """
-    if not TREE_SITTER_JAVA_AVAILABLE:
+    if not _has_grammar("java"):
         return {}
 
     try:
-        source = file_path.read_bytes()
-        parser = _get_java_parser()
-        tree = parser.parse(source)
+        source = _read_source(file_path)
+        tree = _parse_cached("java", file_path, source, _get_java_parser)
     except (FileNotFoundError, Exception):
+        _job_bailed()
         return {}
 
     calls_by_func = {}
     defined_names = set()
-    current_class = None
 
     # First pass: collect all defined method/class names
-    def collect_definitions(node):
-        nonlocal current_class
-
+    for node, current_class in _walk_java_tree(tree.root_node, source):
         if node.type == "class_declaration":
             class_name = _get_java_node_name(node, source)
             if class_name:
                 defined_names.add(class_name)
-                old_class = current_class
-                current_class = class_name
-                for child in node.children:
-                    collect_definitions(child)
-                current_class = old_class
-                return
 
         elif node.type == "method_declaration":
             name = _get_java_node_name(node, source)
@@ -2941,42 +3360,30 @@ def _extract_java_file_calls(file_path: Path, root: Path) -> dict[str, list[tupl
             if name:
                 defined_names.add(name)
 
-        for child in node.children:
-            collect_definitions(child)
-
-    collect_definitions(tree.root_node)
-
     # Second pass: extract calls from each method
     def extract_calls_from_func(func_node, func_name: str):
         calls = []
 
-        def visit_calls(node):
+        for node in _query_nodes("java", _JAVA_CALL_QUERY, func_node):
             if node.type == "method_invocation":
-                # Get the method name and object (if any)
-                method_name = None
-                object_name = None
-
+                # Get the method name and object (if any). The last identifier
+                # child is the method name and any earlier one is discarded,
+                # so only the final name and receiver nodes are decoded.
+                name_node = None
+                object_node = None
                 for child in node.children:
                     if child.type == "identifier":
-                        # Could be method name or object
-                        text = source[child.start_byte:child.end_byte].decode("utf-8")
-                        if method_name is None:
-                            # First identifier could be object or direct call
-                            if object_name is None:
-                                method_name = text
-                            else:
-                                method_name = text
-                        else:
-                            method_name = text
+                        name_node = child
                     elif child.type in ("field_access", "this"):
                         # Object.method() or this.method()
-                        if child.type == "this":
-                            object_name = "this"
-                        else:
-                            object_name = source[child.start_byte:child.end_byte].decode("utf-8")
-                    elif child.type == "argument_list":
-                        # Skip argument list
-                        pass
+                        object_node = child
+
+                method_name = None
+                if name_node is not None:
+                    method_name = source[name_node.start_byte:name_node.end_byte].decode("utf-8")
+                object_name = None
+                if object_node is not None:
+                    object_name = source[object_node.start_byte:object_node.end_byte].decode("utf-8")
 
                 # Determine call type
                 if method_name:
@@ -2998,29 +3405,11 @@ def _extract_java_file_calls(file_path: Path, root: Path) -> dict[str, list[tupl
                             calls.append(('direct', class_name))
                         break
 
-            for child in node.children:
-                visit_calls(child)
-
-        visit_calls(func_node)
         return calls
 
     # Third pass: process functions
-    current_class = None
-
-    def process_functions(node):
-        nonlocal current_class
-
-        if node.type == "class_declaration":
-            class_name = _get_java_node_name(node, source)
-            if class_name:
-                old_class = current_class
-                current_class = class_name
-                for child in node.children:
-                    process_functions(child)
-                current_class = old_class
-                return
-
-        elif node.type == "method_declaration":
+    for node, current_class in _walk_java_tree(tree.root_node, source):
+        if node.type == "method_declaration":
             name = _get_java_node_name(node, source)
             if name:
                 full_name = f"{current_class}.{name}" if current_class else name
@@ -3034,10 +3423,6 @@ def _extract_java_file_calls(file_path: Path, root: Path) -> dict[str, list[tupl
             if name:
                 calls_by_func[name] = extract_calls_from_func(node, name)
 
-        for child in node.children:
-            process_functions(child)
-
-    process_functions(tree.root_node)
     return calls_by_func
 
 
@@ -3049,67 +3434,115 @@ def _extract_c_file_calls(file_path: Path, root: Path) -> dict[str, list[tuple[s
         Dict mapping caller function name to list of (call_type, call_target) tuples
         call_type is 'direct' or 'intra'
     """
-    if not TREE_SITTER_C_AVAILABLE:
+    if not _has_grammar("c"):
         return {}
 
     try:
-        source = file_path.read_bytes()
+        source = _read_source(file_path)
+        # Definitions and calls both need a '(': skip declaration-only files
+        if not _has_literal(source, b"("):
+            return {}
         parser = _get_c_parser()
         tree = parser.parse(source)
     except (FileNotFoundError, Exception):
+        _job_bailed()
         return {}
 
     calls_by_func = {}
     defined_names = set()
 
     # First pass: collect all defined function names
-    def collect_definitions(node):
+    for node in _walk_tree(tree.root_node):
         if node.type == "function_definition":
             name = _get_c_node_name(node, source)
             if name:
                 defined_names.add(name)
 
-        for child in node.children:
-            collect_definitions(child)
+    # Second pass: extract calls from each function
+    def extract_calls_from_func(func_node, func_name: str):
+        calls = []
 
-    collect_definitions(tree.root_node)
+        for node in _walk_tree(func_node):
+            if node.type == "call_expression":
+                # Get the function name being called (plain identifiers only)
+                function = node.child_by_field_name("function")
+                if function is not None and function.type == "identifier":
+                    callee = source[function.start_byte:function.end_byte].decode("utf-8")
+                    if callee in defined_names:
+                        calls.append(('intra', callee))
+                    else:
+                        calls.append(('direct', callee))
+
+        return calls
+
+    # Third pass: process functions
+    for node in _walk_tree(tree.root_node):
+        if node.type == "function_definition":
+            name = _get_c_node_name(node, source)
+            if name:
+                calls_by_func[name] = extract_calls_from_func(node, name)
+
+    return calls_by_func
+
+
+def _extract_cpp_file_calls(file_path: Path, root: Path) -> dict[str, list[tuple[str, str]]]:
+    """
+    Extract all function calls from a C++ file, grouped by caller function.
+
+    Free and namespace/template-qualified calls are reported by their final
+    name; member calls through objects (obj.f(), p->f()) are not resolved.
+
+    Returns:
+        Dict mapping caller function name to list of (call_type, call_target) tuples
+        call_type is 'direct' or 'intra'
+    """
+    if not _has_grammar("cpp"):
+        return {}
+
+    try:
+        source = _read_source(file_path)
+        # Definitions and calls both need a '(': skip declaration-only files
+        if not _has_literal(source, b"("):
+            return {}
+        parser = _get_cpp_parser()
+        tree = parser.parse(source)
+    except (FileNotFoundError, Exception):
+        _job_bailed()
+        return {}
+
+    calls_by_func = {}
+    defined_names = set()
+
+    # First pass: collect all defined function names
+    for node in _walk_tree(tree.root_node):
+        if node.type == "function_definition":
+            name = _get_cpp_node_name(node, source)
+            if name:
+                defined_names.add(name)
 
     # Second pass: extract calls from each function
     def extract_calls_from_func(func_node, func_name: str):
         calls = []
 
-        def visit_calls(node):
+        for node in _walk_tree(func_node):
             if node.type == "call_expression":
-                # Get the function name being called
-                callee = None
-                for child in node.children:
-                    if child.type == "identifier":
-                        callee = source[child.start_byte:child.end_byte].decode("utf-8")
-                        break
-
+                # obj.f() / p->f() have a field_expression callee and yield None
+                callee = _get_cpp_callable_name(node.child_by_field_name("function"), source)
                 if callee:
                     if callee in defined_names:
                         calls.append(('intra', callee))
                     else:
                         calls.append(('direct', callee))
 
-            for child in node.children:
-                visit_calls(child)
-
-        visit_calls(func_node)
         return calls
 
     # Third pass: process functions
-    def process_functions(node):
+    for node in _walk_tree(tree.root_node):
         if node.type == "function_definition":
-            name = _get_c_node_name(node, source)
+            name = _get_cpp_node_name(node, source)
             if name:
                 calls_by_func[name] = extract_calls_from_func(node, name)
 
-        for child in node.children:
-            process_functions(child)
-
-    process_functions(tree.root_node)
     return calls_by_func
 
 
@@ -3121,14 +3554,15 @@ def _extract_php_file_calls(file_path: Path, root: Path) -> dict[str, list[tuple
         Dict mapping caller function name to list of (call_type, call_target) tuples
         call_type is 'direct', 'static', 'attr', or 'intra'
     """
-    if not TREE_SITTER_PHP_AVAILABLE:
+    if not _has_grammar("php"):
         return {}
 
     try:
-        source = file_path.read_bytes()
+        source = _read_source(file_path)
         parser = _get_php_parser()
         tree = parser.parse(source)
     except (FileNotFoundError, Exception):
+        _job_bailed()
         return {}
 
     calls_by_func = {}
@@ -3266,7 +3700,10 @@ def _extract_php_file_calls(file_path: Path, root: Path) -> dict[str, list[tuple
 def build_project_call_graph(
     root: str | Path,
     language: str = "python",
-    use_workspace_config: bool = True
+    use_workspace_config: bool = True,
+    parallel: bool = False,
+    max_workers: Optional[int] = None,
+    processes: Optional[bool] = None,
 ) -> ProjectCallGraph:
     """
     Build a complete project-wide call graph.
@@ -3277,12 +3714,30 @@ def build_project_call_graph(
     3. Parsing imports in each file
     4. Matching call sites to definitions
 
+    If root has a .tldr directory, per-file parse results are cached in
+    .tldr/cache/parse and reused for files whose mtime and size, or else
+    whose content hash, are unchanged.
+
     Args:
         root: Project root directory
         language: "python" or "typescript"
         use_workspace_config: If True, loads .claude/workspace.json to scope
                              indexing to activePackages and excludePatterns.
                              Defaults to True for monorepo support.
+        parallel: If True, parse files in a worker pool: threads for the
+                  tree-sitter languages, processes for Python. Call
+                  resolution runs in the calling thread. For the tree-sitter
+                  languages it overlaps with parsing: each file is resolved
+                  as soon as it has been parsed, in file order. Their
+                  function index is built in a thread pool as well.
+        max_workers: Worker count for parallel parsing and indexing
+                     (defaults to os.cpu_count()).
+        processes: Parse in worker processes (True) or threads (False).
+                   None picks per language: processes for Python, threads
+                   for the tree-sitter languages. Processes also spread the
+                   Python-level tree walking across cores; threads avoid
+                   worker start-up and pickling, which can win on small
+                   projects or slow filesystems.
 
     Returns:
         ProjectCallGraph with edges as (src_file, src_func, dst_file, dst_func)
@@ -3295,40 +3750,347 @@ def build_project_call_graph(
     if use_workspace_config:
         workspace_config = load_workspace_config(root)
 
-    func_index = build_function_index(root, language, workspace_config)
-
     if language == "python":
-        _build_python_call_graph(root, graph, func_index, workspace_config)
-    elif language == "typescript":
-        _build_typescript_call_graph(root, graph, func_index, workspace_config)
+        # Python definitions are indexed from the same parse as the calls
+        # rather than by a separate build_function_index pass
+        _build_python_call_graph(
+            root, graph, workspace_config, parallel, max_workers, processes is not False
+        )
+        return graph
+
+    # The tree-sitter languages default to threads
+    processes = bool(processes)
+
+    func_index = build_function_index(root, language, workspace_config, parallel, max_workers)
+
+    if language == "typescript":
+        _build_typescript_call_graph(root, graph, func_index, workspace_config, parallel, max_workers, processes)
     elif language == "go":
-        _build_go_call_graph(root, graph, func_index, workspace_config)
+        _build_go_call_graph(root, graph, func_index, workspace_config, parallel, max_workers, processes)
     elif language == "rust":
-        _build_rust_call_graph(root, graph, func_index, workspace_config)
+        _build_rust_call_graph(root, graph, func_index, workspace_config, parallel, max_workers, processes)
     elif language == "java":
-        _build_java_call_graph(root, graph, func_index, workspace_config)
+        _build_java_call_graph(root, graph, func_index, workspace_config, parallel, max_workers, processes)
     elif language == "c":
-        _build_c_call_graph(root, graph, func_index, workspace_config)
+        _build_c_call_graph(root, graph, func_index, workspace_config, parallel, max_workers, processes)
+    elif language == "cpp":
+        _build_cpp_call_graph(root, graph, func_index, workspace_config, parallel, max_workers, processes)
     elif language == "php":
-        _build_php_call_graph(root, graph, func_index, workspace_config)
+        _build_php_call_graph(root, graph, func_index, workspace_config, parallel, max_workers, processes)
 
     return graph
 
 
+def _parse_file_job(imports_fn, calls_fn, root: Path, file_path: str, source=None):
+    """
+    Parse one file's imports and calls. Module-level so it can be pickled.
+
+    The file is read once, or source is used if the caller already read it,
+    and both extractors are served that buffer.
+    """
+    path = Path(file_path)
+    if source is None:
+        try:
+            source = _read_source(path)
+        except (OSError, ValueError):
+            # Left to the extractors, which handle unreadable files themselves
+            pass
+    _job_source.entry = (os.fspath(path), source) if source is not None else None
+    _job_source.bailed = False
+    try:
+        imports = imports_fn(path) if imports_fn is not None else []
+        return file_path, imports, calls_fn(path, root)
+    finally:
+        _job_source.entry = None
+
+
+def _parse_changed_file_job(imports_fn, calls_fn, root: Path, item: tuple[str, Optional[bytes]]):
+    """
+    Hash a file whose stat changed and parse it unless its content didn't.
+
+    item is (file_path, digest of the cached entry or None). Returns
+    (file_path, digest, (imports, calls_by_func)), with None in place of
+    the parse results when the digest matches. The digest is None if the
+    file couldn't be read or an extractor bailed out, so the results aren't
+    cached. Hashing and parsing share one read of the file.
+    """
+    file_path, cached_digest = item
+    try:
+        source = _read_source(Path(file_path))
+    except (OSError, ValueError):
+        return file_path, None, _parse_file_job(imports_fn, calls_fn, root, file_path)[1:]
+    digest = _CONTENT_HASH_ID + _content_hash(source).hexdigest()
+    if digest == cached_digest:
+        return file_path, digest, None
+    parsed = _parse_file_job(imports_fn, calls_fn, root, file_path, source)[1:]
+    if _job_source.bailed:
+        digest = None
+    return file_path, digest, parsed
+
+
+# Per-file parse results of projects that have a .tldr directory (created by
+# `tldr warm` and the daemon) are kept in one JSON file per extractor, so a
+# rebuild only re-parses files whose (mtime_ns, size) changed since the last
+# and whose content hash no longer matches either.
+_PARSE_RESULTS_DIR = Path(".tldr") / "cache" / "parse"
+
+# Stored alongside the tldr version; bumped when the entry layout changes
+_PARSE_RESULTS_FORMAT = 4
+
+
+@functools.cache
+def _parse_results_version() -> tuple:
+    """
+    Return the version a results cache must have been written with to be used.
+
+    Besides the tldr version and entry format it has the installed version
+    of tree-sitter and of each grammar package (None if missing), so
+    installing, removing or upgrading one re-parses everything.
+    """
+    packages = {}
+    for module in ("tree_sitter", *_GRAMMAR_MODULES.values()):
+        try:
+            packages[module] = importlib.metadata.version(module)
+        except importlib.metadata.PackageNotFoundError:
+            packages[module] = None
+    return __version__, _PARSE_RESULTS_FORMAT, tuple(packages.items())
+
+
+def _load_parse_results(cache_path: Path) -> dict:
+    """
+    Load cached {file_path: ((mtime_ns, size), digest, imports, calls_by_func)}.
+
+    The cache lives in the project tree, so it is stored as plain JSON and
+    never unpickled; the tuples JSON turns into lists are rebuilt here.
+    """
+    try:
+        data = _json_loads(cache_path.read_bytes())
+        if data["version"] != json.loads(json.dumps(_parse_results_version())):
+            return {}
+        return {
+            file_path: _decode_parse_entry(entry)
+            for file_path, entry in data["results"].items()
+        }
+    except Exception:
+        return {}
+
+
+def _decode_parse_entry(entry: list) -> tuple:
+    """Rebuild one results cache entry as _parse_project_files stored it."""
+    key, digest, imports, calls = entry
+    if isinstance(calls, list):
+        # Python's calls come with the file's definitions: (calls_by_func, names)
+        calls = (_decode_calls(calls[0]), calls[1])
+    else:
+        calls = _decode_calls(calls)
+    return tuple(key), digest, imports, calls
+
+
+def _decode_calls(calls_by_func: dict) -> dict[str, list[tuple[str, str]]]:
+    return {name: [tuple(call) for call in calls] for name, calls in calls_by_func.items()}
+
+
+def _json_loads(data: bytes):
+    """Parse JSON from bytes, with orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _save_parse_results(cache_path: Path, results: dict) -> None:
+    """Write the parse results cache, replacing the old one atomically."""
+    data = {"version": _parse_results_version(), "results": results}
+    tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        if ORJSON_AVAILABLE:
+            tmp_path.write_bytes(orjson.dumps(data))
+        else:
+            tmp_path.write_text(json.dumps(data, separators=(",", ":")))
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            tmp_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
+def _parse_project_files(
+    root: Path,
+    files: Iterable[str],
+    imports_fn,
+    calls_fn,
+    parallel: bool = False,
+    max_workers: Optional[int] = None,
+    processes: bool = False,
+) -> Iterator[tuple[str, list[dict], dict[str, list[tuple[str, str]]]]]:
+    """
+    Yield (file_path, imports, calls_by_func) for each file.
+
+    If root has a .tldr directory, files unchanged since the previous build
+    are served from the on-disk results cache and only the rest are parsed.
+    A file counts as unchanged if its mtime and size match, or failing that
+    its content hash does, so a checkout or touch that leaves the content
+    as it was does not cost a parse. The hash is taken in the parse job, from
+    the same read the parse would use. Files are stat'ed as the scan yields
+    them, and stale ones go to the pool straight away. The cache is
+    rewritten once every file has been yielded.
+    """
+    if not (root / ".tldr").is_dir():
+        yield from _run_parse_jobs(root, files, imports_fn, calls_fn, parallel, max_workers, processes)
+        return
+
+    cache_path = root / _PARSE_RESULTS_DIR / f"{calls_fn.__name__.strip('_')}.json"
+    cached = _load_parse_results(cache_path)
+    results = {}
+    stale = {}
+    hits = deque()
+
+    def stale_items():
+        # Runs as the pool pulls items, so stale files are submitted while
+        # the scan goes on; cached hits are queued for the loop below
+        for file_path in files:
+            try:
+                st = os.stat(file_path)
+                key = (st.st_mtime_ns, st.st_size)
+            except OSError:
+                key = None
+            entry = cached.get(file_path)
+            if entry is not None and entry[0] == key:
+                results[file_path] = entry
+                hits.append((file_path, entry[2], entry[3]))
+            else:
+                stale[file_path] = key
+                yield file_path, entry[1] if entry is not None else None
+
+    job = functools.partial(_parse_changed_file_job, imports_fn, calls_fn, root)
+    for file_path, digest, parsed in _map_parse_jobs(job, stale_items(), parallel, max_workers, processes):
+        while hits:
+            yield hits.popleft()
+        key = stale[file_path]
+        if parsed is None:
+            # Only the stat changed; keep the results under the new key
+            entry = cached[file_path]
+            results[file_path] = (key, digest, entry[2], entry[3])
+            yield file_path, entry[2], entry[3]
+            continue
+        if key is not None and digest is not None:
+            results[file_path] = (key, digest) + parsed
+        yield (file_path,) + parsed
+    while hits:
+        yield hits.popleft()
+
+    if stale or len(results) != len(cached):
+        _save_parse_results(cache_path, results)
+
+
+# Files per process-pool task when the file count isn't known up front
+_STREAMED_CHUNKSIZE = 16
+
+
+def _run_parse_jobs(
+    root: Path,
+    files: Iterable[str],
+    imports_fn,
+    calls_fn,
+    parallel: bool,
+    max_workers: Optional[int],
+    processes: bool,
+) -> Iterator[tuple[str, list[dict], dict[str, list[tuple[str, str]]]]]:
+    """
+    Parse files, serially or in a worker pool.
+
+    tree-sitter releases the GIL while it parses, so by default the parallel
+    path uses a thread pool: no worker start-up and nothing to pickle. Parsers
+    that hold the GIL throughout, like the ast-based Python one, pass
+    processes=True to run in worker processes instead, which get the files
+    in chunks so one round trip carries several of them. Results arrive in
+    file order as soon as they are ready, so the caller's per-file
+    resolution runs while the remaining files are parsed. Resolution itself
+    is a handful of dict lookups per call and is not worth shipping the
+    function index to the workers for.
+    """
+    job = functools.partial(_parse_file_job, imports_fn, calls_fn, root)
+    yield from _map_parse_jobs(job, files, parallel, max_workers, processes)
+
+
+def _map_parse_jobs(job, items: Iterable, parallel: bool, max_workers: Optional[int], processes: bool) -> Iterator:
+    """Run job over items, serially or in a worker pool, yielding results in order."""
+    # The size of a project that is still being scanned isn't known yet
+    total = len(items) if isinstance(items, list) else None
+    if not parallel or (total is not None and total < 2):
+        for item in items:
+            yield job(item)
+        return
+
+    workers = max_workers or os.cpu_count() or 1
+    chunksize = max(1, total // (workers * 8)) if total is not None else _STREAMED_CHUNKSIZE
+    if processes:
+        loaded = tuple(language for language, grammar in _grammars.items() if grammar is not None)
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=_warm_parse_worker, initargs=(loaded,))
+    else:
+        executor = ThreadPoolExecutor(max_workers=workers)
+    with executor:
+        # map submits each file as the scan yields it, so workers start
+        # parsing while the walk goes on. It drops each result once it is
+        # yielded, so results are not all held until the last file
+        # finishes. Thread pools ignore chunksize.
+        yield from executor.map(job, items, chunksize=chunksize)
+
+
+def _index_by_name(func_index: dict) -> dict[str, list[tuple[int, str, str]]]:
+    """
+    Group the (module, name) entries of a function index by name.
+
+    Each name maps to a list of (position, module, file_path) in func_index
+    iteration order, so the first entry is the one a linear scan over
+    func_index would have found first.
+    """
+    by_name: dict[str, list[tuple[int, str, str]]] = {}
+    for pos, (key, file_path) in enumerate(func_index.items()):
+        if isinstance(key, tuple) and len(key) == 2:
+            mod, name = key
+            by_name.setdefault(name, []).append((pos, mod, file_path))
+    return by_name
+
+
 def _build_python_call_graph(
     root: Path,
     graph: ProjectCallGraph,
-    func_index: dict,
-    workspace_config: Optional[WorkspaceConfig] = None
+    workspace_config: Optional[WorkspaceConfig] = None,
+    parallel: bool = False,
+    max_workers: Optional[int] = None,
+    processes: bool = True,
 ):
-    """Build call graph for Python files."""
-    for py_file in scan_project(root, "python", workspace_config):
+    """
+    Build call graph for Python files.
+
+    Each file is parsed once: its definitions come back with its imports and
+    calls, and the function index is built from them before any call is
+    resolved. Resolution therefore waits for every file to be parsed, but
+    no file is parsed a second time just to index it.
+    """
+    files = scan_project(root, "python", workspace_config)
+    parsed = {
+        py_file: (imports, calls_by_func, definitions)
+        for py_file, imports, (calls_by_func, definitions) in _parse_project_files(
+            root, files, parse_imports, _extract_python_file_calls, parallel, max_workers, processes
+        )
+    }
+
+    # Index in scan order, as build_function_index does, so a name defined in
+    # several files resolves to the same one
+    func_index = {}
+    for py_file in files:
+        rel_path = Path(py_file).relative_to(root)
+        module_name = '.'.join(list(rel_path.parts[:-1]) + [rel_path.stem])
+        _index_python_definitions(parsed[py_file][2], str(rel_path), module_name, rel_path.stem, func_index)
+
+    for py_file in files:
+        imports, calls_by_func, _ = parsed[py_file]
         py_path = Path(py_file)
         rel_path = str(py_path.relative_to(root))
 
-        # Get imports for this file
-        imports = parse_imports(py_path)
-
         # Build import resolution map
         import_map = {}
         module_imports = {}
@@ -3354,9 +4116,6 @@ def _build_python_call_graph(
                 else:
                     module_imports[module] = module
 
-        # Get calls from this file
-        calls_by_func = _extract_file_calls(py_path, root)
-
         for caller_func, calls in calls_by_func.items():
             for call_type, call_target in calls:
                 if call_type == 'intra':
@@ -3393,16 +4152,19 @@ def _build_typescript_call_graph(
     root: Path,
     graph: ProjectCallGraph,
     func_index: dict,
-    workspace_config: Optional[WorkspaceConfig] = None
+    workspace_config: Optional[WorkspaceConfig] = None,
+    parallel: bool = False,
+    max_workers: Optional[int] = None,
+    processes: bool = False,
 ):
     """Build call graph for TypeScript files."""
-    for ts_file in scan_project(root, "typescript", workspace_config):
+    files = iter_project_files(root, "typescript", workspace_config)
+    for ts_file, imports, calls_by_func in _parse_project_files(
+        root, files, parse_ts_imports, _extract_ts_file_calls, parallel, max_workers, processes
+    ):
         ts_path = Path(ts_file)
         rel_path = str(ts_path.relative_to(root))
 
-        # Get imports for this file
-        imports = parse_ts_imports(ts_path)
-
         # Build import resolution map
         # For TypeScript, imports are relative paths or package names
         import_map = {}  # local_name -> (module_path, original_name)
@@ -3433,9 +4195,6 @@ def _build_typescript_call_graph(
             if imp.get('default'):
                 default_imports[imp['default']] = module_path
 
-        # Get calls from this file
-        calls_by_func = _extract_ts_file_calls(ts_path, root)
-
         for caller_func, calls in calls_by_func.items():
             for call_type, call_target in calls:
                 if call_type == 'intra':
@@ -3501,16 +4260,20 @@ def _build_go_call_graph(
     root: Path,
     graph: ProjectCallGraph,
     func_index: dict,
-    workspace_config: Optional[WorkspaceConfig] = None
+    workspace_config: Optional[WorkspaceConfig] = None,
+    parallel: bool = False,
+    max_workers: Optional[int] = None,
+    processes: bool = False,
 ):
     """Build call graph for Go files."""
-    for go_file in scan_project(root, "go", workspace_config):
+    funcs_by_name = _index_by_name(func_index)
+    files = iter_project_files(root, "go", workspace_config)
+    for go_file, imports, calls_by_func in _parse_project_files(
+        root, files, parse_go_imports, _extract_go_file_calls, parallel, max_workers, processes
+    ):
         go_path = Path(go_file)
         rel_path = str(go_path.relative_to(root))
 
-        # Get imports for this file
-        imports = parse_go_imports(go_path)
-
         # Build import resolution map
         # For Go, imports are package paths with optional aliases
         package_imports = {}  # local_name -> package_path
@@ -3534,9 +4297,6 @@ def _build_go_call_graph(
 
             package_imports[local_name] = module_path
 
-        # Get calls from this file
-        calls_by_func = _extract_go_file_calls(go_path, root)
-
         for caller_func, calls in calls_by_func.items():
             for call_type, call_target in calls:
                 if call_type == 'intra':
@@ -3550,15 +4310,11 @@ def _build_go_call_graph(
                             pkg_path = package_imports[pkg]
                             # Try to find in function index
                             # For Go packages, look in all files in the package directory
-                            for key, file_path in func_index.items():
-                                # Handle both tuple keys (mod, name) and string keys
-                                if isinstance(key, tuple) and len(key) == 2:
-                                    mod, name = key
-                                    if name == func_name:
-                                        # Check if this file is in the right package
-                                        if pkg_path.lstrip('./') in file_path or mod == pkg:
-                                            graph.add_edge(rel_path, caller_func, file_path, func_name)
-                                            break
+                            for _, mod, file_path in funcs_by_name.get(func_name, ()):
+                                # Check if this file is in the right package
+                                if pkg_path.lstrip('./') in file_path or mod == pkg:
+                                    graph.add_edge(rel_path, caller_func, file_path, func_name)
+                                    break
 
 
 def _resolve_go_import(from_file: str, import_path: str) -> str:
@@ -3590,16 +4346,19 @@ def _build_rust_call_graph(
     root: Path,
     graph: ProjectCallGraph,
     func_index: dict,
-    workspace_config: Optional[WorkspaceConfig] = None
+    workspace_config: Optional[WorkspaceConfig] = None,
+    parallel: bool = False,
+    max_workers: Optional[int] = None,
+    processes: bool = False,
 ):
     """Build call graph for Rust files."""
-    for rs_file in scan_project(root, "rust", workspace_config):
+    files = iter_project_files(root, "rust", workspace_config)
+    for rs_file, imports, calls_by_func in _parse_project_files(
+        root, files, parse_rust_imports, _extract_rust_file_calls, parallel, max_workers, processes
+    ):
         rs_path = Path(rs_file)
         rel_path = str(rs_path.relative_to(root))
 
-        # Get imports for this file
-        imports = parse_rust_imports(rs_path)
-
         # Build import resolution map
         # For Rust, use statements map names to modules
         import_map = {}  # local_name -> (module_path, original_name)
@@ -3632,9 +4391,6 @@ def _build_rust_call_graph(
                         continue
                     import_map[name] = (resolved_module, name)
 
-        # Get calls from this file
-        calls_by_func = _extract_rust_file_calls(rs_path, root)
-
         for caller_func, calls in calls_by_func.items():
             for call_type, call_target in calls:
                 if call_type == 'intra':
@@ -3686,23 +4442,21 @@ def _resolve_rust_module(module: str, from_file: str, root: Path) -> str:
     if module.startswith("crate::"):
         # crate:: refers to the crate root
         remainder = module[7:]  # Strip "crate::"
-        parts = remainder.split("::")
-        return "/".join(parts)
+        return remainder.replace("::", "/")
 
     elif module.startswith("self::"):
         # self:: refers to current module
         remainder = module[6:]  # Strip "self::"
-        parts = remainder.split("::")
+        path = remainder.replace("::", "/")
         if from_dir == Path("."):
-            return "/".join(parts)
-        return str(from_dir / "/".join(parts))
+            return path
+        return str(from_dir / path)
 
     elif module.startswith("super::"):
         # super:: refers to parent module
         remainder = module[7:]  # Strip "super::"
-        parts = remainder.split("::")
         parent = from_dir.parent if from_dir != Path(".") else Path(".")
-        return str(parent / "/".join(parts))
+        return str(parent / remainder.replace("::", "/"))
 
     else:
         # External crate or std library - return as is
@@ -3713,16 +4467,20 @@ def _build_java_call_graph(
     root: Path,
     graph: ProjectCallGraph,
     func_index: dict,
-    workspace_config: Optional[WorkspaceConfig] = None
+    workspace_config: Optional[WorkspaceConfig] = None,
+    parallel: bool = False,
+    max_workers: Optional[int] = None,
+    processes: bool = False,
 ):
     """Build call graph for Java files."""
-    for java_file in scan_project(root, "java", workspace_config):
+    funcs_by_name = _index_by_name(func_index)
+    files = iter_project_files(root, "java", workspace_config)
+    for java_file, imports, calls_by_func in _parse_project_files(
+        root, files, parse_java_imports, _extract_java_file_calls, parallel, max_workers, processes
+    ):
         java_path = Path(java_file)
         rel_path = str(java_path.relative_to(root))
 
-        # Get imports for this file
-        imports = parse_java_imports(java_path)
-
         # Build import resolution map
         # For Java, imports are fully qualified class names
         import_map = {}  # simple_name -> full_module
@@ -3742,9 +4500,6 @@ def _build_java_call_graph(
                 simple_name = module.split('.')[-1]
                 import_map[simple_name] = module
 
-        # Get calls from this file
-        calls_by_func = _extract_java_file_calls(java_path, root)
-
         for caller_func, calls in calls_by_func.items():
             for call_type, call_target in calls:
                 if call_type == 'intra':
@@ -3753,12 +4508,9 @@ def _build_java_call_graph(
                 elif call_type == 'direct':
                     # Direct call might be to a same-package class or an imported one
                     # Try to find in function index
-                    for key, file_path in func_index.items():
-                        if isinstance(key, tuple) and len(key) == 2:
-                            mod, name = key
-                            if name == call_target:
-                                graph.add_edge(rel_path, caller_func, file_path, call_target)
-                                break
+                    matches = funcs_by_name.get(call_target)
+                    if matches:
+                        graph.add_edge(rel_path, caller_func, matches[0][2], call_target)
 
                 elif call_type == 'attr':
                     # Object.method() call
@@ -3768,28 +4520,29 @@ def _build_java_call_graph(
                         method_name = parts[-1]
 
                         # Try to find the method in the function index
-                        for key, file_path in func_index.items():
-                            if isinstance(key, tuple) and len(key) == 2:
-                                mod, name = key
-                                if name == method_name:
-                                    graph.add_edge(rel_path, caller_func, file_path, method_name)
-                                    break
+                        matches = funcs_by_name.get(method_name)
+                        if matches:
+                            graph.add_edge(rel_path, caller_func, matches[0][2], method_name)
 
 
 def _build_c_call_graph(
     root: Path,
     graph: ProjectCallGraph,
     func_index: dict,
-    workspace_config: Optional[WorkspaceConfig] = None
+    workspace_config: Optional[WorkspaceConfig] = None,
+    parallel: bool = False,
+    max_workers: Optional[int] = None,
+    processes: bool = False,
 ):
     """Build call graph for C files."""
-    for c_file in scan_project(root, "c", workspace_config):
+    funcs_by_name = _index_by_name(func_index)
+    files = iter_project_files(root, "c", workspace_config)
+    for c_file, includes, calls_by_func in _parse_project_files(
+        root, files, parse_c_imports, _extract_c_file_calls, parallel, max_workers, processes
+    ):
         c_path = Path(c_file)
         rel_path = str(c_path.relative_to(root))
 
-        # Get includes for this file
-        includes = parse_c_imports(c_path)
-
         # Build include resolution map
         # For C, includes are header file paths
         include_map = {}  # header_name -> header_path
@@ -3802,8 +4555,37 @@ def _build_c_call_graph(
             header_name = module.split('/')[-1] if '/' in module else module
             include_map[header_name] = module
 
-        # Get calls from this file
-        calls_by_func = _extract_c_file_calls(c_path, root)
+        for caller_func, calls in calls_by_func.items():
+            for call_type, call_target in calls:
+                if call_type == 'intra':
+                    # Intra-file call
+                    graph.add_edge(rel_path, caller_func, rel_path, call_target)
+
+                elif call_type == 'direct':
+                    # Direct call - try to find in function index
+                    matches = funcs_by_name.get(call_target)
+                    if matches:
+                        graph.add_edge(rel_path, caller_func, matches[0][2], call_target)
+
+
+def _build_cpp_call_graph(
+    root: Path,
+    graph: ProjectCallGraph,
+    func_index: dict,
+    workspace_config: Optional[WorkspaceConfig] = None,
+    parallel: bool = False,
+    max_workers: Optional[int] = None,
+    processes: bool = False,
+):
+    """Build call graph for C++ files."""
+    funcs_by_name = _index_by_name(func_index)
+    files = iter_project_files(root, "cpp", workspace_config)
+    # Resolution is by function name only, so includes are not parsed
+    for cpp_file, _, calls_by_func in _parse_project_files(
+        root, files, None, _extract_cpp_file_calls, parallel, max_workers, processes
+    ):
+        cpp_path = Path(cpp_file)
+        rel_path = str(cpp_path.relative_to(root))
 
         for caller_func, calls in calls_by_func.items():
             for call_type, call_target in calls:
@@ -3813,28 +4595,29 @@ def _build_c_call_graph(
 
                 elif call_type == 'direct':
                     # Direct call - try to find in function index
-                    for key, file_path in func_index.items():
-                        if isinstance(key, tuple) and len(key) == 2:
-                            mod, name = key
-                            if name == call_target:
-                                graph.add_edge(rel_path, caller_func, file_path, call_target)
-                                break
+                    matches = funcs_by_name.get(call_target)
+                    if matches:
+                        graph.add_edge(rel_path, caller_func, matches[0][2], call_target)
 
 
 def _build_php_call_graph(
     root: Path,
     graph: ProjectCallGraph,
     func_index: dict,
-    workspace_config: Optional[WorkspaceConfig] = None
+    workspace_config: Optional[WorkspaceConfig] = None,
+    parallel: bool = False,
+    max_workers: Optional[int] = None,
+    processes: bool = False,
 ):
     """Build call graph for PHP files."""
-    for php_file in scan_project(root, "php", workspace_config):
+    funcs_by_name = _index_by_name(func_index)
+    files = iter_project_files(root, "php", workspace_config)
+    for php_file, imports, calls_by_func in _parse_project_files(
+        root, files, parse_php_imports, _extract_php_file_calls, parallel, max_workers, processes
+    ):
         php_path = Path(php_file)
         rel_path = str(php_path.relative_to(root))
 
-        # Get imports for this file
-        imports = parse_php_imports(php_path)
-
         # Build import resolution map
         # For PHP: 'User' -> ('App\\Models', 'User')
         import_map = {}  # alias -> (namespace, name)
@@ -3852,9 +4635,6 @@ def _build_php_call_graph(
                     import_map[alias] = (namespace, name)
                     import_map[name] = (namespace, name)
 
-        # Get calls from this file
-        calls_by_func = _extract_php_file_calls(php_path, root)
-
         for caller_func, calls in calls_by_func.items():
             for call_type, call_target in calls:
                 if call_type == 'intra':
@@ -3880,12 +4660,9 @@ def _build_php_call_graph(
                                 graph.add_edge(rel_path, caller_func, dst_file, orig_name)
                     else:
                         # Try to find directly in func_index
-                        for key, file_path in func_index.items():
-                            if isinstance(key, tuple) and len(key) == 2:
-                                _, name = key
-                                if name == call_target:
-                                    graph.add_edge(rel_path, caller_func, file_path, call_target)
-                                    break
+                        matches = funcs_by_name.get(call_target)
+                        if matches:
+                            graph.add_edge(rel_path, caller_func, matches[0][2], call_target)
 
                 elif call_type == 'static':
                     # ClassName::staticMethod()
@@ -3895,13 +4672,18 @@ def _build_php_call_graph(
                         # Try to resolve class name via imports
                         if class_name in import_map:
                             namespace, resolved_class = import_map[class_name]
-                            # Look for Class::method in index
-                            for key, file_path in func_index.items():
-                                if isinstance(key, tuple) and len(key) == 2:
-                                    _, name = key
-                                    if name == method or name == f"{resolved_class}::{method}":
-                                        graph.add_edge(rel_path, caller_func, file_path, method)
-                                        break
+                            # Look for Class::method in index; take whichever
+                            # of the two names appears first in func_index
+                            candidates = [
+                                matches[0]
+                                for matches in (
+                                    funcs_by_name.get(method),
+                                    funcs_by_name.get(f"{resolved_class}::{method}"),
+                                )
+                                if matches
+                            ]
+                            if candidates:
+                                graph.add_edge(rel_path, caller_func, min(candidates)[2], method)
                         else:
                             # Try direct lookup
                             key = (class_name, method)
@@ -3910,12 +4692,9 @@ def _build_php_call_graph(
                                 graph.add_edge(rel_path, caller_func, dst_file, method)
                             else:
                                 # Search in index
-                                for key, file_path in func_index.items():
-                                    if isinstance(key, tuple) and len(key) == 2:
-                                        _, name = key
-                                        if name == method:
-                                            graph.add_edge(rel_path, caller_func, file_path, method)
-                                            break
+                                matches = funcs_by_name.get(method)
+                                if matches:
+                                    graph.add_edge(rel_path, caller_func, matches[0][2], method)
 
                 elif call_type == 'attr':
                     # $obj->method() - try to find method in index
@@ -3925,17 +4704,10 @@ def _build_php_call_graph(
                         # For $this->method(), try to find method in same file first
                         if obj == "$this":
                             # Check if method exists in current file's functions
-                            for key, file_path in func_index.items():
-                                if isinstance(key, tuple) and len(key) == 2:
-                                    _, name = key
-                                    if name == method and file_path == rel_path:
-                                        graph.add_edge(rel_path, caller_func, rel_path, method)
-                                        break
+                            if any(file_path == rel_path for _, _, file_path in funcs_by_name.get(method, ())):
+                                graph.add_edge(rel_path, caller_func, rel_path, method)
                         else:
                             # Generic object method call - try to find method
-                            for key, file_path in func_index.items():
-                                if isinstance(key, tuple) and len(key) == 2:
-                                    _, name = key
-                                    if name == method:
-                                        graph.add_edge(rel_path, caller_func, file_path, method)
-                                        break
+                            matches = funcs_by_name.get(method)
+                            if matches:
+                                graph.add_edge(rel_path, caller_func, matches[0][2], method)
@@ -17,7 +17,14 @@ import time
 from pathlib import Path
 from typing import Any, Optional
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from tldr.dedup import ContentHashedIndex
+from tldr.patch import compute_file_hash
 from tldr.salsa import SalsaDB
 from tldr.stats import (
     HookStats,
@@ -35,20 +42,53 @@ from .cached_queries import (
     cached_dead_code,
     cached_dfg,
     cached_extract,
-    cached_importers,
     cached_imports,
     cached_search,
     cached_slice,
     cached_structure,
     cached_tree,
 )
+from .importer_index import ImporterIndex
 
 # Idle timeout: 30 minutes
 IDLE_TIMEOUT = 30 * 60
 
+# Pending connections the listening socket queues while a command is being
+# handled. Editor hooks fire in bursts (one notify per saved file), and a
+# full backlog makes clients fail to connect rather than wait their turn.
+LISTEN_BACKLOG = socket.SOMAXCONN
+
 logger = logging.getLogger(__name__)
 
 
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON from bytes, with orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_encode_line(data: Any) -> bytes:
+    """Encode data as one newline-terminated JSON line for the socket."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; json handles those
+    return json.dumps(data).encode() + b"\n"
+
+
+def _json_dump_file(path: Path, data: Any) -> None:
+    """Write data to path as indented JSON, with orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        try:
+            path.write_bytes(orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2))
+            return
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; json handles those
+    path.write_text(json.dumps(data, indent=2))
+
+
 class TLDRDaemon:
     """
     TLDR daemon server holding indexes in memory.
@@ -67,6 +107,7 @@ class TLDRDaemon:
         self.project = project_path
         self.tldr_dir = project_path / ".tldr"
         self.socket_path = self._compute_socket_path()
+        self._connection_info = self._compute_connection_info()
         self.last_query = time.time()
         self.indexes: dict[str, Any] = {}
 
@@ -79,11 +120,14 @@ class TLDRDaemon:
 
         # P5 Features: Content-hash deduplication and query memoization
         self.dedup_index: Optional[ContentHashedIndex] = None
+        self._importer_indexes: dict[str, ImporterIndex] = {}
         self.salsa_db: SalsaDB = SalsaDB()
 
         # P6 Features: Dirty-count triggered semantic re-indexing
         self._dirty_count: int = 0
         self._dirty_files: set[str] = set()
+        self._pending_changes: set[str] = set()  # Notified, not yet invalidated
+        self._semantic_hashes: dict[str, str] = {}  # Content hash at last re-index
         self._reindex_in_progress: bool = False
         self._semantic_config = self._load_semantic_config()
 
@@ -128,7 +172,7 @@ class TLDRDaemon:
         claude_settings = self.project / ".claude" / "settings.json"
         if claude_settings.exists():
             try:
-                settings = json.loads(claude_settings.read_text())
+                settings = _json_loads(claude_settings.read_bytes())
                 if "semantic_search" in settings:
                     return {**default_config, **settings["semantic_search"]}
             except Exception as e:
@@ -138,7 +182,7 @@ class TLDRDaemon:
         tldr_config = self.tldr_dir / "config.json"
         if tldr_config.exists():
             try:
-                config = json.loads(tldr_config.read_text())
+                config = _json_loads(tldr_config.read_bytes())
                 if "semantic" in config:
                     return {**default_config, **config["semantic"]}
             except Exception as e:
@@ -152,6 +196,10 @@ class TLDRDaemon:
         On Windows, uses TCP on localhost with a deterministic port.
         On Unix (Linux/macOS), uses Unix domain sockets.
         """
+        return self._connection_info
+
+    def _compute_connection_info(self) -> tuple[str, int | None]:
+        """Compute (address, port) once; see _get_connection_info."""
         if sys.platform == "win32":
             # TCP on localhost with deterministic port from hash
             hash_val = hashlib.md5(str(self.project).encode()).hexdigest()[:8]
@@ -186,6 +234,10 @@ class TLDRDaemon:
 
         cmd = command.get("cmd", "")
 
+        # Queries must see every change notified before them
+        if cmd != "notify":
+            self._flush_pending_changes()
+
         handlers = {
             "ping": self._handle_ping,
             "status": self._handle_status,
@@ -445,20 +497,7 @@ class TLDRDaemon:
             return {"status": "error", "message": "Missing required parameter: func"}
 
         try:
-            self._ensure_call_graph_loaded()
-            call_graph = self.indexes.get("call_graph", {})
-
-            # Find all callers of the function
-            callers = []
-            edges = call_graph.get("edges", [])
-            for edge in edges:
-                if edge.get("callee") == func_name:
-                    callers.append({
-                        "caller": edge.get("caller"),
-                        "file": edge.get("file"),
-                        "line": edge.get("line"),
-                    })
-
+            callers = list(self._callers_by_callee().get(func_name, ()))
             return {"status": "ok", "callers": callers}
         except Exception as e:
             logger.exception("Impact analysis failed")
@@ -472,7 +511,7 @@ class TLDRDaemon:
         call_graph_path = self.tldr_dir / "call_graph.json"
         if call_graph_path.exists():
             try:
-                self.indexes["call_graph"] = json.loads(call_graph_path.read_text())
+                self.indexes["call_graph"] = _json_loads(call_graph_path.read_bytes())
                 logger.info(f"Loaded call graph from {call_graph_path}")
             except Exception as e:
                 logger.error(f"Failed to load call graph: {e}")
@@ -481,6 +520,25 @@ class TLDRDaemon:
             logger.warning(f"No call graph found at {call_graph_path}")
             self.indexes["call_graph"] = {"edges": [], "nodes": {}}
 
+    def _callers_by_callee(self) -> dict[str, list[dict]]:
+        """Map each callee to its callers, built once per loaded call graph.
+
+        Dropped whenever indexes["call_graph"] is replaced, so the next
+        impact query rebuilds it from the new edges.
+        """
+        index = self.indexes.get("callers_by_callee")
+        if index is None:
+            self._ensure_call_graph_loaded()
+            index = {}
+            for edge in self.indexes["call_graph"].get("edges", []):
+                index.setdefault(edge.get("callee"), []).append({
+                    "caller": edge.get("caller"),
+                    "file": edge.get("file"),
+                    "line": edge.get("line"),
+                })
+            self.indexes["callers_by_callee"] = index
+        return index
+
     def _handle_dead(self, command: dict) -> dict:
         """Handle dead code analysis command."""
         try:
@@ -588,7 +646,7 @@ class TLDRDaemon:
                     {"from_file": e[0], "from_func": e[1], "to_file": e[2], "to_func": e[3]}
                     for e in graph.edges
                 ],
-                "count": len(graph.edges),
+                "count": len(graph),
             }
             return {"status": "ok", "result": result}
         except Exception as e:
@@ -616,12 +674,13 @@ class TLDRDaemon:
                 "languages": [language],
                 "timestamp": time.time(),
             }
-            cache_file.write_text(json.dumps(cache_data, indent=2))
+            _json_dump_file(cache_file, cache_data)
 
             # Also update in-memory index
             self.indexes["call_graph"] = cache_data
+            self.indexes.pop("callers_by_callee", None)
 
-            return {"status": "ok", "files": len(files), "edges": len(graph.edges)}
+            return {"status": "ok", "files": len(files), "edges": len(graph)}
         except Exception as e:
             logger.exception("Cache warming failed")
             return {"status": "error", "message": str(e)}
@@ -733,13 +792,10 @@ class TLDRDaemon:
 
         try:
             language = command.get("language", "python")
-            return self.salsa_db.query(
-                cached_importers,
-                self.salsa_db,
-                str(self.project),
-                module,
-                language,
-            )
+            index = self._importer_indexes.get(language)
+            if index is None:
+                index = self._importer_indexes[language] = ImporterIndex(str(self.project), language)
+            return {"status": "ok", "module": module, "importers": index.importers(module)}
         except Exception as e:
             logger.exception("Importers lookup failed")
             return {"status": "error", "message": str(e)}
@@ -775,6 +831,13 @@ class TLDRDaemon:
             except Exception as e:
                 logger.error(f"Failed to save dedup index: {e}")
 
+    def _semantic_content_hash(self, file_path: str) -> Optional[str]:
+        """Hash a dirty file's content the way ContentHashedIndex does."""
+        try:
+            return compute_file_hash(str(self.project / file_path))
+        except OSError:
+            return None
+
     def _handle_notify(self, command: dict) -> dict:
         """Handle file change notification from hooks.
 
@@ -791,10 +854,13 @@ class TLDRDaemon:
         if not file_path:
             return {"status": "error", "message": "Missing required parameter: file"}
 
+        # Cache invalidation is queued: a burst of saves (or a checkout)
+        # notifies many files, often the same file several times, and
+        # applying them in one pass re-extracts each file once
+        self._pending_changes.add(file_path)
+
         # Check if semantic search is enabled
         if not self._semantic_config.get("enabled", True):
-            # Still notify for Salsa cache invalidation
-            self.notify_file_changed(file_path)
             return {"status": "ok", "semantic_enabled": False}
 
         # Track dirty file
@@ -803,9 +869,6 @@ class TLDRDaemon:
             self._dirty_count += 1
             logger.info(f"Dirty file tracked: {file_path} (count: {self._dirty_count})")
 
-        # Notify Salsa for cache invalidation
-        self.notify_file_changed(file_path)
-
         # Check if we should trigger background re-indexing
         threshold = self._semantic_config.get("auto_reindex_threshold", 20)
         should_reindex = (
@@ -826,37 +889,53 @@ class TLDRDaemon:
     def _trigger_background_reindex(self):
         """Trigger background semantic re-indexing.
 
-        Spawns a subprocess to rebuild the semantic index,
-        allowing the daemon to continue serving requests.
+        Rebuilds the semantic index on a background thread, allowing the
+        daemon to continue serving requests. Running in-process rather than
+        in a `tldr semantic index` subprocess skips interpreter start-up and
+        reuses the embedding model if a search has already loaded it.
+
+        Units are extracted in this process: the daemon is multi-threaded by
+        then (and may have loaded torch), and forking a worker pool from it
+        can deadlock the children. There is no timeout; the subprocess used
+        to be killed after 10 minutes, but a thread can't be, so a stuck
+        re-index only keeps _reindex_in_progress set until the daemon stops.
         """
         if self._reindex_in_progress:
             logger.info("Re-index already in progress, skipping")
             return
 
+        # Saves that didn't change content (no-op saves, reverted edits,
+        # formatter runs) don't need the embeddings recomputed
+        changed_hashes = {}
+        for file_path in self._dirty_files:
+            content_hash = self._semantic_content_hash(file_path)
+            if content_hash is None or content_hash != self._semantic_hashes.get(file_path):
+                changed_hashes[file_path] = content_hash
+        if not changed_hashes:
+            logger.info(f"Skipping semantic re-index: {len(self._dirty_files)} dirty files unchanged")
+            self._dirty_files.clear()
+            self._dirty_count = 0
+            return
+
         self._reindex_in_progress = True
-        dirty_files = list(self._dirty_files)
-        logger.info(f"Triggering background semantic re-index for {len(dirty_files)} files")
+        logger.info(f"Triggering background semantic re-index for {len(changed_hashes)} files")
 
         def do_reindex():
             try:
-                import subprocess
+                from tldr.semantic import build_semantic_index
 
-                # Run semantic index command
-                cmd = [
-                    sys.executable, "-m", "tldr.cli",
-                    "semantic", "index", str(self.project)
-                ]
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=600,  # 10 min max
+                count = build_semantic_index(
+                    str(self.project),
+                    lang=self._semantic_config.get("language", "python"),
+                    show_progress=False,
+                    max_workers=1,
                 )
-
-                if result.returncode == 0:
-                    logger.info("Background semantic re-index completed successfully")
-                else:
-                    logger.error(f"Background semantic re-index failed: {result.stderr}")
+                logger.info(f"Background semantic re-index completed successfully ({count} units)")
+                for file_path, content_hash in changed_hashes.items():
+                    if content_hash is None:
+                        self._semantic_hashes.pop(file_path, None)
+                    else:
+                        self._semantic_hashes[file_path] = content_hash
 
             except Exception as e:
                 logger.exception(f"Background semantic re-index error: {e}")
@@ -1010,7 +1089,7 @@ class TLDRDaemon:
                     cwd=str(self.project),
                 )
                 if result.returncode == 0:
-                    files = [f.strip() for f in result.stdout.strip().split("\n") if f.strip()]
+                    files = [name for line in result.stdout.splitlines() if (name := line.strip())]
             except Exception as e:
                 logger.debug(f"git diff failed: {e}")
 
@@ -1093,6 +1172,9 @@ class TLDRDaemon:
         # Invalidate SalsaDB cache entries for this file
         self.salsa_db.set_file(file_path, "changed")  # Triggers invalidation
 
+        for index in self._importer_indexes.values():
+            index.mark_changed(file_path)
+
         # Update dedup index if loaded
         if self.dedup_index:
             # Re-extract edges for the changed file
@@ -1110,6 +1192,18 @@ class TLDRDaemon:
             except Exception as e:
                 logger.debug(f"Could not re-index {file_path}: {e}")
 
+    def _flush_pending_changes(self):
+        """Apply the file-change notifications queued by _handle_notify.
+
+        Runs before any other command is handled and whenever the socket
+        has been quiet for a second.
+        """
+        if not self._pending_changes:
+            return
+        pending, self._pending_changes = self._pending_changes, set()
+        for file_path in pending:
+            self.notify_file_changed(file_path)
+
     def _get_tmp_pid_path(self) -> Path:
         """Get PID file path in temp dir (matches socket path pattern)."""
         hash_val = hashlib.md5(str(Path(self.project).resolve()).encode()).hexdigest()[:8]
@@ -1203,7 +1297,7 @@ class TLDRDaemon:
             sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
             addr, port = self._get_connection_info()
             sock.bind((addr, port))
-            sock.listen(5)
+            sock.listen(LISTEN_BACKLOG)
             sock.settimeout(1.0)
             logger.info(f"Listening on {addr}:{port}")
         else:
@@ -1236,7 +1330,7 @@ class TLDRDaemon:
                             sock.bind(str(self.socket_path))
                 else:
                     raise
-            sock.listen(5)
+            sock.listen(LISTEN_BACKLOG)
             sock.settimeout(1.0)
             logger.info(f"Listening on {self.socket_path}")
 
@@ -1271,6 +1365,7 @@ class TLDRDaemon:
         try:
             conn, _ = self._socket.accept()
         except socket.timeout:
+            self._flush_pending_changes()
             return
         except OSError:
             return
@@ -1288,12 +1383,12 @@ class TLDRDaemon:
 
             if data:
                 try:
-                    command = json.loads(data.decode().strip())
+                    command = _json_loads(data)
                     response = self.handle_command(command)
                 except json.JSONDecodeError as e:
                     response = {"status": "error", "message": f"Invalid JSON: {e}"}
 
-                conn.sendall(json.dumps(response).encode() + b"\n")
+                conn.sendall(_json_encode_line(response))
         except BrokenPipeError:
             # Client disconnected before receiving response - normal occurrence
             logger.debug("Client disconnected before receiving response")
@@ -0,0 +1,129 @@
+"""
+Reverse import index for the daemon's importers command.
+
+Maps imported modules and names to the files that import them, so a lookup
+doesn't parse every file in the project. Built on first use, then kept
+current by re-parsing only the files the daemon is notified about.
+"""
+
+import copy
+import os
+from pathlib import Path
+from typing import Any
+
+
+class ImporterIndex:
+    """Imports of every project file for one language, indexed both ways.
+
+    Results match cached_importers: an import matches a module query if the
+    query is a substring of its module or one of its imported names, and
+    matches come back in file scan order (files added since the index was
+    built go last), then import order.
+    """
+
+    def __init__(self, project: str, language: str):
+        self.project = project
+        self.language = language
+        self._built = False
+        self._stale: set[str] = set()
+        # {absolute_file_path: imports} and each file's position in scan order
+        self._imports: dict[str, list[dict]] = {}
+        self._order: dict[str, int] = {}
+        self._next_order = 0
+        # {module: {absolute_file_path, ...}} and the same for imported names
+        self._by_module: dict[str, set[str]] = {}
+        self._by_name: dict[str, set[str]] = {}
+
+    def mark_changed(self, file_path: str) -> None:
+        """Re-parse file_path on the next lookup."""
+        self._stale.add(os.path.normpath(os.path.join(self.project, file_path)))
+
+    def importers(self, module: str) -> list[dict[str, Any]]:
+        """
+        Return [{"file": relative_path, "import": import_dict}] for module.
+
+        The import dicts are copies, so callers can't change the index.
+        """
+        self._refresh()
+
+        files = set(self._by_name.get(module, ()))
+        for mod, mod_files in self._by_module.items():
+            if module in mod:
+                files.update(mod_files)
+
+        project_path = Path(self.project)
+        result = []
+        for file_path in sorted(files, key=self._order.__getitem__):
+            for imp in self._imports[file_path]:
+                if module in imp.get("module", "") or module in imp.get("names", []):
+                    result.append({
+                        "file": str(Path(file_path).relative_to(project_path)),
+                        "import": copy.deepcopy(imp),
+                    })
+        return result
+
+    def _refresh(self) -> None:
+        """Build the index on first use, then re-parse stale files."""
+        if not self._built:
+            for file_path in self._scan():
+                self._add(file_path)
+            self._built = True
+            self._stale.clear()
+            return
+        if not self._stale:
+            return
+
+        stale, self._stale = self._stale, set()
+        new_files = stale.difference(self._imports)
+        if new_files:
+            # Only files the scan would pick up (right extension, not ignored)
+            new_files.intersection_update(self._scan())
+        for file_path in stale:
+            if file_path in self._imports:
+                self._remove(file_path)
+                if os.path.isfile(file_path):
+                    self._add(file_path)
+                else:
+                    del self._imports[file_path]
+                    del self._order[file_path]
+            elif file_path in new_files:
+                self._add(file_path)
+
+    def _scan(self) -> list[str]:
+        from tldr.api import scan_project_files
+
+        return [os.path.normpath(f) for f in scan_project_files(self.project, language=self.language)]
+
+    def _add(self, file_path: str) -> None:
+        """Parse file_path's imports and index them, keeping its position."""
+        from tldr.api import get_imports
+
+        try:
+            imports = get_imports(file_path, language=self.language)
+        except Exception:
+            imports = []
+        self._imports[file_path] = imports
+        if file_path not in self._order:
+            self._order[file_path] = self._next_order
+            self._next_order += 1
+        for imp in imports:
+            self._by_module.setdefault(imp.get("module", ""), set()).add(file_path)
+            for name in imp.get("names", []):
+                if isinstance(name, str):
+                    self._by_name.setdefault(name, set()).add(file_path)
+
+    def _remove(self, file_path: str) -> None:
+        """Drop file_path's imports from the module and name indexes."""
+        for imp in self._imports[file_path]:
+            self._discard(self._by_module, imp.get("module", ""), file_path)
+            for name in imp.get("names", []):
+                if isinstance(name, str):
+                    self._discard(self._by_name, name, file_path)
+
+    @staticmethod
+    def _discard(index: dict[str, set[str]], key: str, file_path: str) -> None:
+        files = index.get(key)
+        if files is not None:
+            files.discard(file_path)
+            if not files:
+                del index[key]
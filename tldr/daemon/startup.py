@@ -430,8 +430,16 @@ def query_daemon(project_path: str | Path, command: dict) -> dict:
     client = _create_client_socket(daemon)
     try:
         client.sendall(json.dumps(command).encode() + b"\n")
-        response = client.recv(65536)
-        return json.loads(response.decode())
+        # Responses are newline-terminated and can be several MB
+        chunks = []
+        while True:
+            chunk = client.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            if b"\n" in chunk:
+                break
+        return json.loads(b"".join(chunks))
     finally:
         client.close()
 
@@ -19,7 +19,7 @@ from dataclasses import dataclass, field
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class VarRef:
     """
     A reference to a variable (definition or use).
@@ -43,7 +43,7 @@ class VarRef:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class DataflowEdge:
     """
     A def-use relationship connecting a definition to a use.
@@ -1062,12 +1062,12 @@ class TreeSitterDefUseVisitor:
                 self._visit_node(child)
 
 
-def extract_typescript_dfg(code: str, function_name: str) -> DFGInfo:
+def extract_typescript_dfg(code: str | bytes, function_name: str) -> DFGInfo:
     """
     Extract DFG for a TypeScript/JavaScript function.
 
     Args:
-        code: TypeScript/JavaScript source code
+        code: TypeScript/JavaScript source code (str or UTF-8 bytes)
         function_name: Name of function to analyze
 
     Returns:
@@ -1083,7 +1083,7 @@ def extract_typescript_dfg(code: str, function_name: str) -> DFGInfo:
     # Parse with tree-sitter
     ts_lang = Language(tree_sitter_typescript.language_typescript())
     parser = Parser(ts_lang)
-    source_bytes = code.encode('utf-8')
+    source_bytes = code if isinstance(code, bytes) else code.encode('utf-8')
     tree = parser.parse(source_bytes)
 
     # Find the function
@@ -1158,12 +1158,12 @@ def extract_go_dfg(code: str, function_name: str) -> DFGInfo:
     )
 
 
-def extract_rust_dfg(code: str, function_name: str) -> DFGInfo:
+def extract_rust_dfg(code: str | bytes, function_name: str) -> DFGInfo:
     """
     Extract DFG for a Rust function.
 
     Args:
-        code: Rust source code
+        code: Rust source code (str or UTF-8 bytes)
         function_name: Name of function to analyze
 
     Returns:
@@ -1179,7 +1179,7 @@ def extract_rust_dfg(code: str, function_name: str) -> DFGInfo:
     # Parse with tree-sitter
     rust_lang = Language(tree_sitter_rust.language())
     parser = Parser(rust_lang)
-    source_bytes = code.encode('utf-8')
+    source_bytes = code if isinstance(code, bytes) else code.encode('utf-8')
     tree = parser.parse(source_bytes)
 
     # Find the function
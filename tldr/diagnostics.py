@@ -27,6 +27,13 @@ import subprocess
 from pathlib import Path
 from xml.etree import ElementTree
 
+# Optional linear-time regex engine for scanning compiler output
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
 
 # Mapping of language -> tools configuration
 LANG_TOOLS: dict[str, dict] = {
@@ -93,34 +100,52 @@ LANG_TOOLS: dict[str, dict] = {
 }
 
 
+def _compile_output_pattern(pattern: str):
+    """
+    Compile a compiler-output pattern, preferring re2 when installed.
+
+    re2 matches in linear time without backtracking, so a pathological line
+    in a large build log cannot blow up the scan. Patterns re2 rejects fall
+    back to the standard library engine.
+    """
+    if RE2_AVAILABLE:
+        try:
+            return re2.compile(pattern)
+        except re2.error:
+            pass
+    return re.compile(pattern)
+
+
+# Language for each file extension, built once rather than on every lookup
+_LANGUAGE_BY_EXTENSION = {
+    ".py": "python",
+    ".ts": "typescript",
+    ".tsx": "typescript",
+    ".js": "javascript",
+    ".jsx": "javascript",
+    ".go": "go",
+    ".rs": "rust",
+    ".java": "java",
+    ".c": "c",
+    ".h": "c",
+    ".cpp": "cpp",
+    ".cc": "cpp",
+    ".cxx": "cpp",
+    ".hpp": "cpp",
+    ".rb": "ruby",
+    ".php": "php",
+    ".kt": "kotlin",
+    ".swift": "swift",
+    ".cs": "csharp",
+    ".scala": "scala",
+    ".ex": "elixir",
+    ".exs": "elixir",
+}
+
+
 def _detect_language(file_path: str) -> str:
     """Detect language from file extension."""
-    ext = Path(file_path).suffix.lower()
-    mapping = {
-        ".py": "python",
-        ".ts": "typescript",
-        ".tsx": "typescript",
-        ".js": "javascript",
-        ".jsx": "javascript",
-        ".go": "go",
-        ".rs": "rust",
-        ".java": "java",
-        ".c": "c",
-        ".h": "c",
-        ".cpp": "cpp",
-        ".cc": "cpp",
-        ".cxx": "cpp",
-        ".hpp": "cpp",
-        ".rb": "ruby",
-        ".php": "php",
-        ".kt": "kotlin",
-        ".swift": "swift",
-        ".cs": "csharp",
-        ".scala": "scala",
-        ".ex": "elixir",
-        ".exs": "elixir",
-    }
-    return mapping.get(ext, "unknown")
+    return _LANGUAGE_BY_EXTENSION.get(Path(file_path).suffix.lower(), "unknown")
 
 
 def _parse_pyright_output(stdout: str) -> list[dict]:
@@ -163,45 +188,50 @@ def _parse_ruff_output(stdout: str) -> list[dict]:
         return []
 
 
+# tsc format: file(line,col): error TSxxxx: message
+_TSC_DIAGNOSTIC_RE = _compile_output_pattern(
+    r"(?m)^(.+?)\(([0-9]+),([0-9]+)\):[^\S\n]*(error|warning)[^\S\n]+(TS[0-9]+):[^\S\n]*(.+)"
+)
+
+
 def _parse_tsc_output(stderr: str) -> list[dict]:
     """Parse tsc output into structured diagnostics."""
     diagnostics = []
-    # tsc format: file(line,col): error TSxxxx: message
-    pattern = r"(.+?)\((\d+),(\d+)\):\s*(error|warning)\s+(TS\d+):\s*(.+)"
-    for line in stderr.strip().split("\n"):
-        match = re.match(pattern, line)
-        if match:
-            diagnostics.append({
-                "file": match.group(1),
-                "line": int(match.group(2)),
-                "column": int(match.group(3)),
-                "severity": match.group(4),
-                "message": match.group(6),
-                "rule": match.group(5),
-                "source": "tsc",
-            })
+    for match in _TSC_DIAGNOSTIC_RE.finditer(stderr.strip()):
+        file, line, column, severity, rule, message = match.groups()
+        diagnostics.append({
+            "file": file,
+            "line": int(line),
+            "column": int(column),
+            "severity": severity,
+            "message": message,
+            "rule": rule,
+            "source": "tsc",
+        })
     return diagnostics
 
 
+# go vet format: file.go:line:col: message
+_GO_VET_DIAGNOSTIC_RE = _compile_output_pattern(r"(?m)^(.+?):([0-9]+):([0-9]+):[^\S\n]*(.+)")
+
+
 def _parse_go_vet_output(stderr: str) -> list[dict]:
     """Parse go vet output into structured diagnostics."""
     diagnostics = []
-    if not stderr.strip():
+    output = stderr.strip()
+    if not output:
         return diagnostics
-    # go vet format: file.go:line:col: message
-    pattern = r"(.+?):(\d+):(\d+):\s*(.+)"
-    for line in stderr.strip().split("\n"):
-        match = re.match(pattern, line)
-        if match:
-            diagnostics.append({
-                "file": match.group(1),
-                "line": int(match.group(2)),
-                "column": int(match.group(3)),
-                "severity": "error",
-                "message": match.group(4),
-                "rule": "",
-                "source": "go vet",
-            })
+    for match in _GO_VET_DIAGNOSTIC_RE.finditer(output):
+        file, line, column, message = match.groups()
+        diagnostics.append({
+            "file": file,
+            "line": int(line),
+            "column": int(column),
+            "severity": "error",
+            "message": message,
+            "rule": "",
+            "source": "go vet",
+        })
     return diagnostics
 
 
@@ -231,8 +261,10 @@ def _parse_cargo_check_output(stdout: str) -> list[dict]:
     diagnostics = []
     if not stdout.strip():
         return diagnostics
-    # cargo outputs one JSON object per line
-    for line in stdout.strip().split("\n"):
+    # cargo outputs one JSON object per line. Split on "\n" only: splitlines()
+    # would also break at U+0085/U+2028, which JSON allows unescaped inside
+    # strings. Blank lines and a trailing "\r" are handled by json.loads.
+    for line in stdout.split("\n"):
         try:
             data = json.loads(line)
             if data.get("reason") != "compiler-message":
@@ -263,7 +295,7 @@ def _parse_clippy_output(stdout: str) -> list[dict]:
     if not stdout.strip():
         return diagnostics
     # clippy uses the same format as cargo check
-    for line in stdout.strip().split("\n"):
+    for line in stdout.split("\n"):
         try:
             data = json.loads(line)
             if data.get("reason") != "compiler-message":
@@ -418,25 +450,29 @@ def _parse_credo_output(stdout: str) -> list[dict]:
         return []
 
 
+# javac format: file.java:line: error: message
+_JAVAC_DIAGNOSTIC_RE = _compile_output_pattern(
+    r"(?m)^(.+?):([0-9]+):[^\S\n]*(error|warning):[^\S\n]*(.+)"
+)
+
+
 def _parse_javac_output(stderr: str) -> list[dict]:
     """Parse javac output into structured diagnostics."""
     diagnostics = []
-    if not stderr.strip():
+    output = stderr.strip()
+    if not output:
         return diagnostics
-    # javac format: file.java:line: error: message
-    pattern = r"(.+?):(\d+):\s*(error|warning):\s*(.+)"
-    for line in stderr.strip().split("\n"):
-        match = re.match(pattern, line)
-        if match:
-            diagnostics.append({
-                "file": match.group(1),
-                "line": int(match.group(2)),
-                "column": 0,
-                "severity": match.group(3),
-                "message": match.group(4),
-                "rule": "",
-                "source": "javac",
-            })
+    for match in _JAVAC_DIAGNOSTIC_RE.finditer(output):
+        file, line, severity, message = match.groups()
+        diagnostics.append({
+            "file": file,
+            "line": int(line),
+            "column": 0,
+            "severity": severity,
+            "message": message,
+            "rule": "",
+            "source": "javac",
+        })
     return diagnostics
 
 
@@ -464,137 +500,116 @@ def _parse_checkstyle_output(stdout: str) -> list[dict]:
         return []
 
 
-def _parse_gcc_output(stderr: str) -> list[dict]:
-    """Parse gcc/g++/clang output into structured diagnostics."""
-    diagnostics = []
-    if not stderr.strip():
-        return diagnostics
-    # gcc format: file.c:line:col: error: message
-    pattern = r"(.+?):(\d+):(\d+):\s*(error|warning):\s*(.+)"
-    for line in stderr.strip().split("\n"):
-        match = re.match(pattern, line)
-        if match:
-            diagnostics.append({
-                "file": match.group(1),
-                "line": int(match.group(2)),
-                "column": int(match.group(3)),
-                "severity": match.group(4),
-                "message": match.group(5),
-                "rule": "",
-                "source": "gcc",
-            })
-    return diagnostics
+# gcc/g++/clang, kotlinc and swiftc format: file:line:col: error: message
+# Matched line-by-line over the whole output; [^\S\n] keeps whitespace
+# runs from crossing into the next line. Digits and rule codes use explicit
+# ASCII classes rather than the Unicode-aware \d and \w.
+_COMPILER_DIAGNOSTIC_RE = _compile_output_pattern(
+    r"(?m)^(.+?):([0-9]+):([0-9]+):[^\S\n]*(error|warning):[^\S\n]*(.+)"
+)
 
 
-def _parse_kotlinc_output(stderr: str) -> list[dict]:
-    """Parse kotlinc output into structured diagnostics."""
+def _parse_compiler_output(stderr: str, source: str) -> list[dict]:
+    """Parse file:line:col: severity: message compiler output into diagnostics."""
     diagnostics = []
-    if not stderr.strip():
+    output = stderr.strip()
+    # Every diagnostic line carries one of these literals; a plain substring
+    # search is far cheaper than running the pattern over a clean build log
+    if "error" not in output and "warning" not in output:
         return diagnostics
-    # kotlinc format: file.kt:line:col: error: message
-    pattern = r"(.+?):(\d+):(\d+):\s*(error|warning):\s*(.+)"
-    for line in stderr.strip().split("\n"):
-        match = re.match(pattern, line)
-        if match:
-            diagnostics.append({
-                "file": match.group(1),
-                "line": int(match.group(2)),
-                "column": int(match.group(3)),
-                "severity": match.group(4),
-                "message": match.group(5),
-                "rule": "",
-                "source": "kotlinc",
-            })
+    for match in _COMPILER_DIAGNOSTIC_RE.finditer(output):
+        file, line, column, severity, message = match.groups()
+        diagnostics.append({
+            "file": file,
+            "line": int(line),
+            "column": int(column),
+            "severity": severity,
+            "message": message,
+            "rule": "",
+            "source": source,
+        })
     return diagnostics
 
 
-def _parse_swiftc_output(stderr: str) -> list[dict]:
-    """Parse swiftc output into structured diagnostics."""
-    diagnostics = []
-    if not stderr.strip():
-        return diagnostics
-    # swiftc format: file.swift:line:col: error: message
-    pattern = r"(.+?):(\d+):(\d+):\s*(error|warning):\s*(.+)"
-    for line in stderr.strip().split("\n"):
-        match = re.match(pattern, line)
-        if match:
-            diagnostics.append({
-                "file": match.group(1),
-                "line": int(match.group(2)),
-                "column": int(match.group(3)),
-                "severity": match.group(4),
-                "message": match.group(5),
-                "rule": "",
-                "source": "swiftc",
-            })
-    return diagnostics
+# dotnet format: file.cs(line,col): error CS0000: message
+_DOTNET_DIAGNOSTIC_RE = _compile_output_pattern(
+    r"(?m)^(.+?)\(([0-9]+),([0-9]+)\):[^\S\n]*(error|warning)[^\S\n]+([A-Za-z0-9_]+):[^\S\n]*(.+)"
+)
 
 
 def _parse_dotnet_build_output(stderr: str) -> list[dict]:
     """Parse dotnet build output into structured diagnostics."""
     diagnostics = []
-    if not stderr.strip():
+    output = stderr.strip()
+    # Every diagnostic line carries one of these literals; a plain substring
+    # search is far cheaper than running the pattern over a clean build log
+    if "error" not in output and "warning" not in output:
         return diagnostics
-    # dotnet format: file.cs(line,col): error CS0000: message
-    pattern = r"(.+?)\((\d+),(\d+)\):\s*(error|warning)\s+(\w+):\s*(.+)"
-    for line in stderr.strip().split("\n"):
-        match = re.match(pattern, line)
-        if match:
-            diagnostics.append({
-                "file": match.group(1),
-                "line": int(match.group(2)),
-                "column": int(match.group(3)),
-                "severity": match.group(4),
-                "message": match.group(6),
-                "rule": match.group(5),
-                "source": "dotnet",
-            })
+    for match in _DOTNET_DIAGNOSTIC_RE.finditer(output):
+        file, line, column, severity, rule, message = match.groups()
+        diagnostics.append({
+            "file": file,
+            "line": int(line),
+            "column": int(column),
+            "severity": severity,
+            "message": message,
+            "rule": rule,
+            "source": "dotnet",
+        })
     return diagnostics
 
 
+# scalac format varies, common: file.scala:line: error: message
+_SCALAC_DIAGNOSTIC_RE = _compile_output_pattern(
+    r"(?m)^(.+?):([0-9]+):[^\S\n]*(error|warning):[^\S\n]*(.+)"
+)
+
+
 def _parse_scalac_output(stderr: str) -> list[dict]:
     """Parse scalac output into structured diagnostics."""
     diagnostics = []
-    if not stderr.strip():
+    output = stderr.strip()
+    if not output:
         return diagnostics
-    # scalac format varies, common: file.scala:line: error: message
-    pattern = r"(.+?):(\d+):\s*(error|warning):\s*(.+)"
-    for line in stderr.strip().split("\n"):
-        match = re.match(pattern, line)
-        if match:
-            diagnostics.append({
-                "file": match.group(1),
-                "line": int(match.group(2)),
-                "column": 0,
-                "severity": match.group(3),
-                "message": match.group(4),
-                "rule": "",
-                "source": "scalac",
-            })
+    for match in _SCALAC_DIAGNOSTIC_RE.finditer(output):
+        file, line, severity, message = match.groups()
+        diagnostics.append({
+            "file": file,
+            "line": int(line),
+            "column": 0,
+            "severity": severity,
+            "message": message,
+            "rule": "",
+            "source": "scalac",
+        })
     return diagnostics
 
 
+# mix compile format: warning: message
+#   file.ex:line
+# Or: ** (CompileError) file.ex:line: message
+_MIX_DIAGNOSTIC_RE = _compile_output_pattern(
+    r"(?m)^\*\*[^\S\n]*\(([A-Za-z0-9_]+)\)[^\S\n]*(.+?):([0-9]+):[^\S\n]*(.+)"
+)
+
+
 def _parse_mix_compile_output(stderr: str) -> list[dict]:
     """Parse mix compile output into structured diagnostics."""
     diagnostics = []
-    if not stderr.strip():
+    output = stderr.strip()
+    if not output:
         return diagnostics
-    # mix compile format: warning: message
-    #   file.ex:line
-    # Or: ** (CompileError) file.ex:line: message
-    pattern = r"\*\*\s*\((\w+)\)\s*(.+?):(\d+):\s*(.+)"
-    for line in stderr.strip().split("\n"):
-        match = re.match(pattern, line)
-        if match:
-            diagnostics.append({
-                "file": match.group(2),
-                "line": int(match.group(3)),
-                "column": 0,
-                "severity": "error" if "Error" in match.group(1) else "warning",
-                "message": match.group(4),
-                "rule": "",
-                "source": "mix",
-            })
+    for match in _MIX_DIAGNOSTIC_RE.finditer(output):
+        kind, file, line, message = match.groups()
+        diagnostics.append({
+            "file": file,
+            "line": int(line),
+            "column": 0,
+            "severity": "error" if "Error" in kind else "warning",
+            "message": message,
+            "rule": "",
+            "source": "mix",
+        })
     return diagnostics
 
 
@@ -766,7 +781,7 @@ def get_diagnostics(
                     text=True,
                     timeout=30,
                 )
-                all_diagnostics.extend(_parse_gcc_output(result.stderr))
+                all_diagnostics.extend(_parse_compiler_output(result.stderr, "gcc"))
                 tools_used.append(compiler)
             except subprocess.TimeoutExpired:
                 pass
@@ -827,7 +842,7 @@ def get_diagnostics(
                     text=True,
                     timeout=60,
                 )
-                all_diagnostics.extend(_parse_kotlinc_output(result.stderr))
+                all_diagnostics.extend(_parse_compiler_output(result.stderr, "kotlinc"))
                 tools_used.append("kotlinc")
             except subprocess.TimeoutExpired:
                 pass
@@ -856,7 +871,7 @@ def get_diagnostics(
                     text=True,
                     timeout=30,
                 )
-                all_diagnostics.extend(_parse_swiftc_output(result.stderr))
+                all_diagnostics.extend(_parse_compiler_output(result.stderr, "swiftc"))
                 tools_used.append("swiftc")
             except subprocess.TimeoutExpired:
                 pass
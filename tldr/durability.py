@@ -133,32 +133,27 @@ class VolatilePartition:
 
         This is used during incremental updates when a file is re-indexed.
         """
-        # Get current edges and filter out those from the target file
-        current_edges = set(self.graph.edges)
+        # Rebuild the graph from the edges that don't come from the target file
         new_graph = ProjectCallGraph()
-
-        for edge in current_edges:
-            if edge[0] != file_path:
-                new_graph.add_edge(*edge)
+        new_graph.add_edges(edge for edge in self.graph if edge[0] != file_path)
 
         self.graph = new_graph
 
     def get_edges_for_file(self, file_path: str) -> List[Tuple[str, str, str, str]]:
         """Return all edges originating from a specific file."""
-        return [e for e in self.edges if e[0] == file_path]
+        return [e for e in self.graph if e[0] == file_path]
 
     def to_dict(self) -> dict:
         """Serialize to dictionary for JSON storage."""
         return {
-            "edges": list(self.edges),
+            "edges": list(self.graph),
         }
 
     @classmethod
     def from_dict(cls, data: dict) -> "VolatilePartition":
         """Deserialize from dictionary."""
         partition = cls()
-        for edge in data.get("edges", []):
-            partition.add_edge(*edge)
+        partition.graph.add_edges(data.get("edges", []))
         return partition
 
 
@@ -240,7 +235,7 @@ class PartitionedIndex:
 
     def get_all_edges(self) -> List[Tuple[str, str, str, str]]:
         """Get all edges from both partitions (merged)."""
-        all_edges = list(self.volatile.edges)
+        all_edges = list(self.volatile.graph)
         for partition in self.durable.values():
             all_edges.extend(partition.edges)
         return all_edges
@@ -10,6 +10,7 @@ Strategy:
 Output is unified across all extractors.
 """
 
+import functools
 import json
 import logging
 import os
@@ -185,6 +186,46 @@ class HybridExtractor:
     LUAU_EXTENSIONS = {".luau"}
     ELIXIR_EXTENSIONS = {".ex", ".exs"}
 
+    # Tree-sitter extractor per extension, as (method, grammar available,
+    # language, grammar name for logs), so extract() dispatches on one lookup
+    _TREE_SITTER_EXTRACTORS = {
+        **dict.fromkeys(TREE_SITTER_EXTENSIONS, ("_extract_tree_sitter", TREE_SITTER_AVAILABLE, "typescript", "Tree-sitter")),
+        **dict.fromkeys(GO_EXTENSIONS, ("_extract_go", TREE_SITTER_GO_AVAILABLE and TREE_SITTER_AVAILABLE, "go", "Tree-sitter-go")),
+        **dict.fromkeys(RUST_EXTENSIONS, ("_extract_rust", TREE_SITTER_RUST_AVAILABLE and TREE_SITTER_AVAILABLE, "rust", "Tree-sitter-rust")),
+        **dict.fromkeys(JAVA_EXTENSIONS, ("_extract_java", TREE_SITTER_JAVA_AVAILABLE and TREE_SITTER_AVAILABLE, "java", "Tree-sitter-java")),
+        **dict.fromkeys(C_EXTENSIONS, ("_extract_c", TREE_SITTER_C_AVAILABLE, "c", "Tree-sitter-c")),
+        **dict.fromkeys(CPP_EXTENSIONS, ("_extract_cpp", TREE_SITTER_CPP_AVAILABLE, "cpp", "Tree-sitter-cpp")),
+        **dict.fromkeys(RUBY_EXTENSIONS, ("_extract_ruby", TREE_SITTER_RUBY_AVAILABLE, "ruby", "Tree-sitter-ruby")),
+        **dict.fromkeys(KOTLIN_EXTENSIONS, ("_extract_kotlin", TREE_SITTER_KOTLIN_AVAILABLE, "kotlin", "Tree-sitter-kotlin")),
+        **dict.fromkeys(SWIFT_EXTENSIONS, ("_extract_swift", TREE_SITTER_SWIFT_AVAILABLE, "swift", "Tree-sitter-swift")),
+        **dict.fromkeys(CSHARP_EXTENSIONS, ("_extract_csharp", TREE_SITTER_CSHARP_AVAILABLE, "csharp", "Tree-sitter-c-sharp")),
+        **dict.fromkeys(SCALA_EXTENSIONS, ("_extract_scala", TREE_SITTER_SCALA_AVAILABLE, "scala", "Tree-sitter-scala")),
+        **dict.fromkeys(LUA_EXTENSIONS, ("_extract_lua", TREE_SITTER_LUA_AVAILABLE, "lua", "Tree-sitter-lua")),
+        **dict.fromkeys(LUAU_EXTENSIONS, ("_extract_luau", TREE_SITTER_LUAU_AVAILABLE, "luau", "Tree-sitter-luau")),
+        **dict.fromkeys(ELIXIR_EXTENSIONS, ("_extract_elixir", TREE_SITTER_ELIXIR_AVAILABLE, "elixir", "Tree-sitter-elixir")),
+    }
+
+    # Extension lookups for language detection, built once per class
+    _TREE_SITTER_LANGUAGES = {
+        ".ts": "typescript",
+        ".tsx": "tsx",
+        ".js": "javascript",
+        ".jsx": "javascript",
+        ".mjs": "javascript",
+        ".cjs": "javascript",
+    }
+    _LANGUAGE_BY_EXTENSION = {
+        ".py": "python", ".pyx": "python", ".pyi": "python",
+        ".js": "javascript", ".jsx": "javascript", ".mjs": "javascript",
+        ".ts": "typescript", ".tsx": "typescript",
+        ".go": "go", ".rs": "rust", ".rb": "ruby",
+        ".java": "java", ".kt": "kotlin",
+        ".c": "c", ".h": "c", ".cpp": "cpp", ".hpp": "cpp",
+        ".cs": "csharp", ".swift": "swift",
+        ".scala": "scala", ".sc": "scala",
+        ".lua": "lua", ".luau": "luau",
+    }
+
     def __init__(self):
         self._pygments_extractor = SignatureExtractor()
         self._ts_parsers: dict[str, Any] = {}
@@ -230,117 +271,19 @@ class HybridExtractor:
         if suffix in self.PYTHON_EXTENSIONS:
             return extract_python(file_path)
 
-        # JS/TS - use tree-sitter if available
-        if suffix in self.TREE_SITTER_EXTENSIONS:
-            if TREE_SITTER_AVAILABLE:
-                result = self._try_tree_sitter(lambda fp: self._extract_tree_sitter(fp, suffix), file_path, "typescript")
-                if result:
-                    return result
-            logger.debug(f"Tree-sitter not available or failed, using Pygments for {suffix}")
-
-        # Go - use tree-sitter-go if available
-        if suffix in self.GO_EXTENSIONS:
-            if TREE_SITTER_GO_AVAILABLE and TREE_SITTER_AVAILABLE:
-                result = self._try_tree_sitter(self._extract_go, file_path, "go")
-                if result:
-                    return result
-            logger.debug(f"Tree-sitter-go not available or failed, using Pygments for {suffix}")
-
-        # Rust - use tree-sitter-rust if available
-        if suffix in self.RUST_EXTENSIONS:
-            if TREE_SITTER_RUST_AVAILABLE and TREE_SITTER_AVAILABLE:
-                result = self._try_tree_sitter(self._extract_rust, file_path, "rust")
-                if result:
-                    return result
-            logger.debug(f"Tree-sitter-rust not available or failed, using Pygments for {suffix}")
-
-        # Java - use tree-sitter-java if available
-        if suffix in self.JAVA_EXTENSIONS:
-            if TREE_SITTER_JAVA_AVAILABLE and TREE_SITTER_AVAILABLE:
-                result = self._try_tree_sitter(self._extract_java, file_path, "java")
-                if result:
-                    return result
-            logger.debug(f"Tree-sitter-java not available or failed, using Pygments for {suffix}")
-
-        # C - use tree-sitter-c if available
-        if suffix in self.C_EXTENSIONS:
-            if TREE_SITTER_C_AVAILABLE:
-                result = self._try_tree_sitter(self._extract_c, file_path, "c")
-                if result:
-                    return result
-            logger.debug(f"Tree-sitter-c not available or failed, using Pygments for {suffix}")
-
-        # C++ - use tree-sitter-cpp if available
-        if suffix in self.CPP_EXTENSIONS:
-            if TREE_SITTER_CPP_AVAILABLE:
-                result = self._try_tree_sitter(self._extract_cpp, file_path, "cpp")
-                if result:
-                    return result
-            logger.debug(f"Tree-sitter-cpp not available or failed, using Pygments for {suffix}")
-
-        # Ruby - use tree-sitter-ruby if available
-        if suffix in self.RUBY_EXTENSIONS:
-            if TREE_SITTER_RUBY_AVAILABLE:
-                result = self._try_tree_sitter(self._extract_ruby, file_path, "ruby")
-                if result:
-                    return result
-            logger.debug(f"Tree-sitter-ruby not available or failed, using Pygments for {suffix}")
-
-        # Kotlin - use tree-sitter-kotlin if available
-        if suffix in self.KOTLIN_EXTENSIONS:
-            if TREE_SITTER_KOTLIN_AVAILABLE:
-                result = self._try_tree_sitter(self._extract_kotlin, file_path, "kotlin")
-                if result:
-                    return result
-            logger.debug(f"Tree-sitter-kotlin not available or failed, using Pygments for {suffix}")
-
-        # Swift - use tree-sitter-swift if available
-        if suffix in self.SWIFT_EXTENSIONS:
-            if TREE_SITTER_SWIFT_AVAILABLE:
-                result = self._try_tree_sitter(self._extract_swift, file_path, "swift")
-                if result:
-                    return result
-            logger.debug(f"Tree-sitter-swift not available or failed, using Pygments for {suffix}")
-
-        # C# - use tree-sitter-c-sharp if available
-        if suffix in self.CSHARP_EXTENSIONS:
-            if TREE_SITTER_CSHARP_AVAILABLE:
-                result = self._try_tree_sitter(self._extract_csharp, file_path, "csharp")
-                if result:
-                    return result
-            logger.debug(f"Tree-sitter-c-sharp not available or failed, using Pygments for {suffix}")
-
-        # Scala - use tree-sitter-scala if available
-        if suffix in self.SCALA_EXTENSIONS:
-            if TREE_SITTER_SCALA_AVAILABLE:
-                result = self._try_tree_sitter(self._extract_scala, file_path, "scala")
-                if result:
-                    return result
-            logger.debug(f"Tree-sitter-scala not available or failed, using Pygments for {suffix}")
-
-        # Lua - use tree-sitter-lua if available
-        if suffix in self.LUA_EXTENSIONS:
-            if TREE_SITTER_LUA_AVAILABLE:
-                result = self._try_tree_sitter(self._extract_lua, file_path, "lua")
-                if result:
-                    return result
-            logger.debug(f"Tree-sitter-lua not available or failed, using Pygments for {suffix}")
-
-        # Luau - use tree-sitter-luau if available
-        if suffix in self.LUAU_EXTENSIONS:
-            if TREE_SITTER_LUAU_AVAILABLE:
-                result = self._try_tree_sitter(self._extract_luau, file_path, "luau")
-                if result:
-                    return result
-            logger.debug(f"Tree-sitter-luau not available or failed, using Pygments for {suffix}")
-
-        # Elixir - use tree-sitter-elixir if available
-        if suffix in self.ELIXIR_EXTENSIONS:
-            if TREE_SITTER_ELIXIR_AVAILABLE:
-                result = self._try_tree_sitter(self._extract_elixir, file_path, "elixir")
+        # Everything else - use its tree-sitter grammar if available
+        extractor = self._TREE_SITTER_EXTRACTORS.get(suffix)
+        if extractor is not None:
+            method_name, available, language, grammar = extractor
+            if available:
+                extract_fn = getattr(self, method_name)
+                if method_name == "_extract_tree_sitter":
+                    # JS/TS picks its grammar from the suffix
+                    extract_fn = functools.partial(extract_fn, suffix=suffix)
+                result = self._try_tree_sitter(extract_fn, file_path, language)
                 if result:
                     return result
-            logger.debug(f"Tree-sitter-elixir not available or failed, using Pygments for {suffix}")
+            logger.debug(f"{grammar} not available or failed, using Pygments for {suffix}")
 
         # Fallback to Pygments
         return self._extract_pygments(file_path)
@@ -376,15 +319,7 @@ class HybridExtractor:
 
     def _extract_tree_sitter(self, file_path: Path, suffix: str) -> ModuleInfo:
         """Extract using tree-sitter for JS/TS."""
-        lang_map = {
-            ".ts": "typescript",
-            ".tsx": "tsx",
-            ".js": "javascript",
-            ".jsx": "javascript",
-            ".mjs": "javascript",
-            ".cjs": "javascript",
-        }
-        language = lang_map.get(suffix, "javascript")
+        language = self._TREE_SITTER_LANGUAGES.get(suffix, "javascript")
 
         with open(file_path, "rb") as f:
             source = f.read()
@@ -3155,7 +3090,7 @@ class HybridExtractor:
         """Parse Pygments signature output."""
         if not text or not text.strip():
             return []
-        lines = text.strip().split('\n')
+        lines = text.strip().splitlines()
         return [
             line.strip().lstrip("- ").lstrip("* ")
             for line in lines
@@ -3174,18 +3109,7 @@ class HybridExtractor:
 
     def _detect_language(self, file_path: Path) -> str:
         """Detect language from file extension."""
-        ext_map = {
-            ".py": "python", ".pyx": "python", ".pyi": "python",
-            ".js": "javascript", ".jsx": "javascript", ".mjs": "javascript",
-            ".ts": "typescript", ".tsx": "typescript",
-            ".go": "go", ".rs": "rust", ".rb": "ruby",
-            ".java": "java", ".kt": "kotlin",
-            ".c": "c", ".h": "c", ".cpp": "cpp", ".hpp": "cpp",
-            ".cs": "csharp", ".swift": "swift",
-            ".scala": "scala", ".sc": "scala",
-            ".lua": "lua", ".luau": "luau",
-        }
-        return ext_map.get(file_path.suffix.lower(), "unknown")
+        return self._LANGUAGE_BY_EXTENSION.get(file_path.suffix.lower(), "unknown")
 
 
 def extract_directory(
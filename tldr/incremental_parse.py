@@ -157,14 +157,11 @@ def _byte_offset_to_point(content: bytes, byte_offset: int) -> tuple[int, int]:
     # Ensure we don't go past the end
     byte_offset = min(byte_offset, len(content))
 
-    # Get content up to offset
-    prefix = content[:byte_offset]
-
-    # Count newlines for row
-    row = prefix.count(b"\n")
+    # Count newlines for row; the bounded search avoids copying the prefix
+    row = content.count(b"\n", 0, byte_offset)
 
     # Find last newline position for column
-    last_newline = prefix.rfind(b"\n")
+    last_newline = content.rfind(b"\n", 0, byte_offset)
     if last_newline == -1:
         column = byte_offset
     else:
@@ -173,6 +170,34 @@ def _byte_offset_to_point(content: bytes, byte_offset: int) -> tuple[int, int]:
     return (row, column)
 
 
+def _common_prefix_length(a: bytes, b: bytes) -> int:
+    """Length of the longest common prefix of a and b.
+
+    Binary search over slice comparisons, so the bytes are compared by
+    memcmp rather than one Python-level step per byte.
+    """
+    lo, hi = 0, min(len(a), len(b))
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[:mid] == b[:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def _common_suffix_length(a: bytes, b: bytes) -> int:
+    """Length of the longest common suffix of a and b."""
+    lo, hi = 0, min(len(a), len(b))
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[len(a) - mid:] == b[len(b) - mid:]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
 def calculate_edit_range(old_content: bytes, new_content: bytes) -> Optional[EditRange]:
     """Calculate the edit range between old and new content.
 
@@ -189,24 +214,13 @@ def calculate_edit_range(old_content: bytes, new_content: bytes) -> Optional[Edi
         return None
 
     # Find first differing byte (from start)
-    start_byte = 0
-    min_len = min(len(old_content), len(new_content))
-    while start_byte < min_len and old_content[start_byte] == new_content[start_byte]:
-        start_byte += 1
-
-    # Find first differing byte (from end)
-    old_end_offset = 0
-    new_end_offset = 0
-    while (
-        old_end_offset < len(old_content) - start_byte
-        and new_end_offset < len(new_content) - start_byte
-        and old_content[-(old_end_offset + 1)] == new_content[-(new_end_offset + 1)]
-    ):
-        old_end_offset += 1
-        new_end_offset += 1
-
-    old_end_byte = len(old_content) - old_end_offset
-    new_end_byte = len(new_content) - new_end_offset
+    start_byte = _common_prefix_length(old_content, new_content)
+
+    # Find first differing byte (from end), without overlapping the prefix
+    end_offset = _common_suffix_length(old_content[start_byte:], new_content[start_byte:])
+
+    old_end_byte = len(old_content) - end_offset
+    new_end_byte = len(new_content) - end_offset
 
     # Ensure end >= start
     old_end_byte = max(old_end_byte, start_byte)
@@ -238,6 +252,20 @@ class CacheEntry:
     # and re-parse on cache load
 
 
+# Language recorded in a cache entry, by file extension
+_LANGUAGE_BY_SUFFIX = {
+    ".ts": "typescript",
+    ".tsx": "tsx",
+    ".js": "javascript",
+    ".jsx": "javascript",
+    ".mjs": "javascript",
+    ".cjs": "javascript",
+    ".py": "python",
+    ".go": "go",
+    ".rs": "rust",
+}
+
+
 class TreeCache:
     """Cache for parsed syntax trees.
 
@@ -328,19 +356,7 @@ class TreeCache:
 
     def _detect_language(self, file_path: str) -> str:
         """Detect language from file extension."""
-        suffix = Path(file_path).suffix.lower()
-        lang_map = {
-            ".ts": "typescript",
-            ".tsx": "tsx",
-            ".js": "javascript",
-            ".jsx": "javascript",
-            ".mjs": "javascript",
-            ".cjs": "javascript",
-            ".py": "python",
-            ".go": "go",
-            ".rs": "rust",
-        }
-        return lang_map.get(suffix, "unknown")
+        return _LANGUAGE_BY_SUFFIX.get(Path(file_path).suffix.lower(), "unknown")
 
     def get(self, file_path: str) -> Optional[tuple[Any, bytes]]:
         """Retrieve a cached tree and source.
@@ -351,27 +367,48 @@ class TreeCache:
         Returns:
             (tree, source) tuple if cached, None otherwise
         """
+        cached = self.lookup(file_path)
+        if cached is None:
+            return None
+        tree, source = cached
+        if tree is not None:
+            return cached
+
+        # Re-parse tree from the source stored on disk
+        try:
+            parser = _get_parser(self._index[file_path].language)
+            if parser:
+                tree = parser.parse(source)
+                self._memory_cache[file_path] = (tree, source)
+                return (tree, source)
+        except Exception as e:
+            logger.warning(f"Failed to load cached tree for {file_path}: {e}")
+
+        return None
+
+    def lookup(self, file_path: str) -> Optional[tuple[Optional[Any], bytes]]:
+        """Retrieve a cached source without re-parsing it.
+
+        Args:
+            file_path: Path to the source file
+
+        Returns:
+            (tree, source) tuple if cached, where tree is None when only the
+            source was found on disk; None if the file isn't cached
+        """
         # Check memory cache first
         if file_path in self._memory_cache:
             return self._memory_cache[file_path]
 
         # Check disk cache
         if file_path in self._index and self._cache_dir:
-            entry = self._index[file_path]
             cache_path = self._get_cache_path(file_path)
 
             if cache_path.exists():
                 try:
                     with open(cache_path, "rb") as f:
-                        source = f.read()
-
-                    # Re-parse tree from source
-                    parser = _get_parser(entry.language)
-                    if parser:
-                        tree = parser.parse(source)
-                        self._memory_cache[file_path] = (tree, source)
-                        return (tree, source)
-                except Exception as e:
+                        return (None, f.read())
+                except OSError as e:
                     logger.warning(f"Failed to load cached tree for {file_path}: {e}")
 
         return None
@@ -566,10 +603,14 @@ class IncrementalParser:
         with open(path, "rb") as f:
             new_content = f.read()
 
-        # Check cache
-        cached = self._cache.get(file_path)
+        # Check cache. A source found only on disk has no tree yet, and is
+        # only worth parsing when it is unchanged: an incremental parse
+        # against it would need a full parse of the old content first.
+        cached = self._cache.lookup(file_path)
+        if cached is not None and cached[0] is None and cached[1] == new_content:
+            cached = self._cache.get(file_path)
 
-        if cached is not None:
+        if cached is not None and cached[0] is not None:
             old_tree, old_content = cached
 
             # Check if content unchanged (cache hit)
@@ -171,18 +171,17 @@ def _send_raw(project: str, command: dict) -> dict:
     
         sock.sendall(json.dumps(command).encode() + b"\n")
 
-        # Read response
+        # Read response: one JSON document terminated by a newline. Only the
+        # newest chunk is checked, so multi-MB responses are joined and
+        # parsed once instead of after every chunk
         chunks = []
         while True:
             chunk = sock.recv(65536)
             if not chunk:
                 break
             chunks.append(chunk)
-            # Check if we have complete JSON
-            try:
-                return json.loads(b"".join(chunks))
-            except json.JSONDecodeError:
-                continue
+            if b"\n" in chunk:
+                break
 
         return json.loads(b"".join(chunks))
     finally:
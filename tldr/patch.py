@@ -35,7 +35,7 @@ from tldr.cross_file_calls import (
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Edge:
     """Represents a call edge from one function to another.
 
@@ -199,8 +199,8 @@ def patch_call_graph(
         if src_file == rel_path:
             edges_to_remove.add(edge)
 
-    # Remove the edges (modify internal state)
-    graph._edges -= edges_to_remove
+    # Remove the edges
+    graph.remove_edges(edges_to_remove)
 
     # Step 2: Extract new edges from the edited file
     new_edges = extract_edges_from_file(
@@ -210,8 +210,10 @@ def patch_call_graph(
     )
 
     # Step 3: Add new edges to the graph
-    for edge in new_edges:
-        graph.add_edge(edge.from_file, edge.from_func, edge.to_file, edge.to_func)
+    graph.add_edges(
+        (edge.from_file, edge.from_func, edge.to_file, edge.to_func)
+        for edge in new_edges
+    )
 
     return graph
 
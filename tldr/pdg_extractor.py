@@ -457,14 +457,16 @@ def extract_typescript_pdg(source_code: str, function_name: str) -> PDGInfo | No
     Extract PDG for a TypeScript/JavaScript function.
     """
     try:
+        # Encode once; the CFG and DFG extractors both parse the same bytes
+        source_bytes = source_code.encode("utf-8")
         from .cfg_extractor import extract_typescript_cfg
         from .dfg_extractor import extract_typescript_dfg
 
-        cfg = extract_typescript_cfg(source_code, function_name)
+        cfg = extract_typescript_cfg(source_bytes, function_name)
         if cfg is None:
             return None
 
-        dfg = extract_typescript_dfg(source_code, function_name)
+        dfg = extract_typescript_dfg(source_bytes, function_name)
         if dfg is None:
             return None
 
@@ -481,14 +483,15 @@ def extract_javascript_pdg(source_code: str, function_name: str) -> PDGInfo | No
     Uses TypeScript extractors since tree-sitter parses JS/TS identically.
     """
     try:
+        source_bytes = source_code.encode("utf-8")
         from .cfg_extractor import extract_typescript_cfg
         from .dfg_extractor import extract_typescript_dfg
 
-        cfg = extract_typescript_cfg(source_code, function_name)
+        cfg = extract_typescript_cfg(source_bytes, function_name)
         if cfg is None:
             return None
 
-        dfg = extract_typescript_dfg(source_code, function_name)
+        dfg = extract_typescript_dfg(source_bytes, function_name)
         if dfg is None:
             return None
 
@@ -535,14 +538,15 @@ def extract_rust_pdg(source_code: str, function_name: str) -> PDGInfo | None:
     Extract PDG for a Rust function.
     """
     try:
+        source_bytes = source_code.encode("utf-8")
         from .cfg_extractor import extract_rust_cfg
         from .dfg_extractor import extract_rust_dfg
 
-        cfg = extract_rust_cfg(source_code, function_name)
+        cfg = extract_rust_cfg(source_bytes, function_name)
         if cfg is None:
             return None
 
-        dfg = extract_rust_dfg(source_code, function_name)
+        dfg = extract_rust_dfg(source_bytes, function_name)
         if dfg is None:
             return None
 
@@ -16,6 +16,7 @@ import json
 import logging
 import os
 import sys
+import threading
 from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -28,6 +29,7 @@ ALL_LANGUAGES = ["python", "typescript", "javascript", "go", "rust", "java", "c"
 # Lazy imports for heavy dependencies
 _model = None
 _model_name = None  # Track which model is loaded
+_model_lock = threading.Lock()
 
 # Supported models with approximate download sizes
 SUPPORTED_MODELS = {
@@ -197,16 +199,22 @@ def get_model(model_name: Optional[str] = None):
     if _model is not None and _model_name == hf_name:
         return _model
 
-    # Check if model needs downloading
-    if not _model_exists_locally(hf_name):
-        model_key = model_name if model_name in SUPPORTED_MODELS else None
-        if model_key and not _confirm_download(model_key):
-            raise ValueError(f"Model download declined. Use --model to choose a smaller model.")
-
-    from sentence_transformers import SentenceTransformer
-    _model = SentenceTransformer(hf_name)
-    _model_name = hf_name
-    return _model
+    # The daemon re-indexes on a background thread while serving searches,
+    # so make sure only one of them loads the model
+    with _model_lock:
+        if _model is not None and _model_name == hf_name:
+            return _model
+
+        # Check if model needs downloading
+        if not _model_exists_locally(hf_name):
+            model_key = model_name if model_name in SUPPORTED_MODELS else None
+            if model_key and not _confirm_download(model_key):
+                raise ValueError(f"Model download declined. Use --model to choose a smaller model.")
+
+        from sentence_transformers import SentenceTransformer
+        _model = SentenceTransformer(hf_name)
+        _model_name = hf_name
+        return _model
 
 
 def build_embedding_text(unit: EmbeddingUnit) -> str:
@@ -283,7 +291,13 @@ def compute_embedding(text: str, model_name: Optional[str] = None):
     return np.array(embedding, dtype=np.float32)
 
 
-def extract_units_from_project(project_path: str, lang: str = "python", respect_ignore: bool = True, progress_callback=None) -> List[EmbeddingUnit]:
+def extract_units_from_project(
+    project_path: str,
+    lang: str = "python",
+    respect_ignore: bool = True,
+    progress_callback=None,
+    max_workers: Optional[int] = None,
+) -> List[EmbeddingUnit]:
     """Extract all functions/methods/classes from a project.
 
     Uses existing TLDR APIs:
@@ -296,6 +310,9 @@ def extract_units_from_project(project_path: str, lang: str = "python", respect_
         project_path: Path to project root.
         lang: Programming language ("python", "typescript", "go", "rust").
         respect_ignore: If True, respect .tldrignore patterns (default True).
+        progress_callback: Optional callback(file_path, units_count, total_files).
+        max_workers: Worker processes for extraction (default TLDR_MAX_WORKERS
+            or the CPU count); 1 extracts in this process.
 
     Returns:
         List of EmbeddingUnit objects with enriched metadata.
@@ -345,9 +362,16 @@ def extract_units_from_project(project_path: str, lang: str = "python", respect_
         calls_map = {}
         called_by_map = {}
 
+    # Units only come from a file's functions and classes, so files with
+    # neither are dropped here instead of being read and parsed for nothing
+    all_files = structure.get("files", [])
+    files = [f for f in all_files if f.get("functions") or f.get("classes")]
+    if len(files) < len(all_files):
+        logger.debug(f"Skipping {len(all_files) - len(files)} files without functions or classes")
+
     # Process files in parallel for better performance
-    files = structure.get("files", [])
-    max_workers = int(os.environ.get("TLDR_MAX_WORKERS", os.cpu_count() or 4))
+    if max_workers is None:
+        max_workers = int(os.environ.get("TLDR_MAX_WORKERS", os.cpu_count() or 4))
 
     # Use parallel processing if we have multiple files
     if len(files) > 1 and max_workers > 1:
@@ -936,6 +960,7 @@ def build_semantic_index(
     model: Optional[str] = None,
     show_progress: bool = True,
     respect_ignore: bool = True,
+    max_workers: Optional[int] = None,
 ) -> int:
     """Build and save FAISS index + metadata for a project.
 
@@ -949,6 +974,8 @@ def build_semantic_index(
         model: Model name from SUPPORTED_MODELS or HuggingFace name.
         show_progress: Show progress spinner (default: True).
         respect_ignore: If True, respect .tldrignore patterns (default True).
+        max_workers: Worker processes for unit extraction; see
+            extract_units_from_project.
 
     Returns:
         Number of indexed units.
@@ -982,25 +1009,44 @@ def build_semantic_index(
     # Extract all units (respecting .tldrignore) - scan from scan_path, not project_root
     if console:
         with console.status("[bold green]Extracting code units...") as status:
+            # The callback only records the latest file; a ticker thread puts
+            # it on screen ten times a second, so extraction doesn't format
+            # and render a status line for every file
+            latest = {}
+            done = threading.Event()
+
             def update_progress(file_path, units_count, total_files):
-                short_path = file_path if len(file_path) < 50 else "..." + file_path[-47:]
-                status.update(f"[bold green]Processing {short_path}... ({units_count} units)")
-
-            if lang == "all":
-                status.update("[bold green]Scanning project languages...")
-                target_languages = _detect_project_languages(scan_path, respect_ignore=respect_ignore)
-                if not target_languages:
-                    console.print("[yellow]No supported languages detected in project[/yellow]")
-                    return 0
-                if console:
-                    console.print(f"[dim]Detected languages: {', '.join(target_languages)}[/dim]")
-
-                units = []
-                for lang_name in target_languages:
-                    status.update(f"[bold green]Extracting {lang_name} code units...")
-                    units.extend(extract_units_from_project(str(scan_path), lang=lang_name, respect_ignore=respect_ignore, progress_callback=update_progress))
-            else:
-                units = extract_units_from_project(str(scan_path), lang=lang, respect_ignore=respect_ignore, progress_callback=update_progress)
+                latest["file"] = (file_path, units_count)
+
+            def _tick():
+                while not done.wait(0.1):
+                    current = latest.pop("file", None)
+                    if current is not None:
+                        file_path, units_count = current
+                        short_path = file_path if len(file_path) < 50 else "..." + file_path[-47:]
+                        status.update(f"[bold green]Processing {short_path}... ({units_count} units)")
+
+            ticker = threading.Thread(target=_tick, daemon=True)
+            ticker.start()
+            try:
+                if lang == "all":
+                    status.update("[bold green]Scanning project languages...")
+                    target_languages = _detect_project_languages(scan_path, respect_ignore=respect_ignore)
+                    if not target_languages:
+                        console.print("[yellow]No supported languages detected in project[/yellow]")
+                        return 0
+                    if console:
+                        console.print(f"[dim]Detected languages: {', '.join(target_languages)}[/dim]")
+
+                    units = []
+                    for lang_name in target_languages:
+                        status.update(f"[bold green]Extracting {lang_name} code units...")
+                        units.extend(extract_units_from_project(str(scan_path), lang=lang_name, respect_ignore=respect_ignore, progress_callback=update_progress, max_workers=max_workers))
+                else:
+                    units = extract_units_from_project(str(scan_path), lang=lang, respect_ignore=respect_ignore, progress_callback=update_progress, max_workers=max_workers)
+            finally:
+                done.set()
+                ticker.join()
             status.update(f"[bold green]Extracted {len(units)} code units")
     else:
         if lang == "all":
@@ -1009,9 +1055,9 @@ def build_semantic_index(
                 return 0
             units = []
             for lang_name in target_languages:
-                units.extend(extract_units_from_project(str(scan_path), lang=lang_name, respect_ignore=respect_ignore))
+                units.extend(extract_units_from_project(str(scan_path), lang=lang_name, respect_ignore=respect_ignore, max_workers=max_workers))
         else:
-            units = extract_units_from_project(str(scan_path), lang=lang, respect_ignore=respect_ignore)
+            units = extract_units_from_project(str(scan_path), lang=lang, respect_ignore=respect_ignore, max_workers=max_workers)
 
     if not units:
         return 0
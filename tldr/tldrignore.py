@@ -6,6 +6,7 @@ Uses pathspec library for gitignore-compatible pattern matching.
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -101,9 +102,18 @@ Thumbs.db
 """
 
 
+# Compiled specs by absolute .tldrignore path, as ((mtime_ns, size), spec).
+# The key is None for a project without the file, which gets the defaults.
+_spec_cache: dict[str, tuple[tuple[int, int] | None, "PathSpec"]] = {}
+
+
 def load_ignore_patterns(project_dir: str | Path) -> "PathSpec":
     """Load ignore patterns from .tldrignore file.
 
+    The compiled spec is cached per project and reused until the file's
+    mtime or size changes, so repeated scans of a project don't re-read
+    and re-compile the patterns. Callers must not modify the returned spec.
+
     Args:
         project_dir: Root directory of the project
 
@@ -115,16 +125,29 @@ def load_ignore_patterns(project_dir: str | Path) -> "PathSpec":
     project_path = Path(project_dir)
     tldrignore_path = project_path / ".tldrignore"
 
+    try:
+        st = tldrignore_path.stat()
+        key = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        key = None
+
+    cache_key = os.path.abspath(tldrignore_path)
+    cached = _spec_cache.get(cache_key)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
     patterns: list[str] = []
 
-    if tldrignore_path.exists():
+    if key is not None:
         content = tldrignore_path.read_text()
         patterns: list[str] = content.splitlines()
     else:
         # Use defaults if no .tldrignore exists
         patterns = list(DEFAULT_TEMPLATE.splitlines())
 
-    return pathspec.PathSpec.from_lines("gitwildmatch", patterns)
+    spec = pathspec.PathSpec.from_lines("gitwildmatch", patterns)
+    _spec_cache[cache_key] = (key, spec)
+    return spec
 
 
 def ensure_tldrignore(project_dir: str | Path) -> tuple[bool, str]:
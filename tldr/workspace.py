@@ -9,10 +9,13 @@ Provides:
 """
 
 import fnmatch
+import functools
 import json
+import os
+import re
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Union
+from typing import List, Optional, Pattern, Tuple, Union
 
 
 # Default exclude patterns for common non-source directories
@@ -99,10 +102,47 @@ def _normalize_path(path: str) -> str:
     return path
 
 
+@functools.lru_cache(maxsize=32)
+def _compile_patterns(patterns: Tuple[str, ...]) -> Tuple[Optional[Pattern], Optional[Pattern]]:
+    """
+    Compile glob patterns into two alternation regexes.
+
+    The first matches what fnmatch.fnmatch would for any of the patterns and
+    is applied to the os.path.normcase()d path, as fnmatch does. The second
+    covers the directory names of ** patterns, matched literally: a path
+    equal to the name, starting with "name/" or containing "/name/".
+    Either is None if there is nothing for it to match.
+    """
+    globs = []
+    dir_names = []
+    for pattern in patterns:
+        globs.append(fnmatch.translate(os.path.normcase(pattern)))
+
+        # fnmatch doesn't handle ** properly for directory matching, so the
+        # literal parts of a ** pattern are also matched as directory names
+        # e.g., **/node_modules/** -> node_modules
+        if "**" in pattern:
+            for part in pattern.split("/"):
+                if part and part != "**" and part != "*":
+                    dir_name = part.rstrip("*")
+                    if dir_name:
+                        dir_names.append(re.escape(dir_name))
+
+    glob_re = re.compile("|".join(f"(?:{g})" for g in globs)) if globs else None
+    dir_re = None
+    if dir_names:
+        names = "|".join(dict.fromkeys(dir_names))
+        dir_re = re.compile(f"(?s:(?:{names})(?:/.*)?|.*/(?:{names})/.*)\\Z")
+    return glob_re, dir_re
+
+
 def _matches_any_pattern(path: str, patterns: List[str]) -> bool:
     """
     Check if path matches any of the glob patterns.
 
+    The patterns are compiled once per distinct list, so each path costs two
+    regex matches however many patterns there are.
+
     Args:
         path: Path to check (should be normalized)
         patterns: List of glob patterns
@@ -110,36 +150,10 @@ def _matches_any_pattern(path: str, patterns: List[str]) -> bool:
     Returns:
         True if path matches any pattern
     """
-    for pattern in patterns:
-        # fnmatch doesn't handle ** properly for directory matching
-        # We need to check if any part of the path matches
-        if fnmatch.fnmatch(path, pattern):
-            return True
-
-        # Handle ** patterns by extracting the directory name to match
-        if "**" in pattern:
-            # Pattern like **/dirname/** or **/dirname/*
-            # Extract the directory name between ** markers
-            # e.g., **/node_modules/** -> node_modules
-            # e.g., **/generated/** -> generated
-            parts = pattern.split("/")
-            for part in parts:
-                if part and part != "**" and part != "*":
-                    # This is a literal directory name to match
-                    dir_name = part.rstrip("*")
-                    if dir_name:
-                        # Check if this directory name appears in the path
-                        # Either at start: dirname/...
-                        # Or in middle: .../dirname/...
-                        if path.startswith(f"{dir_name}/"):
-                            return True
-                        if f"/{dir_name}/" in path:
-                            return True
-                        # Also match if path equals the directory
-                        if path == dir_name:
-                            return True
-
-    return False
+    glob_re, dir_re = _compile_patterns(tuple(patterns))
+    if glob_re is not None and glob_re.match(os.path.normcase(path)):
+        return True
+    return dir_re is not None and dir_re.match(path) is not None
 
 
 def _is_under_active_package(path: str, active_packages: List[str]) -> bool: